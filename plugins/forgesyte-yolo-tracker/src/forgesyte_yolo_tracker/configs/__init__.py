@@ -1,5 +1,7 @@
 """Configs module for YOLO Tracker."""
 
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -51,17 +53,19 @@ def load_model_config(config_path: Path = MODEL_CONFIG_PATH) -> Dict[str, Any]:
         FileNotFoundError: If config file doesn't exist and no default.
         yaml.YAMLError: If config file is invalid YAML.
     """
+    # Deep copies: merging below updates the nested dicts in place, and
+    # must never write through to DEFAULT_MODEL_CONFIG
     if not config_path.exists():
-        return DEFAULT_MODEL_CONFIG.copy()
+        return copy.deepcopy(DEFAULT_MODEL_CONFIG)
 
     with open(config_path, "r") as f:
         config = yaml.safe_load(f)
 
     if config is None:
-        return DEFAULT_MODEL_CONFIG.copy()
+        return copy.deepcopy(DEFAULT_MODEL_CONFIG)
 
     # Merge with defaults to ensure all keys exist
-    merged = DEFAULT_MODEL_CONFIG.copy()
+    merged = copy.deepcopy(DEFAULT_MODEL_CONFIG)
     if "models" in config:
         merged["models"].update(config["models"])
     if "confidence" in config:
@@ -74,6 +78,16 @@ def load_model_config(config_path: Path = MODEL_CONFIG_PATH) -> Dict[str, Any]:
     return merged
 
 
+@lru_cache(maxsize=1)
+def _model_config() -> Dict[str, Any]:
+    """Get the process-wide model config, parsed from models.yaml once.
+
+    The getters below are called per model load and per video request;
+    callers must treat the returned dict as read-only.
+    """
+    return load_model_config()
+
+
 def get_model_path(model_key: str) -> str:
     """Get model file name for the specified task.
 
@@ -86,8 +100,7 @@ def get_model_path(model_key: str) -> str:
     Raises:
         KeyError: If model_key is not found in config.
     """
-    config = load_model_config()
-    return config["models"][model_key]
+    return _model_config()["models"][model_key]
 
 
 def get_confidence(task: str) -> float:
@@ -102,8 +115,7 @@ def get_confidence(task: str) -> float:
     Raises:
         KeyError: If task is not found in config.
     """
-    config = load_model_config()
-    return config["confidence"][task]
+    return _model_config()["confidence"][task]
 
 
 def get_default_detections() -> list:
@@ -112,8 +124,7 @@ def get_default_detections() -> list:
     Returns:
         List of detection types to run (e.g., ['players', 'pitch']).
     """
-    config = load_model_config()
-    detections_config = config.get(
+    detections_config = _model_config().get(
         "default_detections",
         {"players": True, "ball": True, "pitch": True},
     )
@@ -4,7 +4,54 @@ Provides pitch geometry, keypoint names, and coordinate transforms
 for radar mapping and pitch detection.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+_WIDTH_CM = 7000
+_LENGTH_CM = 12000
+
+_VERTICES = np.array(
+    [
+        (0, _WIDTH_CM / 2),  # 0: left goal center
+        (0, 0),  # 1: bottom left corner
+        (0, _WIDTH_CM),  # 2: top left corner
+        (_LENGTH_CM / 2, 0),  # 3: bottom center line
+        (_LENGTH_CM / 2, _WIDTH_CM),  # 4: top center line
+        (_LENGTH_CM, 0),  # 5: bottom right corner
+        (_LENGTH_CM, _WIDTH_CM),  # 6: top right corner
+        (_LENGTH_CM, _WIDTH_CM / 2),  # 7: right goal center
+        (_LENGTH_CM * 0.11, 0),  # 8: left penalty area bottom
+        (_LENGTH_CM * 0.11, _WIDTH_CM),  # 9: left penalty area top
+        (_LENGTH_CM * 0.39, 0),  # 10: left penalty spot
+        (_LENGTH_CM * 0.61, 0),  # 11: right penalty spot
+        (_LENGTH_CM * 0.89, 0),  # 12: right penalty area bottom
+        (_LENGTH_CM * 0.89, _WIDTH_CM),  # 13: right penalty area top
+    ],
+    dtype=np.float32,
+)
+_VERTICES.flags.writeable = False
+
+_EDGES = np.array(
+    [
+        (1, 2),  # left touchline
+        (0, 2),  # left goal line (partial)
+        (3, 4),  # center line
+        (5, 6),  # right touchline
+        (0, 7),  # right goal line (partial)
+        (1, 3),  # bottom left penalty area
+        (3, 5),  # bottom penalty area line
+        (2, 4),  # top left penalty area
+        (4, 6),  # top penalty area line
+        (10, 8),  # left penalty box
+        (10, 9),  # left penalty area
+        (11, 12),  # right penalty box
+        (11, 13),  # right penalty area
+    ],
+    dtype=np.int32,
+)
+_EDGES.flags.writeable = False
 
 
 class SoccerPitchConfiguration:
@@ -14,6 +61,19 @@ class SoccerPitchConfiguration:
     Provides vertices for keypoints and edges connecting them.
     """
 
+    vertices: np.ndarray = _VERTICES
+    """Pitch keypoint vertices as an (N, 2) float32 array of (x, y) centimeters.
+
+    Order matches Roboflow pitch detection model output. Keypoints include:
+    goal posts, penalty spots, corner arcs, etc. Shared and read-only.
+    """
+
+    edges: np.ndarray = _EDGES
+    """Edges connecting keypoints for drawing the pitch outline.
+
+    An (M, 2) int32 array of (from_index, to_index) rows. Shared and read-only.
+    """
+
     def __init__(self) -> None:
         """Initialize pitch configuration.
 
@@ -21,8 +81,8 @@ class SoccerPitchConfiguration:
         - Length: 12000 cm (120 meters)
         - Width: 7000 cm (70 meters)
         """
-        self._width_cm = 7000
-        self._length_cm = 12000
+        self._width_cm = _WIDTH_CM
+        self._length_cm = _LENGTH_CM
 
     @property
     def width(self) -> int:
@@ -34,55 +94,6 @@ class SoccerPitchConfiguration:
         """Pitch length in centimeters."""
         return self._length_cm
 
-    @property
-    def vertices(self) -> List[Tuple[float, float]]:
-        """List of pitch keypoint vertices in (x, y) centimeters.
-
-        Order matches Roboflow pitch detection model output.
-        Keypoints include: goal posts, penalty spots, corner arcs, etc.
-        """
-        width = self._width_cm
-        length = self._length_cm
-
-        return [
-            (0, width / 2),  # 0: left goal center
-            (0, 0),  # 1: bottom left corner
-            (0, width),  # 2: top left corner
-            (length / 2, 0),  # 3: bottom center line
-            (length / 2, width),  # 4: top center line
-            (length, 0),  # 5: bottom right corner
-            (length, width),  # 6: top right corner
-            (length, width / 2),  # 7: right goal center
-            (length * 0.11, 0),  # 8: left penalty area bottom
-            (length * 0.11, width),  # 9: left penalty area top
-            (length * 0.39, 0),  # 10: left penalty spot
-            (length * 0.61, 0),  # 11: right penalty spot
-            (length * 0.89, 0),  # 12: right penalty area bottom
-            (length * 0.89, width),  # 13: right penalty area top
-        ]
-
-    @property
-    def edges(self) -> List[Tuple[int, int]]:
-        """List of edges connecting keypoints for drawing pitch outline.
-
-        Each edge is a tuple of (from_index, to_index).
-        """
-        return [
-            (1, 2),  # left touchline
-            (0, 2),  # left goal line (partial)
-            (3, 4),  # center line
-            (5, 6),  # right touchline
-            (0, 7),  # right goal line (partial)
-            (1, 3),  # bottom left penalty area
-            (3, 5),  # bottom penalty area line
-            (2, 4),  # top left penalty area
-            (4, 6),  # top penalty area line
-            (10, 8),  # left penalty box
-            (10, 9),  # left penalty area
-            (11, 12),  # right penalty box
-            (11, 13),  # right penalty area
-        ]
-
     @property
     def keypoint_names(self) -> Dict[int, str]:
         """Map keypoint indices to human-readable names."""
@@ -130,6 +141,26 @@ class SoccerPitchConfiguration:
 
         return (radar_x, radar_y)
 
+    def world_to_radar_batch(
+        self, xs: np.ndarray, ys: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized world_to_radar for arrays of coordinates.
+
+        Args:
+            xs: X coordinates in centimeters
+            ys: Y coordinates in centimeters
+
+        Returns:
+            Tuple of (radar_x, radar_y) integer pixel arrays, truncated toward
+            zero like world_to_radar
+        """
+        radar_w, radar_h = self.radar_resolution
+
+        radar_x = (np.asarray(xs) / self._length_cm) * radar_w
+        radar_y = (1 - np.asarray(ys) / self._width_cm) * radar_h
+
+        return radar_x.astype(np.int64), radar_y.astype(np.int64)
+
     def get_keypoint_by_name(self, name: str) -> Tuple[float, float]:
         """Get keypoint coordinates by name.
 
@@ -144,5 +175,6 @@ class SoccerPitchConfiguration:
         """
         for idx, keypoint_name in self.keypoint_names.items():
             if keypoint_name == name:
-                return self.vertices[idx]
+                x, y = self.vertices[idx].tolist()
+                return (x, y)
         raise ValueError(f"Unknown keypoint name: {name}")
@@ -10,26 +10,197 @@ across player, ball, and pitch detectors. All detectors share common functionali
 Detectors inherit from BaseDetector and provide detector-specific configuration.
 """
 
-import base64
 import logging
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
-import cv2
 import numpy as np
 import supervision as sv
 
+from forgesyte_yolo_tracker.utils.jpeg import encode_jpeg_base64
+
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
 
+def load_yolo_model(model_path: str, device: str = "cpu") -> Any:
+    """Load a YOLO model for inference on the given device.
+
+    Prebuilt exports next to the weights (same name, different suffix) are
+    preferred over the PyTorch checkpoint: a TensorRT ``.engine`` on CUDA
+    (see BaseDetector.export_engine) and an ONNX Runtime ``.onnx`` on CPU
+    (see BaseDetector.export_onnx). Otherwise the ``.pt`` weights are used.
+
+    Args:
+        model_path: Path to the ``.pt`` weights
+        device: Device to run model on ('cpu' or 'cuda')
+
+    Returns:
+        YOLO model instance
+    """
+    from ultralytics import YOLO
+
+    if str(device).startswith("cuda"):
+        import torch
+
+        # Input shape is fixed per model (letterboxed to imgsz), so cuDNN
+        # can autotune convolution kernels once and reuse them.
+        torch.backends.cudnn.benchmark = True
+
+        engine_path = Path(model_path).with_suffix(".engine")
+        if engine_path.exists():
+            logger.info(f"⚡ Using TensorRT engine: {engine_path}")
+            # Engines are built for a specific GPU; they are not moved with .to()
+            return YOLO(str(engine_path))
+    else:
+        onnx_path = Path(model_path).with_suffix(".onnx")
+        if onnx_path.exists():
+            logger.info(f"⚡ Using ONNX model: {onnx_path}")
+            return YOLO(str(onnx_path))
+
+    return YOLO(model_path).to(device=device)
+
+
+# Process-wide model cache keyed by (model path, device, half): modules that
+# run the same checkpoint (player detection, tracking, radar) share one loaded
+# copy of the weights per device and precision.
+_MODELS: Dict[Tuple[str, str, bool], Any] = {}
+_MODELS_LOCK = threading.Lock()
+
+# Idle instances for checkout_model, keyed like _MODELS. Ultralytics
+# predictors are not thread-safe, so a video stream holds its instance
+# exclusively until it finishes; concurrent streams load extra instances and
+# later streams reuse whichever ones have been returned.
+_IDLE_MODELS: Dict[Tuple[str, str, bool], List[Any]] = {}
+
+
+def _load_model(model_path: str, device: str, half: bool) -> Any:
+    """Load a model and convert its PyTorch weights to FP16 when requested."""
+    model = load_yolo_model(model_path, device=device)
+    if half and hasattr(model.model, "half"):
+        model.model.half()
+    return model
+
+
+def get_cached_model(model_path: str, device: str = "cpu", half: bool = False) -> Any:
+    """Get or load the shared YOLO model for (model_path, device, half).
+
+    Ultralytics fixes a predictor's precision the first time it runs, so
+    FP16 and FP32 callers get separate instances rather than whichever
+    precision happened to run first. The FP16 instance's PyTorch weights
+    are converted with ``.half()`` when it is loaded; exported engines
+    keep the precision they were built with.
+
+    Args:
+        model_path: Path to the model weights
+        device: Device to run model on ('cpu' or 'cuda')
+        half: Whether the caller runs the model in FP16
+
+    Returns:
+        YOLO model instance
+    """
+    key = (model_path, device, half)
+    with _MODELS_LOCK:
+        model = _MODELS.get(key)
+        if model is None:
+            model = _load_model(model_path, device, half)
+            _MODELS[key] = model
+    return model
+
+
+@contextmanager
+def checkout_model(model_path: str, device: str = "cpu", half: bool = False) -> Iterator[Any]:
+    """Borrow a YOLO model for (model_path, device, half) for one video stream.
+
+    The instance is used by nobody else until the block exits, after which
+    it goes back to the pool for the next stream. Only streams running at
+    the same time load their own copies of the weights.
+
+    Args:
+        model_path: Path to the model weights
+        device: Device to run model on ('cpu' or 'cuda')
+        half: Whether the caller runs the model in FP16
+
+    Yields:
+        YOLO model instance
+    """
+    key = (model_path, device, half)
+    with _MODELS_LOCK:
+        idle = _IDLE_MODELS.get(key)
+        model = idle.pop() if idle else None
+    if model is None:
+        # Loading outside the lock keeps other streams and image requests moving
+        model = _load_model(model_path, device, half)
+    try:
+        yield model
+    finally:
+        with _MODELS_LOCK:
+            _IDLE_MODELS.setdefault(key, []).append(model)
+
+
+def clear_model_cache() -> None:
+    """Drop all shared cached models and idle pooled models."""
+    with _MODELS_LOCK:
+        _MODELS.clear()
+        _IDLE_MODELS.clear()
+
+
+# Largest batch any pipeline sends in one model call (ball_detection_video's
+# DEFAULT_BATCH_SIZE). TensorRT engines are built to accept at least this
+# many frames, and detect_json_batch splits longer inputs to match.
+ENGINE_MAX_BATCH = 8
+
+
+def use_half_precision(device: str) -> bool:
+    """Whether YOLO inference on this device should run in FP16.
+
+    Half precision halves activation bandwidth and uses tensor cores on
+    CUDA; CPUs have no fast FP16 path, so they stay in FP32.
+
+    Args:
+        device: Device the model runs on ('cpu' or 'cuda')
+
+    Returns:
+        True for CUDA devices
+    """
+    return str(device).startswith("cuda")
+
+
+@lru_cache(maxsize=256)
+def hex_to_color(hex_color: str) -> sv.Color:
+    """Parse a '#RRGGBB' (or '#RGB') hex string into a supervision Color.
+
+    Parses the whole 24-bit value once and splits channels with shifts.
+    Cached because the same palette entries are looked up on every frame.
+
+    Args:
+        hex_color: Hex color string, with or without leading '#'
+
+    Returns:
+        Corresponding sv.Color
+
+    Raises:
+        ValueError: If hex_color is not a valid 3- or 6-digit hex color
+    """
+    digits = hex_color.lstrip("#")
+    if len(digits) == 3:
+        digits = "".join(c * 2 for c in digits)
+    if len(digits) != 6:
+        raise ValueError(f"Invalid hex color: {hex_color!r}")
+    value = int(digits, 16)
+    return sv.Color(r=value >> 16 & 0xFF, g=value >> 8 & 0xFF, b=value & 0xFF)
+
+
 class BaseDetector:
     """Generic detection base class for YOLO-based inference.
 
     This class provides shared functionality for all detectors:
-    - Model loading and caching per detector instance
+    - Model loading through the shared model cache
     - Frame encoding to base64 JPEG
     - YOLO inference execution
     - Result formatting and annotation
@@ -74,7 +245,10 @@ class BaseDetector:
         self.imgsz: int = imgsz
         self.class_names: Optional[Dict[int, str]] = class_names
         self.colors: Optional[Dict[int, str]] = colors
-        self._model: Optional[Any] = None  # YOLO type
+        # Palette parsed once; annotation only does dict lookups per detection
+        self._class_colors: Dict[int, sv.Color] = {
+            class_id: hex_to_color(hex_color) for class_id, hex_color in (colors or {}).items()
+        }
 
         # Compute model path
         model_dir = Path(__file__).parent.parent / "models"
@@ -89,7 +263,10 @@ class BaseDetector:
     def get_model(self, device: str = "cpu") -> Any:
         """Get or create cached YOLO model.
 
-        Model is cached per detector instance to avoid reloading.
+        Models live in the shared get_cached_model() cache, one per device,
+        so clear_model_cache() also drops this detector's models and the
+        detector never holds a different copy than the modules it shares
+        weights with.
         Logs model loading info and warns if model is a stub (< 1KB).
 
         Args:
@@ -101,11 +278,11 @@ class BaseDetector:
         Raises:
             FileNotFoundError: If model file does not exist
         """
-        from ultralytics import YOLO
-
-        if self._model is not None:
-            logger.debug(f"🎯 Using cached {self.detector_name} model")
-            return self._model
+        with _MODELS_LOCK:
+            model = _MODELS.get((self.model_path, device, False))
+        if model is not None:
+            logger.debug(f"🎯 Using cached {self.detector_name} model on {device}")
+            return model
 
         logger.info(f"📦 Loading {self.detector_name} model from: {self.model_path}")
 
@@ -121,10 +298,89 @@ class BaseDetector:
                 f"⚠️  Model is a stub ({model_size_kb:.2f} KB)! " "Replace with real model."
             )
 
-        self._model = YOLO(self.model_path).to(device=device)
+        model = get_cached_model(self.model_path, device=device)
         logger.info(f"✅ Model loaded successfully on device: {device}")
 
-        return self._model
+        return model
+
+    def warmup(self, device: str = "cpu") -> None:
+        """Load the model and run one dummy inference.
+
+        The first YOLO call pays for predictor setup, layer fusing and (on
+        CUDA) kernel selection. Running it once at plugin load keeps that
+        cost out of the first real request.
+
+        Args:
+            device: Device to run model on ('cpu' or 'cuda')
+
+        Raises:
+            FileNotFoundError: If model file does not exist
+        """
+        model = self.get_model(device=device)
+        dummy = np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8)
+
+        logger.info(f"🔥 Warming up {self.detector_name} model on {device}")
+        model(dummy, imgsz=self.imgsz, conf=self.default_confidence, verbose=False)
+        logger.info(f"🔥 {self.detector_name} model warm")
+
+    def export_engine(self, half: bool = True, batch: int = ENGINE_MAX_BATCH) -> str:
+        """Export this detector's weights to a dynamic-batch TensorRT engine.
+
+        The engine is written next to the ``.pt`` file and picked up by
+        load_yolo_model() on CUDA from then on. Requires a CUDA GPU and
+        TensorRT; building takes minutes, so run it once per deployment, not
+        per request.
+
+        Args:
+            half: Build an FP16 engine (default True)
+            batch: Largest batch the engine accepts (default ENGINE_MAX_BATCH)
+
+        Returns:
+            Path to the exported ``.engine`` file
+
+        Raises:
+            ValueError: If batch is below ENGINE_MAX_BATCH; the batched video
+                pipelines would then send inputs the engine rejects
+        """
+        if batch < ENGINE_MAX_BATCH:
+            raise ValueError(
+                f"batch must be at least {ENGINE_MAX_BATCH} so every pipeline's "
+                f"batches fit the engine, got {batch}"
+            )
+
+        from ultralytics import YOLO
+
+        logger.info(
+            f"⚡ Exporting {self.detector_name} model to TensorRT (half={half}, batch={batch})"
+        )
+        engine_path = YOLO(self.model_path).export(
+            format="engine",
+            imgsz=self.imgsz,
+            half=half,
+            dynamic=True,
+            batch=batch,
+            device=0,
+        )
+        logger.info(f"⚡ TensorRT engine written: {engine_path}")
+        return str(engine_path)
+
+    def export_onnx(self) -> str:
+        """Export this detector's weights to ONNX for CPU inference.
+
+        The model is written next to the ``.pt`` file with a dynamic batch
+        axis and picked up by load_yolo_model() on CPU from then on, where
+        ONNX Runtime replaces the PyTorch predict path. Requires ``onnx`` and
+        ``onnxruntime``.
+
+        Returns:
+            Path to the exported ``.onnx`` file
+        """
+        from ultralytics import YOLO
+
+        logger.info(f"⚡ Exporting {self.detector_name} model to ONNX")
+        onnx_path = YOLO(self.model_path).export(format="onnx", imgsz=self.imgsz, dynamic=True)
+        logger.info(f"⚡ ONNX model written: {onnx_path}")
+        return str(onnx_path)
 
     def _encode_frame_to_base64(self, frame: np.ndarray[Any, np.dtype[Any]]) -> str:
         """Encode frame to base64 JPEG string.
@@ -141,12 +397,7 @@ class BaseDetector:
         Raises:
             ValueError: If frame encoding fails
         """
-        success, buffer = cv2.imencode(".jpg", frame)
-        if not success:
-            raise ValueError("Failed to encode frame to JPEG")
-
-        encoded = base64.b64encode(bytes(buffer)).decode("utf-8")
-        return encoded
+        return encode_jpeg_base64(frame)
 
     def detect_json(
         self,
@@ -176,6 +427,63 @@ class BaseDetector:
         if confidence is None:
             confidence = self.default_confidence
 
+        detections = self._detect(frame, device=device, confidence=confidence)
+        return self._build_result(detections)
+
+    def detect_json_batch(
+        self,
+        frames: List[np.ndarray[Any, np.dtype[Any]]],
+        device: str = "cpu",
+        confidence: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Run detection inference on several frames in one model call.
+
+        Ultralytics letterboxes the frames and stacks them into a single
+        (N, 3, imgsz, imgsz) batch, so the model runs once instead of N times.
+        Inputs longer than ENGINE_MAX_BATCH are split into several calls so
+        they fit an exported TensorRT engine.
+
+        Args:
+            frames: List of input image frames (BGR format, numpy arrays)
+            device: Device to run model on ('cpu' or 'cuda')
+            confidence: Detection confidence threshold (uses default if None)
+
+        Returns:
+            One result dict per frame, in input order, each shaped like the
+            return value of detect_json()
+        """
+        if confidence is None:
+            confidence = self.default_confidence
+
+        if not frames:
+            return []
+
+        model = self.get_model(device=device)
+
+        logger.info(f"🔫 Running batched YOLO inference on {len(frames)} frames...")
+        output: List[Dict[str, Any]] = []
+        for start in range(0, len(frames), ENGINE_MAX_BATCH):
+            chunk = list(frames[start : start + ENGINE_MAX_BATCH])
+            results = model(chunk, imgsz=self.imgsz, conf=confidence, verbose=False)
+            output.extend(self._build_result(sv.Detections.from_ultralytics(r)) for r in results)
+        return output
+
+    def _detect(
+        self,
+        frame: np.ndarray[Any, np.dtype[Any]],
+        device: str,
+        confidence: float,
+    ) -> sv.Detections:
+        """Run YOLO inference once and wrap the result as Detections.
+
+        Args:
+            frame: Input image frame (BGR format, numpy array)
+            device: Device to run model on ('cpu' or 'cuda')
+            confidence: Detection confidence threshold
+
+        Returns:
+            Supervision Detections object
+        """
         logger.info(
             f"🎬 Starting {self.detector_name} detection "
             f"(device={device}, confidence={confidence})"
@@ -191,6 +499,20 @@ class BaseDetector:
         detections = sv.Detections.from_ultralytics(result)
         logger.info(f"📊 Found {len(detections)} detections")
 
+        return detections
+
+    def _build_result(self, detections: sv.Detections) -> Dict[str, Any]:
+        """Convert supervision detections into the JSON result dict.
+
+        Each detection array is converted to Python scalars with a single
+        ``tolist()`` call rather than indexing and casting element by element.
+
+        Args:
+            detections: Supervision Detections object
+
+        Returns:
+            Dictionary with detections, count and (optionally) classes
+        """
         detection_list: List[Dict[str, Any]] = []
         class_counts: Dict[str, int] = {}
 
@@ -198,31 +520,30 @@ class BaseDetector:
         if self.class_names:
             class_counts = {name: 0 for name in self.class_names.values()}
 
-        for i in range(len(detections)):
-            xyxy_arr = detections.xyxy
-            conf_arr = detections.confidence
-            cls_arr = detections.class_id
-            if xyxy_arr is None or conf_arr is None or cls_arr is None:
-                continue
-            xyxy = xyxy_arr[i]
-            conf = float(conf_arr[i])
-            cls = int(cls_arr[i])
-
-            detection_dict: Dict[str, Any] = {
-                "xyxy": xyxy.tolist(),
-                "confidence": conf,
-                "class_id": cls,
-            }
-
-            # Add class name if class_names provided
-            if self.class_names:
-                class_name = self.class_names.get(cls, f"class_{cls}")
-                detection_dict["class_name"] = class_name
-
-                if class_name in class_counts:
-                    class_counts[class_name] += 1
-
-            detection_list.append(detection_dict)
+        xyxy_arr = detections.xyxy
+        conf_arr = detections.confidence
+        cls_arr = detections.class_id
+        if len(detections) > 0 and not (xyxy_arr is None or conf_arr is None or cls_arr is None):
+            for xyxy, conf, cls in zip(
+                xyxy_arr.tolist(),
+                conf_arr.astype(float).tolist(),
+                cls_arr.astype(int).tolist(),
+            ):
+                detection_dict: Dict[str, Any] = {
+                    "xyxy": xyxy,
+                    "confidence": conf,
+                    "class_id": cls,
+                }
+
+                # Add class name if class_names provided
+                if self.class_names:
+                    class_name = self.class_names.get(cls, f"class_{cls}")
+                    detection_dict["class_name"] = class_name
+
+                    if class_name in class_counts:
+                        class_counts[class_name] += 1
+
+                detection_list.append(detection_dict)
 
         logger.info(f"✅ Detection complete: {len(detection_list)} objects found")
         if self.class_names:
@@ -246,8 +567,8 @@ class BaseDetector:
     ) -> Dict[str, Any]:
         """Run detection inference - JSON + base64 annotated frame.
 
-        Executes YOLO inference, creates annotated frame with boxes and labels,
-        then encodes to base64. Returns all detection data plus annotated frame.
+        Executes YOLO inference once, builds the JSON result and the annotated
+        frame from the same detections, then encodes the frame to base64.
 
         Args:
             frame: Input image frame (BGR format, numpy array)
@@ -267,20 +588,18 @@ class BaseDetector:
         if confidence is None:
             confidence = self.default_confidence
 
-        # Get detection results
-        result_dict = self.detect_json(frame, device=device, confidence=confidence)
-
-        # Create annotated frame
-        model = self.get_model(device=device)
-        detection_result = model(frame, imgsz=self.imgsz, conf=confidence, verbose=False)[0]
-        detections = sv.Detections.from_ultralytics(detection_result)
+        # Single inference pass shared by the JSON result and the annotation
+        detections = self._detect(frame, device=device, confidence=confidence)
+        result_dict = self._build_result(detections)
 
         # Build labels if class_names provided
         labels: Optional[List[str]] = None
         if self.class_names:
             cls_arr = detections.class_id
             if cls_arr is not None:
-                labels = [self.class_names.get(int(cls), f"class_{cls}") for cls in cls_arr]
+                labels = [
+                    self.class_names.get(cls, f"class_{cls}") for cls in cls_arr.tolist()
+                ]
 
         # Annotate frame
         annotated = self._annotate_frame(frame, detections, labels)
@@ -318,8 +637,9 @@ class BaseDetector:
         if self.colors:
             cls_arr = detections.class_id
             if cls_arr is not None:
-                color_list = [self.colors.get(int(cls), "#FFFFFF") for cls in cls_arr]
-                colors = sv.ColorPalette.from_hex(color_list)
+                white = hex_to_color("#FFFFFF")
+                color_list = [self._class_colors.get(cls, white) for cls in cls_arr.tolist()]
+                colors = sv.ColorPalette(color_list)
             else:
                 colors = sv.ColorPalette.DEFAULT
         else:
@@ -333,7 +653,7 @@ class BaseDetector:
         if labels:
             label_annotator = sv.LabelAnnotator(
                 color=colors,
-                text_color=sv.Color.from_hex("#FFFFFF"),
+                text_color=hex_to_color("#FFFFFF"),
                 text_padding=5,
                 text_thickness=1,
             )
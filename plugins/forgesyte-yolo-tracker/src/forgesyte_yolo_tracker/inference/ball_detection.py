@@ -3,6 +3,7 @@
 Provides JSON and JSON+Base64 modes for ball detection using BaseDetector:
 - detect_ball_json(): Returns structured detection data
 - detect_ball_json_with_annotated_frame(): Returns data + annotated frame
+- detect_ball_json_batch(): JSON mode for several frames in one model call
 
 This module uses BaseDetector to eliminate code duplication across detectors.
 Ball-specific configuration (single object detection) is applied via wrappers.
@@ -10,7 +11,7 @@ Ball-specific configuration (single object detection) is applied via wrappers.
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
@@ -34,6 +35,18 @@ BALL_DETECTOR = BaseDetector(
 )
 
 
+def _add_primary_ball(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Add ball-specific fields: primary ball (highest confidence) and flag."""
+    primary_ball: Optional[Dict[str, Any]] = None
+    if result["detections"]:
+        primary_ball = max(result["detections"], key=lambda x: x["confidence"])
+
+    result["ball"] = primary_ball
+    result["ball_detected"] = primary_ball is not None
+
+    return result
+
+
 def detect_ball_json(
     frame: np.ndarray[Any, Any],
     device: str = "cpu",
@@ -61,15 +74,7 @@ def detect_ball_json(
 
     result = BALL_DETECTOR.detect_json(frame, device=device, confidence=confidence)
 
-    # Add ball-specific logic: select primary ball (highest confidence)
-    primary_ball: Optional[Dict[str, Any]] = None
-    if result["detections"]:
-        primary_ball = max(result["detections"], key=lambda x: x["confidence"])
-
-    result["ball"] = primary_ball
-    result["ball_detected"] = primary_ball is not None
-
-    return result
+    return _add_primary_ball(result)
 
 
 def detect_ball_json_with_annotated_frame(
@@ -103,15 +108,29 @@ def detect_ball_json_with_annotated_frame(
         frame, device=device, confidence=confidence
     )
 
-    # Add ball-specific logic: select primary ball (highest confidence)
-    primary_ball: Optional[Dict[str, Any]] = None
-    if result["detections"]:
-        primary_ball = max(result["detections"], key=lambda x: x["confidence"])
+    return _add_primary_ball(result)
 
-    result["ball"] = primary_ball
-    result["ball_detected"] = primary_ball is not None
 
-    return result
+def detect_ball_json_batch(
+    frames: List[np.ndarray[Any, Any]],
+    device: str = "cpu",
+    confidence: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Detect ball in several frames - batched JSON mode.
+
+    Args:
+        frames: List of input image frames (BGR format)
+        device: Device to run model on ('cpu' or 'cuda')
+        confidence: Detection confidence threshold (uses default if None)
+
+    Returns:
+        One detect_ball_json()-shaped dictionary per frame, in input order
+    """
+    if confidence is None:
+        confidence = BALL_DETECTOR.default_confidence
+
+    results = BALL_DETECTOR.detect_json_batch(frames, device=device, confidence=confidence)
+    return [_add_primary_ball(result) for result in results]
 
 
 def get_ball_detection_model(device: str = "cpu") -> Any:
@@ -83,11 +83,19 @@ def detect_pitch_json(
                 else None
             )
 
-            for i, (x, y) in enumerate(keypoints_xy):
+            # Convert whole arrays once instead of casting per keypoint
+            xy_list = keypoints_xy.astype(float).tolist()
+            conf_list = (
+                keypoints_conf.astype(float).tolist()
+                if keypoints_conf is not None
+                else [1.0] * len(xy_list)
+            )
+            names = CONFIG.keypoint_names
+            for i, (xy, kp_conf) in enumerate(zip(xy_list, conf_list)):
                 kp: Dict[str, Any] = {
-                    "xy": [float(x), float(y)],
-                    "confidence": (float(keypoints_conf[i]) if keypoints_conf is not None else 1.0),
-                    "name": CONFIG.keypoint_names.get(i, f"keypoint_{i}"),
+                    "xy": xy,
+                    "confidence": kp_conf,
+                    "name": names.get(i, f"keypoint_{i}"),
                 }
                 keypoint_list.append(kp)
 
@@ -111,7 +119,7 @@ def detect_pitch_json(
     homography: Optional[list[list[float]]] = None
     if len(pitch_polygon) >= 4:
         src_pts = np.array([kp["xy"] for kp in valid_keypoints[:4]], dtype=np.float32)
-        tgt_pts = np.array([CONFIG.vertices[i] for i in range(4)], dtype=np.float32)
+        tgt_pts = CONFIG.vertices[:4]
         try:
             m, _ = cv2.findHomography(src_pts, tgt_pts)
             if m is not None:
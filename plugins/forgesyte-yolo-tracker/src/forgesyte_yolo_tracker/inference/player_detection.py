@@ -3,6 +3,7 @@
 Provides JSON and JSON+Base64 modes for player detection using BaseDetector:
 - detect_players_json(): Returns structured detection data
 - detect_players_json_with_annotated_frame(): Returns data + annotated frame
+- detect_players_json_batch(): JSON mode for several frames in one model call
 
 This module uses BaseDetector to eliminate code duplication across detectors.
 Player-specific configuration is defined once and reused via wrapper functions.
@@ -10,7 +11,7 @@ Player-specific configuration is defined once and reused via wrapper functions.
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
@@ -106,6 +107,27 @@ def detect_players_json_with_annotated_frame(
     )
 
 
+def detect_players_json_batch(
+    frames: List[np.ndarray[Any, Any]],
+    device: str = "cpu",
+    confidence: Optional[float] = None,
+) -> List[Dict[str, Any]]:
+    """Detect players in several frames - batched JSON mode.
+
+    Args:
+        frames: List of input image frames (BGR format)
+        device: Device to run model on ('cpu' or 'cuda')
+        confidence: Detection confidence threshold (uses default if None)
+
+    Returns:
+        One detect_players_json()-shaped dictionary per frame, in input order
+    """
+    if confidence is None:
+        confidence = PLAYER_DETECTOR.default_confidence
+
+    return PLAYER_DETECTOR.detect_json_batch(frames, device=device, confidence=confidence)
+
+
 def get_player_detection_model(device: str = "cpu") -> Any:
     """Get or create cached YOLO player detection model.
 
@@ -5,18 +5,18 @@ Provides JSON and JSON+Base64 modes for player tracking with ByteTrack:
 - track_players_json_with_annotated_frame(): Returns data + annotated frame with labels
 """
 
-import base64
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Tuple
 
-import cv2
 import numpy as np
 import supervision as sv
 from ultralytics import YOLO
 
 from forgesyte_yolo_tracker.configs import get_confidence, get_model_path
 from forgesyte_yolo_tracker.configs.soccer import SoccerPitchConfiguration
-from forgesyte_yolo_tracker.tracking import ByteTrackFactory
+from forgesyte_yolo_tracker.inference._base_detector import get_cached_model
+from forgesyte_yolo_tracker.tracking import ByteTrackFactory, get_tracker_ids
+from forgesyte_yolo_tracker.utils.jpeg import encode_jpeg_base64
 
 MODEL_NAME = get_model_path("player_detection")
 MODEL_PATH = str(Path(__file__).parent.parent / "models" / MODEL_NAME)
@@ -27,21 +27,10 @@ CLASS_NAMES = {0: "player", 1: "goalkeeper", 2: "referee"}
 TRACK_COLORS = sv.ColorPalette.from_hex(["#00BFFF", "#FFD700", "#FF6347"])
 DEFAULT_NMS = 0.45
 
-_model: Optional[YOLO] = None
-
 
 def get_player_detection_model(device: str = "cpu") -> YOLO:
-    """Get or create cached YOLO model."""
-    global _model
-    if _model is None:
-        _model = YOLO(MODEL_PATH).to(device=device)
-    return _model
-
-
-def _encode_frame_to_base64(frame: np.ndarray) -> str:
-    """Encode frame to base64 JPEG."""
-    _, buffer = cv2.imencode(".jpg", frame)
-    return base64.b64encode(buffer).decode("utf-8")
+    """Get or create the shared cached YOLO model for this device."""
+    return get_cached_model(MODEL_PATH, device)
 
 
 def _create_annotators() -> Tuple[sv.BoxAnnotator, sv.LabelAnnotator]:
@@ -59,12 +48,12 @@ def _create_annotators() -> Tuple[sv.BoxAnnotator, sv.LabelAnnotator]:
     return box_annotator, label_annotator
 
 
-def track_players_json(
+def _track(
     frame: np.ndarray,
-    device: str = "cpu",
-    confidence: float = DEFAULT_CONFIDENCE,
-) -> Dict[str, Any]:
-    """Track players in a frame - JSON mode.
+    device: str,
+    confidence: float,
+) -> Tuple[sv.Detections, Dict[str, Any]]:
+    """Run detection + ByteTrack on a frame.
 
     Args:
         frame: Input image frame (BGR format)
@@ -72,10 +61,7 @@ def track_players_json(
         confidence: Detection confidence threshold
 
     Returns:
-        Dictionary with:
-        - detections: List of detection dicts with xyxy, confidence, class_id, tracking_id
-        - count: Total number of tracked players
-        - track_ids: List of unique tracking IDs
+        Tuple of (tracked detections, JSON result dict)
     """
     model = get_player_detection_model(device=device)
     tracker = ByteTrackFactory.get()
@@ -88,17 +74,21 @@ def track_players_json(
     detection_list = []
     track_ids_set = set()
 
-    for i in range(len(detections)):
-        xyxy = detections.xyxy[i]
-        conf = float(detections.confidence[i])
-        cls = int(detections.class_id[i])
-        track_id = int(detections.track_id[i]) if detections.track_id is not None else -1
+    # Columns are converted to Python lists once instead of casting per element
+    tracker_ids = get_tracker_ids(detections)
+    track_id_list = tracker_ids.tolist() if tracker_ids is not None else [-1] * len(detections)
 
+    for xyxy, conf, cls, track_id in zip(
+        detections.xyxy.tolist(),
+        detections.confidence.tolist(),
+        detections.class_id.tolist(),
+        track_id_list,
+    ):
         class_name = CLASS_NAMES.get(cls, f"class_{cls}")
 
         detection_list.append(
             {
-                "xyxy": xyxy.tolist(),
+                "xyxy": xyxy,
                 "confidence": conf,
                 "class_id": cls,
                 "class_name": class_name,
@@ -109,19 +99,19 @@ def track_players_json(
         if track_id >= 0:
             track_ids_set.add(track_id)
 
-    return {
+    return detections, {
         "detections": detection_list,
         "count": len(detection_list),
         "track_ids": sorted(list(track_ids_set)),
     }
 
 
-def track_players_json_with_annotated_frame(
+def track_players_json(
     frame: np.ndarray,
     device: str = "cpu",
     confidence: float = DEFAULT_CONFIDENCE,
 ) -> Dict[str, Any]:
-    """Track players in a frame - JSON+Base64 mode.
+    """Track players in a frame - JSON mode.
 
     Args:
         frame: Input image frame (BGR format)
@@ -129,58 +119,46 @@ def track_players_json_with_annotated_frame(
         confidence: Detection confidence threshold
 
     Returns:
-        Dictionary with detections, count, track_ids, and annotated_frame_base64
+        Dictionary with:
+        - detections: List of detection dicts with xyxy, confidence, class_id, tracking_id
+        - count: Total number of tracked players
+        - track_ids: List of unique tracking IDs
     """
-    model = get_player_detection_model(device=device)
-    tracker = ByteTrackFactory.get()
+    _, result = _track(frame, device, confidence)
+    return result
 
-    result = model(frame, imgsz=1280, conf=confidence, verbose=False)[0]
-    detections = sv.Detections.from_ultralytics(result)
-
-    detections = tracker.update_with_detections(detections)
-
-    detection_list = []
-    track_ids_set = set()
 
-    for i in range(len(detections)):
-        xyxy = detections.xyxy[i]
-        conf = float(detections.confidence[i])
-        cls = int(detections.class_id[i])
-        track_id = int(detections.track_id[i]) if detections.track_id is not None else -1
-
-        class_name = CLASS_NAMES.get(cls, f"class_{cls}")
+def track_players_json_with_annotated_frame(
+    frame: np.ndarray,
+    device: str = "cpu",
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> Dict[str, Any]:
+    """Track players in a frame - JSON+Base64 mode.
 
-        detection_list.append(
-            {
-                "xyxy": xyxy.tolist(),
-                "confidence": conf,
-                "class_id": cls,
-                "class_name": class_name,
-                "tracking_id": track_id,
-            }
-        )
+    Args:
+        frame: Input image frame (BGR format)
+        device: Device to run model on ('cpu' or 'cuda')
+        confidence: Detection confidence threshold
 
-        if track_id >= 0:
-            track_ids_set.add(track_id)
+    Returns:
+        Dictionary with detections, count, track_ids, and annotated_frame_base64
+    """
+    detections, result = _track(frame, device, confidence)
 
     # Create annotated frame with tracking labels
     box_annotator, label_annotator = _create_annotators()
 
     labels = [
-        f"#{track_id if track_id >= 0 else '?'} {CLASS_NAMES.get(int(cls), f'class_{cls}')}"
-        for track_id, cls in zip(detections.track_id if detections.track_id is not None else [-1] * len(detections), detections.class_id)
+        f"#{det['tracking_id'] if det['tracking_id'] >= 0 else '?'} {det['class_name']}"
+        for det in result["detections"]
     ]
 
     annotated = frame.copy()
     annotated = box_annotator.annotate(annotated, detections)
     annotated = label_annotator.annotate(annotated, detections, labels=labels)
 
-    return {
-        "detections": detection_list,
-        "count": len(detection_list),
-        "track_ids": sorted(list(track_ids_set)),
-        "annotated_frame_base64": _encode_frame_to_base64(annotated),
-    }
+    result["annotated_frame_base64"] = encode_jpeg_base64(annotated)
+    return result
 
 
 def run_player_tracking(frame: np.ndarray, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -7,7 +7,8 @@ Provides JSON and JSON+Base64 modes for radar/bird's-eye view generation:
 Radar uses ViewTransformer to map frame coordinates to pitch coordinates.
 """
 
-import base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -16,8 +17,16 @@ import numpy as np
 import supervision as sv
 from ultralytics import YOLO
 
+try:
+    import pybase64 as base64
+except ImportError:
+    # pybase64 (SIMD codec) is optional; stdlib base64 has the same API
+    import base64  # type: ignore[no-redef]
+
 from forgesyte_yolo_tracker.configs import get_confidence, get_model_path
 from forgesyte_yolo_tracker.configs.soccer import SoccerPitchConfiguration
+from forgesyte_yolo_tracker.inference._base_detector import get_cached_model
+from forgesyte_yolo_tracker.tracking import get_tracker_ids
 from forgesyte_yolo_tracker.utils import ViewTransformer
 
 PLAYER_MODEL_NAME = get_model_path("player_detection")
@@ -33,26 +42,22 @@ BALL_COLOR = (135, 206, 250)  # Light blue BGR
 
 DEFAULT_CONFIDENCE = 0.25
 
-_player_model: Optional[YOLO] = None
-_pitch_model: Optional[YOLO] = None
 _view_transformer: Optional[ViewTransformer] = None
 CONFIG = SoccerPitchConfiguration()
 
+# Player and pitch models are independent; run them side by side so a radar
+# frame costs max(t_player, t_pitch) instead of their sum.
+_INFERENCE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="radar")
+
 
 def get_player_detection_model(device: str = "cpu") -> YOLO:
-    """Get or create cached YOLO model."""
-    global _player_model
-    if _player_model is None:
-        _player_model = YOLO(PLAYER_MODEL_PATH).to(device=device)
-    return _player_model
+    """Get or create the shared cached YOLO model for this device."""
+    return get_cached_model(PLAYER_MODEL_PATH, device)
 
 
 def get_pitch_detection_model(device: str = "cpu") -> YOLO:
-    """Get or create cached pitch detection model."""
-    global _pitch_model
-    if _pitch_model is None:
-        _pitch_model = YOLO(PITCH_MODEL_PATH).to(device=device)
-    return _pitch_model
+    """Get or create the shared cached pitch detection model for this device."""
+    return get_cached_model(PITCH_MODEL_PATH, device)
 
 
 def get_view_transformer(
@@ -63,6 +68,33 @@ def get_view_transformer(
     return ViewTransformer(source, target)
 
 
+def _run_player_and_pitch_models(
+    frame: np.ndarray,
+    device: str = "cpu",
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> Tuple[Any, Any]:
+    """Run player and pitch models concurrently on one frame.
+
+    Args:
+        frame: Input image frame (BGR format)
+        device: Device to run models on ('cpu' or 'cuda')
+        confidence: Detection confidence threshold
+
+    Returns:
+        (player_result, pitch_result) Ultralytics results
+    """
+    player_model = get_player_detection_model(device=device)
+    pitch_model = get_pitch_detection_model(device=device)
+
+    player_future = _INFERENCE_POOL.submit(
+        player_model, frame, imgsz=1280, conf=confidence, verbose=False
+    )
+    pitch_future = _INFERENCE_POOL.submit(
+        pitch_model, frame, imgsz=1280, conf=confidence, verbose=False
+    )
+    return player_future.result()[0], pitch_future.result()[0]
+
+
 def _encode_frame_to_base64(frame: np.ndarray) -> str:
     """Encode frame to base64 PNG."""
     _, buffer = cv2.imencode(".png", frame)
@@ -75,6 +107,20 @@ def _encode_radar_to_base64(radar: np.ndarray) -> str:
     return base64.b64encode(buffer).decode("utf-8")
 
 
+@lru_cache(maxsize=8)
+def _radar_background(radar_w: int, radar_h: int) -> np.ndarray:
+    """Static radar outline, center line and circle, drawn once per size.
+
+    The returned image is read-only; callers copy it into their own buffer.
+    """
+    radar = np.zeros((radar_h, radar_w, 3), dtype=np.uint8)
+    cv2.rectangle(radar, (0, 0), (radar_w, radar_h), (50, 50, 50), 2)
+    cv2.line(radar, (radar_w // 2, 0), (radar_w // 2, radar_h), (100, 100, 100), 1)
+    cv2.circle(radar, (radar_w // 2, radar_h // 2), 20, (100, 100, 100), 1)
+    radar.flags.writeable = False
+    return radar
+
+
 def _create_radar_image(
     radar_points: List[Dict[str, Any]],
     radar_size: Tuple[int, int] = (600, 300),
@@ -89,16 +135,8 @@ def _create_radar_image(
         Radar image as numpy array
     """
     radar_w, radar_h = radar_size
-    radar = np.zeros((radar_h, radar_w, 3), dtype=np.uint8)
-
-    # Draw pitch outline
-    cv2.rectangle(radar, (0, 0), (radar_w, radar_h), (50, 50, 50), 2)
-
-    # Draw center line
-    cv2.line(radar, (radar_w // 2, 0), (radar_w // 2, radar_h), (100, 100, 100), 1)
-
-    # Draw center circle
-    cv2.circle(radar, (radar_w // 2, radar_h // 2), 20, (100, 100, 100), 1)
+    # Pitch outline, center line and center circle never change
+    radar = _radar_background(radar_w, radar_h).copy()
 
     # Draw points
     for point in radar_points:
@@ -145,11 +183,9 @@ def generate_radar_json(
         - radar_size: Radar dimensions (width, height)
         - radar_base64: Optional rendered radar image
     """
-    player_model = get_player_detection_model(device=device)
-    pitch_model = get_pitch_detection_model(device=device)
-
-    player_result = player_model(frame, imgsz=1280, conf=confidence, verbose=False)[0]
-    pitch_result = pitch_model(frame, imgsz=1280, conf=confidence, verbose=False)[0]
+    player_result, pitch_result = _run_player_and_pitch_models(
+        frame, device=device, confidence=confidence
+    )
 
     player_detections = sv.Detections.from_ultralytics(player_result)
 
@@ -171,20 +207,20 @@ def generate_radar_json(
 
         if len(valid_kp_indices) >= 4:
             src_pts = np.array([keypoints_xy[i] for i in valid_kp_indices[:4]], dtype=np.float32)
-            tgt_pts = np.array([CONFIG.vertices[i] for i in valid_kp_indices[:4]], dtype=np.float32)
+            tgt_pts = CONFIG.vertices[valid_kp_indices[:4]]
 
             try:
                 transformer = get_view_transformer(src_pts, tgt_pts)
 
-                for i in range(len(player_detections)):
-                    xyxy = player_detections.xyxy[i]
-                    track_id = (
-                        int(player_detections.track_id[i])
-                        if player_detections.track_id is not None
-                        else -1
-                    )
-                    cls = int(player_detections.class_id[i])
-
+                tracker_ids = get_tracker_ids(player_detections)
+                track_id_list = (
+                    tracker_ids.tolist()
+                    if tracker_ids is not None
+                    else [-1] * len(player_detections)
+                )
+                for xyxy, track_id, cls in zip(
+                    player_detections.xyxy, track_id_list, player_detections.class_id.tolist()
+                ):
                     center_x = float((xyxy[0] + xyxy[2]) / 2)
                     center_y = float((xyxy[1] + xyxy[3]) / 2)
 
@@ -224,11 +260,9 @@ def radar_json_with_annotated_frame(
     Returns:
         Dictionary with radar_points, radar_size, radar_base64
     """
-    player_model = get_player_detection_model(device=device)
-    pitch_model = get_pitch_detection_model(device=device)
-
-    player_result = player_model(frame, imgsz=1280, conf=confidence, verbose=False)[0]
-    pitch_result = pitch_model(frame, imgsz=1280, conf=confidence, verbose=False)[0]
+    player_result, pitch_result = _run_player_and_pitch_models(
+        frame, device=device, confidence=confidence
+    )
 
     player_detections = sv.Detections.from_ultralytics(player_result)
 
@@ -250,20 +284,20 @@ def radar_json_with_annotated_frame(
 
         if len(valid_kp_indices) >= 4:
             src_pts = np.array([keypoints_xy[i] for i in valid_kp_indices[:4]], dtype=np.float32)
-            tgt_pts = np.array([CONFIG.vertices[i] for i in valid_kp_indices[:4]], dtype=np.float32)
+            tgt_pts = CONFIG.vertices[valid_kp_indices[:4]]
 
             try:
                 transformer = get_view_transformer(src_pts, tgt_pts)
 
-                for i in range(len(player_detections)):
-                    xyxy = player_detections.xyxy[i]
-                    track_id = (
-                        int(player_detections.track_id[i])
-                        if player_detections.track_id is not None
-                        else -1
-                    )
-                    cls = int(player_detections.class_id[i])
-
+                tracker_ids = get_tracker_ids(player_detections)
+                track_id_list = (
+                    tracker_ids.tolist()
+                    if tracker_ids is not None
+                    else [-1] * len(player_detections)
+                )
+                for xyxy, track_id, cls in zip(
+                    player_detections.xyxy, track_id_list, player_detections.class_id.tolist()
+                ):
                     center_x = float((xyxy[0] + xyxy[2]) / 2)
                     center_y = float((xyxy[1] + xyxy[3]) / 2)
 
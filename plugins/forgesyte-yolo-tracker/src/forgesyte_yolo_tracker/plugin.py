@@ -10,7 +10,9 @@ Frame-based JSON tools for football analysis:
 
 import io
 import logging
-from typing import Any, Dict, Optional, Tuple
+from contextlib import closing
+from functools import lru_cache
+from typing import Any, ContextManager, Dict, Optional, Tuple
 
 import numpy as np
 from PIL import Image
@@ -38,15 +40,19 @@ except (ImportError, ModuleNotFoundError):
             pass
 
 
+from forgesyte_yolo_tracker.inference._base_detector import checkout_model, clear_model_cache
 from forgesyte_yolo_tracker.inference.ball_detection import (
+    BALL_DETECTOR,
     detect_ball_json,
     detect_ball_json_with_annotated_frame,
 )
 from forgesyte_yolo_tracker.inference.pitch_detection import (
+    PITCH_DETECTOR,
     detect_pitch_json,
     detect_pitch_json_with_annotated_frame,
 )
 from forgesyte_yolo_tracker.inference.player_detection import (
+    PLAYER_DETECTOR,
     detect_players_json,
     detect_players_json_with_annotated_frame,
 )
@@ -54,21 +60,45 @@ from forgesyte_yolo_tracker.inference.player_tracking import (
     track_players_json,
     track_players_json_with_annotated_frame,
 )
-from forgesyte_yolo_tracker.inference.radar import generate_radar_json as radar_json
+from forgesyte_yolo_tracker.inference.radar import (
+    generate_radar_json as radar_json,
+    radar_json_with_annotated_frame,
+)
 from forgesyte_yolo_tracker.tracking import ByteTrackFactory, get_tracker_ids
-from forgesyte_yolo_tracker.inference.radar import radar_json_with_annotated_frame
 from forgesyte_yolo_tracker.configs import load_model_config
+from forgesyte_yolo_tracker.utils.jpeg import FrameDecoder
 from forgesyte_yolo_tracker.utils.json_sanitize import sanitize_json
+from forgesyte_yolo_tracker.utils.prefetch import prefetch
+
+__all__ = ["Plugin"]
 
 logger = logging.getLogger(__name__)
 
+# Reuses one decode buffer per frame shape per thread; each tool call is
+# done with its frame before the thread decodes the next one.
+_decode_jpeg = FrameDecoder()
+
 # Class names for video player tracking (player, goalkeeper, referee)
 CLASS_NAMES = {0: "player", 1: "goalkeeper", 2: "referee"}
 
+# v0.9.7 video tools (JSON frame-level output + progress_callback)
+VIDEO_TOOLS = frozenset(
+    {
+        "video_ball_detection",
+        "video_pitch_detection",
+        "video_radar",
+        "video_player_tracking",
+    }
+)
+
 
+@lru_cache(maxsize=1)
 def _get_default_device() -> str:
     """Get default device from config file.
 
+    The config is read once per process; run_tool calls this on every
+    request that does not pass an explicit device.
+
     Returns:
         Device string from config (e.g., 'cuda' or 'cpu'), defaults to 'cpu'.
     """
@@ -83,24 +113,44 @@ def _get_default_device() -> str:
 # Image decoding helpers (Phase 12 contract: bytes input)
 # ---------------------------------------------------------
 def _decode_image_bytes(
-    image_bytes: bytes, tool_name: str
+    image_bytes: bytes, tool_name: str, input_size: Optional[int] = None
 ) -> Tuple[Optional[np.ndarray], Optional[Dict[str, Any]]]:
-    """Decode raw image bytes to numpy array.
+    """Decode raw image bytes to a BGR numpy array.
+
+    Frames come back in the BGR channel order that the inference modules and
+    Ultralytics expect for numpy input, so no separate color-conversion pass
+    is needed downstream.
 
     Args:
         image_bytes: Raw image bytes (PNG, JPG, etc.)
         tool_name: Name of tool calling this (for error logging)
+        input_size: Optional downscale hint. JPEG input is decoded at the
+            smallest 1/2, 1/4 or 1/8 scale whose sides are still >= input_size
+            (libjpeg DCT scaling); other formats are decoded at full size.
+            Tool results then report the sizes involved (see _success).
 
     Returns:
-        (frame as numpy array, None) or (None, error_dict)
+        (BGR frame as numpy array, None) or (None, error_dict)
     """
     try:
         if not isinstance(image_bytes, (bytes, bytearray)):
             raise ValueError(f"Expected bytes, got {type(image_bytes).__name__}")
 
+        # JPEG fast path: libjpeg-turbo decodes straight to a BGR array. The
+        # buffer is passed as-is (no bytes() copy for bytearray input).
+        frame = _decode_jpeg(image_bytes, input_size)
+        if frame is not None:
+            return frame, None
+
         # Decode bytes -> PIL Image -> numpy array
-        image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
-        frame = np.array(image)
+        image = Image.open(io.BytesIO(image_bytes))
+        if input_size:
+            image.draft("RGB", (input_size, input_size))
+        # convert() always copies, even RGB -> RGB; only call it when needed
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        # RGB -> BGR in the same copy that materialises the array
+        frame = np.ascontiguousarray(np.asarray(image)[..., ::-1])
 
         return frame, None
 
@@ -118,148 +168,171 @@ def _decode_image_bytes(
 # ---------------------------------------------------------
 # Tool functions (Phase 12 contract: accept image_bytes)
 # ---------------------------------------------------------
+def _success(
+    result: Dict[str, Any],
+    frame: np.ndarray,
+    image_bytes: bytes,
+    input_size: Optional[int],
+) -> Dict[str, Any]:
+    """Wrap a tool result, reporting the decode scale when input_size shrank the frame.
+
+    Coordinates in the result are in the decoded frame's pixels. When the
+    frame was decoded below its original size, ``original_size`` and
+    ``decoded_size`` (both ``[width, height]``) are added so clients can map
+    them back to their image.
+
+    Args:
+        result: Inference result dict
+        frame: Decoded BGR frame the result was computed on
+        image_bytes: Raw image bytes the frame was decoded from
+        input_size: The input_size hint passed to the tool
+
+    Returns:
+        Tool response dict
+    """
+    if input_size:
+        # Image.open only parses the header; no pixels are decoded here
+        original_size = Image.open(io.BytesIO(image_bytes)).size
+        decoded_size = (frame.shape[1], frame.shape[0])
+        if decoded_size != original_size:
+            result = dict(
+                result,
+                original_size=list(original_size),
+                decoded_size=list(decoded_size),
+            )
+    return {"success": True, "result": result}
+
+
 def _tool_player_detection(
-    image_bytes: bytes, device: str = "cpu", annotated: bool = False
+    image_bytes: bytes,
+    device: str = "cpu",
+    annotated: bool = False,
+    input_size: Optional[int] = None,
 ) -> Dict[str, Any]:
-    frame, error = _decode_image_bytes(image_bytes, "player_detection")
+    frame, error = _decode_image_bytes(image_bytes, "player_detection", input_size)
     if error:
         return error
     if annotated and frame is not None:
-        return {"success": True, "result": detect_players_json_with_annotated_frame(frame, device=device)}
+        result = detect_players_json_with_annotated_frame(frame, device=device)
+        return _success(result, frame, image_bytes, input_size)
     if frame is not None:
-        return {"success": True, "result": detect_players_json(frame, device=device)}
+        result = detect_players_json(frame, device=device)
+        return _success(result, frame, image_bytes, input_size)
     return {"success": False, "error": "image_decode_failed"}
 
 
 
 def _tool_player_tracking(
-    image_bytes: bytes, device: str = "cpu", annotated: bool = False
+    image_bytes: bytes,
+    device: str = "cpu",
+    annotated: bool = False,
+    input_size: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Track players in a single frame with ByteTrack."""
-    frame, error = _decode_image_bytes(image_bytes, "player_tracking")
+    frame, error = _decode_image_bytes(image_bytes, "player_tracking", input_size)
     if error:
         return error
     if annotated and frame is not None:
-        return {"success": True, "result": track_players_json_with_annotated_frame(frame, device=device)}
+        result = track_players_json_with_annotated_frame(frame, device=device)
+        return _success(result, frame, image_bytes, input_size)
     if frame is not None:
-        return {"success": True, "result": track_players_json(frame, device=device)}
+        result = track_players_json(frame, device=device)
+        return _success(result, frame, image_bytes, input_size)
     return {"success": False, "error": "image_decode_failed"}
 
 
-def _tool_video_player_tracking(
-    video_path: str,
-    device: str = "cpu",
-    progress_callback=None,
-) -> Dict[str, Any]:
-    """Run player tracking on video frames with ByteTrack."""
-    from pathlib import Path
-    import cv2
-    import supervision as sv
-    from forgesyte_yolo_tracker.configs import get_model_path
-    from ultralytics import YOLO
-    from forgesyte_yolo_tracker.tracking import ByteTrackFactory, get_tracker_ids
-
-    MODEL_NAME = get_model_path("player_detection")
-    MODEL_PATH = str(Path(__file__).parent / "models" / MODEL_NAME)
-    model = YOLO(MODEL_PATH).to(device=device)
-
-    tracker = ByteTrackFactory.get()
-
-    cap = cv2.VideoCapture(video_path)
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    cap.release()
-    if total_frames <= 0:
-        total_frames = 100
-
-    frame_results = []
-    frame_index = 0
-
-    results = model(video_path, stream=True, verbose=False)
-    for result in results:
-        detections = sv.Detections.from_ultralytics(result)
-        detections = tracker.update_with_detections(detections)
-
-        tracker_ids = get_tracker_ids(detections)
-        if tracker_ids is None:
-            tracker_ids = []
-
-        tracked_objects = []
-        for tid, cls, xyxy in zip(
-            tracker_ids,
-            detections.class_id,
-            detections.xyxy
-        ):
-            center = [
-                float((xyxy[0] + xyxy[2]) / 2),
-                float((xyxy[1] + xyxy[3]) / 2)
-            ]
-            tracked_objects.append({
-                "track_id": int(tid) if tid is not None else -1,
-                "class_id": int(cls),
-                "class": CLASS_NAMES.get(int(cls), f"class_{cls}"),
-                "xyxy": xyxy.tolist(),
-                "center": center,
-            })
-
-        frame_results.append({
-            "frame_index": frame_index,
-            "detections": {"tracked_objects": tracked_objects},
-        })
-
-        if progress_callback:
-            progress_callback(frame_index + 1, total_frames)
-
-        frame_index += 1
-
-    return {
-        "total_frames": frame_index,
-        "frames": frame_results,
-    }
-
-
-
 def _tool_ball_detection(
-    image_bytes: bytes, device: str = "cpu", annotated: bool = False
+    image_bytes: bytes,
+    device: str = "cpu",
+    annotated: bool = False,
+    input_size: Optional[int] = None,
 ) -> Dict[str, Any]:
-    frame, error = _decode_image_bytes(image_bytes, "ball_detection")
+    frame, error = _decode_image_bytes(image_bytes, "ball_detection", input_size)
     if error:
         return error
     if annotated and frame is not None:
-        return {"success": True, "result": detect_ball_json_with_annotated_frame(frame, device=device)}
+        result = detect_ball_json_with_annotated_frame(frame, device=device)
+        return _success(result, frame, image_bytes, input_size)
     if frame is not None:
-        return {"success": True, "result": detect_ball_json(frame, device=device)}
+        result = detect_ball_json(frame, device=device)
+        return _success(result, frame, image_bytes, input_size)
     return {"success": False, "error": "image_decode_failed"}
 
 
 def _tool_pitch_detection(
-    image_bytes: bytes, device: str = "cpu", annotated: bool = False
+    image_bytes: bytes,
+    device: str = "cpu",
+    annotated: bool = False,
+    input_size: Optional[int] = None,
 ) -> Dict[str, Any]:
-    frame, error = _decode_image_bytes(image_bytes, "pitch_detection")
+    frame, error = _decode_image_bytes(image_bytes, "pitch_detection", input_size)
     if error:
         return error
     if annotated and frame is not None:
-        return {"success": True, "result": detect_pitch_json_with_annotated_frame(frame, device=device)}
+        result = detect_pitch_json_with_annotated_frame(frame, device=device)
+        return _success(result, frame, image_bytes, input_size)
     if frame is not None:
-        return {"success": True, "result": detect_pitch_json(frame, device=device)}
+        result = detect_pitch_json(frame, device=device)
+        return _success(result, frame, image_bytes, input_size)
     return {"success": False, "error": "image_decode_failed"}
 
 
 def _tool_radar(
-    image_bytes: bytes, device: str = "cpu", annotated: bool = False
+    image_bytes: bytes,
+    device: str = "cpu",
+    annotated: bool = False,
+    input_size: Optional[int] = None,
 ) -> Dict[str, Any]:
-    frame, error = _decode_image_bytes(image_bytes, "radar")
+    frame, error = _decode_image_bytes(image_bytes, "radar", input_size)
     if error:
         return error
     if annotated and frame is not None:
-        return {"success": True, "result": radar_json_with_annotated_frame(frame, device=device)}
+        result = radar_json_with_annotated_frame(frame, device=device)
+        return _success(result, frame, image_bytes, input_size)
     if frame is not None:
-        return {"success": True, "result": radar_json(frame, device=device)}
+        result = radar_json(frame, device=device)
+        return _success(result, frame, image_bytes, input_size)
     return {"success": False, "error": "image_decode_failed"}
 
 
 # ---------------------------------------------------------
 # v0.9.7: Shared video tool helper
 # ---------------------------------------------------------
+def _checkout_video_model(model_key: str, device: str = "cpu") -> ContextManager[Any]:
+    """Borrow a pooled YOLO model for one video tool call.
+
+    The tool streams the video through the model on a background thread.
+    Ultralytics predictors are not thread-safe, so the call holds the
+    instance until it returns; later calls reuse it instead of reloading
+    the weights, and only concurrent calls load extra copies.
+
+    Args:
+        model_key: Key in models.yaml (e.g. 'ball_detection')
+        device: Device to run model on ('cpu' or 'cuda')
+
+    Returns:
+        Context manager yielding a YOLO model instance
+    """
+    from pathlib import Path
+
+    from forgesyte_yolo_tracker.configs import get_model_path
+
+    model_path = str(Path(__file__).parent / "models" / get_model_path(model_key))
+    return checkout_model(model_path, device)
+
+
+def _boxes_to_array(boxes: Any) -> np.ndarray:
+    """Copy YOLO boxes to host memory in a single device-to-host transfer.
+
+    Rows are ``[x1, y1, x2, y2, (track_id,) conf, cls]``; reading
+    ``boxes.data`` once replaces separate xyxy/conf/cls copies, each of which
+    synchronises with the GPU.
+    """
+    if boxes is None or len(boxes) == 0:
+        return np.empty((0, 6), dtype=np.float32)
+    return boxes.data.cpu().numpy()
+
+
 def _run_video_tool(
     model,
     video_path: str,
@@ -281,31 +354,28 @@ def _run_video_tool(
     frame_results = []
     frame_index = 0
 
-    results = model(video_path, stream=True, verbose=False)
-
-    for result in results:
-        if frame_handler:
-            frame_data = frame_handler(result)
-        else:
-            boxes = result.boxes
-            if boxes is not None and len(boxes.xyxy) > 0:
+    # Closing waits for the inference thread, so the model is idle on return
+    with closing(prefetch(model(video_path, stream=True, verbose=False))) as results:
+        for result in results:
+            if frame_handler:
+                frame_data = frame_handler(result)
+            else:
+                data = _boxes_to_array(result.boxes)
                 frame_data = {
-                    "xyxy": boxes.xyxy.cpu().numpy().tolist(),
-                    "confidence": boxes.conf.cpu().numpy().tolist(),
-                    "class_id": boxes.cls.cpu().numpy().tolist(),
+                    "xyxy": data[:, :4].tolist(),
+                    "confidence": data[:, -2].tolist(),
+                    "class_id": data[:, -1].tolist(),
                 }
-            else:
-                frame_data = {"xyxy": [], "confidence": [], "class_id": []}
 
-        frame_results.append({
-            "frame_index": frame_index,
-            "detections": frame_data,
-        })
+            frame_results.append({
+                "frame_index": frame_index,
+                "detections": frame_data,
+            })
 
-        if progress_callback:
-            progress_callback(frame_index + 1, total_frames)
+            if progress_callback:
+                progress_callback(frame_index + 1, total_frames)
 
-        frame_index += 1
+            frame_index += 1
 
     logger.info(f"Completed: {frame_index} frames")
 
@@ -325,31 +395,23 @@ def _tool_video_ball_detection(
     progress_callback=None,
 ) -> Dict[str, Any]:
     """Run ball detection on video frames, returning JSON results."""
-    from pathlib import Path
-    from forgesyte_yolo_tracker.configs import get_model_path
-    from ultralytics import YOLO
-
-    MODEL_NAME = get_model_path("ball_detection")
-    MODEL_PATH = str(Path(__file__).parent / "models" / MODEL_NAME)
-    model = YOLO(MODEL_PATH).to(device=device)
 
     def handle_frame(result):
-        boxes = result.boxes
-        if boxes is not None and len(boxes.xyxy) > 0:
-            return {
-                "xyxy": boxes.xyxy.cpu().numpy().tolist(),
-                "confidence": boxes.conf.cpu().numpy().tolist(),
-                "class_id": boxes.cls.cpu().numpy().tolist(),
-            }
-        return {"xyxy": [], "confidence": [], "class_id": []}
+        data = _boxes_to_array(result.boxes)
+        return {
+            "xyxy": data[:, :4].tolist(),
+            "confidence": data[:, -2].tolist(),
+            "class_id": data[:, -1].tolist(),
+        }
 
-    return _run_video_tool(
-        model=model,
-        video_path=video_path,
-        progress_callback=progress_callback,
-        frame_handler=handle_frame,
-        device=device,
-    )
+    with _checkout_video_model("ball_detection", device) as model:
+        return _run_video_tool(
+            model=model,
+            video_path=video_path,
+            progress_callback=progress_callback,
+            frame_handler=handle_frame,
+            device=device,
+        )
 
 
 def _tool_video_pitch_detection(
@@ -358,32 +420,28 @@ def _tool_video_pitch_detection(
     progress_callback=None,
 ) -> Dict[str, Any]:
     """Run pitch detection on video frames, returning JSON results."""
-    from pathlib import Path
-    from forgesyte_yolo_tracker.configs import get_model_path
-    from ultralytics import YOLO
-
-    MODEL_NAME = get_model_path("pitch_detection")
-    MODEL_PATH = str(Path(__file__).parent / "models" / MODEL_NAME)
-    model = YOLO(MODEL_PATH).to(device=device)
 
     def handle_frame(result):
         keypoints = result.keypoints
         if keypoints is not None and keypoints.xy is not None:
-            xy = keypoints.xy.cpu().numpy()
-            conf = keypoints.conf.cpu().numpy() if keypoints.conf is not None else None
+            # One transfer: data is (N, K, 3) [x, y, conf], or (N, K, 2) without conf
+            kp = keypoints.data.cpu().numpy()
+            xy = kp[..., :2]
+            conf = kp[..., 2] if kp.shape[-1] == 3 else None
             return {
                 "keypoints_xy": xy.tolist() if len(xy) > 0 else [],
                 "keypoints_conf": conf.tolist() if conf is not None and len(conf) > 0 else [],
             }
         return {"keypoints_xy": [], "keypoints_conf": []}
 
-    return _run_video_tool(
-        model=model,
-        video_path=video_path,
-        progress_callback=progress_callback,
-        frame_handler=handle_frame,
-        device=device,
-    )
+    with _checkout_video_model("pitch_detection", device) as model:
+        return _run_video_tool(
+            model=model,
+            video_path=video_path,
+            progress_callback=progress_callback,
+            frame_handler=handle_frame,
+            device=device,
+        )
 
 
 def _tool_video_radar(
@@ -392,34 +450,26 @@ def _tool_video_radar(
     progress_callback=None,
 ) -> Dict[str, Any]:
     """Run radar generation on video frames, returning JSON results."""
-    from pathlib import Path
-    from forgesyte_yolo_tracker.configs import get_model_path
-    from ultralytics import YOLO
-
-    MODEL_NAME = get_model_path("player_detection")
-    MODEL_PATH = str(Path(__file__).parent / "models" / MODEL_NAME)
-    model = YOLO(MODEL_PATH).to(device=device)
 
     def handle_frame(result):
-        boxes = result.boxes
-        if boxes is not None and len(boxes.xyxy) > 0:
-            xyxy = boxes.xyxy.cpu().numpy()
-            centers = [[(b[0] + b[2]) / 2, (b[1] + b[3]) / 2] for b in xyxy]
-            return {
-                "xyxy": xyxy.tolist(),
-                "centers": centers,
-                "confidence": boxes.conf.cpu().numpy().tolist(),
-                "class_id": boxes.cls.cpu().numpy().tolist(),
-            }
-        return {"xyxy": [], "centers": [], "confidence": [], "class_id": []}
+        data = _boxes_to_array(result.boxes)
+        xyxy = data[:, :4]
+        centers = (xyxy[:, :2] + xyxy[:, 2:4]) / 2
+        return {
+            "xyxy": xyxy.tolist(),
+            "centers": centers.tolist(),
+            "confidence": data[:, -2].tolist(),
+            "class_id": data[:, -1].tolist(),
+        }
 
-    return _run_video_tool(
-        model=model,
-        video_path=video_path,
-        progress_callback=progress_callback,
-        frame_handler=handle_frame,
-        device=device,
-    )
+    with _checkout_video_model("player_detection", device) as model:
+        return _run_video_tool(
+            model=model,
+            video_path=video_path,
+            progress_callback=progress_callback,
+            frame_handler=handle_frame,
+            device=device,
+        )
 
 
 def _tool_video_player_tracking(
@@ -428,15 +478,8 @@ def _tool_video_player_tracking(
     progress_callback=None,
 ) -> Dict[str, Any]:
     """Run player tracking on video frames with ByteTrack."""
-    from pathlib import Path
     import cv2
     import supervision as sv
-    from forgesyte_yolo_tracker.configs import get_model_path
-    from ultralytics import YOLO
-
-    MODEL_NAME = get_model_path("player_detection")
-    MODEL_PATH = str(Path(__file__).parent / "models" / MODEL_NAME)
-    model = YOLO(MODEL_PATH).to(device=device)
 
     tracker = ByteTrackFactory.get()
 
@@ -449,41 +492,43 @@ def _tool_video_player_tracking(
     frame_results = []
     frame_index = 0
 
-    results = model(video_path, stream=True, verbose=False)
-    for result in results:
-        detections = sv.Detections.from_ultralytics(result)
-        detections = tracker.update_with_detections(detections)
-
-        tracked_objects = []
-        tracker_ids = get_tracker_ids(detections)
-        if tracker_ids is None:
-            tracker_ids = []
-        for tid, cls, xyxy in zip(
-            tracker_ids,
-            detections.class_id,
-            detections.xyxy
-        ):
-            center = [
-                float((xyxy[0] + xyxy[2]) / 2),
-                float((xyxy[1] + xyxy[3]) / 2)
-            ]
-            tracked_objects.append({
-                "track_id": int(tid) if tid is not None else -1,
-                "class_id": int(cls),
-                "class": CLASS_NAMES.get(int(cls), f"class_{cls}"),
-                "xyxy": xyxy.tolist(),
-                "center": center,
+    with _checkout_video_model("player_detection", device) as model, closing(
+        prefetch(model(video_path, stream=True, verbose=False))
+    ) as results:
+        for result in results:
+            detections = sv.Detections.from_ultralytics(result)
+            detections = tracker.update_with_detections(detections)
+
+            tracked_objects = []
+            tracker_ids = get_tracker_ids(detections)
+            if tracker_ids is None:
+                tracker_ids = []
+            for tid, cls, xyxy in zip(
+                tracker_ids,
+                detections.class_id,
+                detections.xyxy
+            ):
+                center = [
+                    float((xyxy[0] + xyxy[2]) / 2),
+                    float((xyxy[1] + xyxy[3]) / 2)
+                ]
+                tracked_objects.append({
+                    "track_id": int(tid) if tid is not None else -1,
+                    "class_id": int(cls),
+                    "class": CLASS_NAMES.get(int(cls), f"class_{cls}"),
+                    "xyxy": xyxy.tolist(),
+                    "center": center,
+                })
+
+            frame_results.append({
+                "frame_index": frame_index,
+                "detections": {"tracked_objects": tracked_objects},
             })
 
-        frame_results.append({
-            "frame_index": frame_index,
-            "detections": {"tracked_objects": tracked_objects},
-        })
-
-        if progress_callback:
-            progress_callback(frame_index + 1, total_frames)
+            if progress_callback:
+                progress_callback(frame_index + 1, total_frames)
 
-        frame_index += 1
+            frame_index += 1
 
     # v0.10.0: Sanitize output for JSON serialization
     return sanitize_json({
@@ -510,6 +555,7 @@ class Plugin(BasePlugin):  # type: ignore[misc]
                 "image_bytes": {"type": "string", "format": "binary"},
                 "device": {"type": "string", "default": "cpu"},
                 "annotated": {"type": "boolean", "default": False},
+                "input_size": {"type": "integer", "default": None},
             },
             "output_schema": {"result": {"type": "object"}},
             "handler": _tool_player_detection,
@@ -520,6 +566,7 @@ class Plugin(BasePlugin):  # type: ignore[misc]
                 "image_bytes": {"type": "string", "format": "binary"},
                 "device": {"type": "string", "default": "cpu"},
                 "annotated": {"type": "boolean", "default": False},
+                "input_size": {"type": "integer", "default": None},
             },
             "output_schema": {"result": {"type": "object"}},
             "handler": _tool_player_tracking,
@@ -530,6 +577,7 @@ class Plugin(BasePlugin):  # type: ignore[misc]
                 "image_bytes": {"type": "string", "format": "binary"},
                 "device": {"type": "string", "default": "cpu"},
                 "annotated": {"type": "boolean", "default": False},
+                "input_size": {"type": "integer", "default": None},
             },
             "output_schema": {"result": {"type": "object"}},
             "handler": _tool_ball_detection,
@@ -540,6 +588,7 @@ class Plugin(BasePlugin):  # type: ignore[misc]
                 "image_bytes": {"type": "string", "format": "binary"},
                 "device": {"type": "string", "default": "cpu"},
                 "annotated": {"type": "boolean", "default": False},
+                "input_size": {"type": "integer", "default": None},
             },
             "output_schema": {"result": {"type": "object"}},
             "handler": _tool_pitch_detection,
@@ -550,6 +599,7 @@ class Plugin(BasePlugin):  # type: ignore[misc]
                 "image_bytes": {"type": "string", "format": "binary"},
                 "device": {"type": "string", "default": "cpu"},
                 "annotated": {"type": "boolean", "default": False},
+                "input_size": {"type": "integer", "default": None},
             },
             "output_schema": {"result": {"type": "object"}},
             "handler": _tool_radar,
@@ -623,19 +673,11 @@ class Plugin(BasePlugin):  # type: ignore[misc]
         """
         logger.info(f"run_tool: {tool_name}")
 
-        if tool_name not in self.tools:
+        handler = self._handlers.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {tool_name}")
 
-        handler = self.tools[tool_name]["handler"]
-
-        # v0.9.7 video tools (JSON frame-level output + progress_callback)
-        v097_video_tools = {
-            "video_ball_detection",
-            "video_pitch_detection",
-            "video_radar",
-            "video_player_tracking",
-        }
-        if tool_name in v097_video_tools:
+        if tool_name in VIDEO_TOOLS:
             return handler(
                 video_path=args.get("video_path"),
                 device=args.get("device", _get_default_device()),
@@ -654,17 +696,31 @@ class Plugin(BasePlugin):  # type: ignore[misc]
             image_bytes=image_bytes,
             device=args.get("device", _get_default_device()),
             annotated=args.get("annotated", False),
+            input_size=args.get("input_size"),
         )
 
     def __init__(self) -> None:
         """Initialize YOLO Tracker plugin."""
         super().__init__()  # Call BasePlugin __init__ for contract validation
+        # Flat name -> handler map so run_tool dispatches with one lookup
+        self._handlers: Dict[str, Any] = {
+            name: spec["handler"] for name, spec in self.tools.items()
+        }
 
     # -------------------------------------------------------
     # Lifecycle hooks
     # -------------------------------------------------------
     def on_load(self) -> None:
+        device = _get_default_device()
+        for detector in (PLAYER_DETECTOR, BALL_DETECTOR, PITCH_DETECTOR):
+            try:
+                detector.warmup(device=device)
+            except Exception as e:
+                # Missing weights must not stop the plugin from loading;
+                # the model is loaded lazily on first use instead.
+                logger.warning(f"Model warmup skipped for {detector.detector_name}: {e}")
         logger.info("YOLO Tracker plugin loaded")
 
     def on_unload(self) -> None:
+        clear_model_cache()
         logger.info("YOLO Tracker plugin unloaded")
@@ -10,9 +10,11 @@ Core Classes:
 Custom forgeSYTE modules:
 - ball.py - Ball tracking (not annotating)
 - soccer_pitch.py - Soccer pitch drawing utilities
+- prefetch.py - Background-thread iterator prefetching
+- jpeg.py - libjpeg-turbo JPEG codec with OpenCV/PIL fallback
 """
 
-from . import ball, soccer_pitch
+from . import ball, prefetch, soccer_pitch
 
 # Lazy import to avoid torch/transformers at module load time
 def __getattr__(name: str):
@@ -35,5 +37,6 @@ __all__ = [
     "ViewTransformer",
     # Custom forgeSYTE modules
     "ball",
+    "prefetch",
     "soccer_pitch",
 ]
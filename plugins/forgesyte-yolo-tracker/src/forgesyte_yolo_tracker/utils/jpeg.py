@@ -0,0 +1,212 @@
+"""JPEG encode/decode helpers backed by libjpeg-turbo when available.
+
+PyTurboJPEG is an optional dependency (``pip install .[turbojpeg]``). When it
+or the libturbojpeg shared library is missing, encoding falls back to
+cv2.imencode and decode_jpeg() returns None so callers use their own decoder.
+
+encode_jpeg_base64() is the single JPEG + base64 path shared by all
+annotated-frame outputs.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+try:
+    import pybase64 as base64
+except ImportError:
+    # pybase64 (SIMD codec) is optional; stdlib base64 has the same API
+    import base64  # type: ignore[no-redef]
+
+try:
+    from turbojpeg import TJPF_BGR, TurboJPEG
+except ImportError:
+    # PyTurboJPEG is optional; cv2 / PIL are used when it is not installed
+    TurboJPEG = None  # type: ignore[assignment,misc]
+    TJPF_BGR = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Annotated frames are UI previews; 75 roughly halves the payload of
+# cv2.imencode's default of 95 without visible artifacts
+JPEG_QUALITY = 75
+
+JPEG_MAGIC = b"\xff\xd8\xff"
+
+# DCT-domain scale factors, most aggressive first
+_SCALING_FACTORS: Tuple[Tuple[int, int], ...] = ((1, 8), (1, 4), (1, 2))
+
+_turbo_jpeg: Optional[Any] = None
+_turbo_jpeg_failed = False
+
+
+def get_turbo_jpeg() -> Optional[Any]:
+    """Get the shared TurboJPEG instance, or None if libjpeg-turbo is unavailable."""
+    global _turbo_jpeg, _turbo_jpeg_failed
+    if _turbo_jpeg is None and not _turbo_jpeg_failed:
+        if TurboJPEG is None:
+            _turbo_jpeg_failed = True
+        else:
+            try:
+                _turbo_jpeg = TurboJPEG()
+            except Exception as e:
+                # Python wrapper installed but the shared library is missing
+                logger.warning(f"TurboJPEG unavailable, using OpenCV/PIL codecs: {e}")
+                _turbo_jpeg_failed = True
+    return _turbo_jpeg
+
+
+def encode_jpeg(frame: np.ndarray, quality: int = JPEG_QUALITY) -> Any:
+    """Encode a BGR frame to JPEG bytes.
+
+    Uses libjpeg-turbo through PyTurboJPEG when available (SIMD DCT and
+    Huffman coding), falling back to cv2.imencode.
+
+    Args:
+        frame: Input image frame (BGR format, numpy array)
+        quality: JPEG quality (1-100)
+
+    Returns:
+        Bytes-like JPEG buffer
+
+    Raises:
+        ValueError: If frame encoding fails
+    """
+    jpeg = get_turbo_jpeg()
+    if jpeg is not None:
+        return jpeg.encode(frame, quality=quality)
+
+    params = [
+        cv2.IMWRITE_JPEG_QUALITY,
+        quality,
+        cv2.IMWRITE_JPEG_OPTIMIZE,
+        0,
+        cv2.IMWRITE_JPEG_PROGRESSIVE,
+        0,
+    ]
+    success, buffer = cv2.imencode(".jpg", frame, params)
+    if not success:
+        raise ValueError("Failed to encode frame to JPEG")
+    return buffer
+
+
+def encode_jpeg_base64(frame: np.ndarray, quality: int = JPEG_QUALITY) -> str:
+    """Encode a BGR frame to a base64 JPEG string.
+
+    Args:
+        frame: Input image frame (BGR format, numpy array)
+        quality: JPEG quality (1-100)
+
+    Returns:
+        Base64 encoded JPEG string
+
+    Raises:
+        ValueError: If frame encoding fails
+    """
+    # b64encode reads the encoder's buffer directly; no intermediate bytes copy
+    return base64.b64encode(encode_jpeg(frame, quality=quality)).decode("ascii")
+
+
+def _scaled(size: int, factor: Tuple[int, int]) -> int:
+    num, den = factor
+    return (size * num + den - 1) // den
+
+
+def _decode(
+    data: Union[bytes, bytearray, memoryview],
+    input_size: Optional[int],
+    buffer_for: Optional[Callable[[Tuple[int, int, int]], np.ndarray]],
+) -> Optional[np.ndarray]:
+    if data[:3] != JPEG_MAGIC:
+        return None
+
+    jpeg = get_turbo_jpeg()
+    if jpeg is None:
+        return None
+
+    try:
+        width, height = jpeg.decode_header(data)[:2]
+
+        scaling_factor = None
+        if input_size:
+            for factor in _SCALING_FACTORS:
+                if min(_scaled(width, factor), _scaled(height, factor)) >= input_size:
+                    scaling_factor = factor
+                    break
+
+        dst = None
+        if buffer_for is not None:
+            if scaling_factor is not None:
+                width, height = _scaled(width, scaling_factor), _scaled(height, scaling_factor)
+            dst = buffer_for((height, width, 3))
+
+        return jpeg.decode(data, pixel_format=TJPF_BGR, scaling_factor=scaling_factor, dst=dst)
+    except Exception as e:
+        logger.debug(f"TurboJPEG decode failed, falling back: {e}")
+        return None
+
+
+def decode_jpeg(
+    data: Union[bytes, bytearray, memoryview], input_size: Optional[int] = None
+) -> Optional[np.ndarray]:
+    """Decode JPEG bytes to a BGR array with libjpeg-turbo.
+
+    Args:
+        data: Raw image bytes. Any bytes-like object is read in place
+            (TurboJPEG wraps it with np.frombuffer), so no copy is made.
+        input_size: Optional downscale hint. The smallest 1/2, 1/4 or 1/8 DCT
+            scale whose sides are still >= input_size is used.
+
+    Returns:
+        BGR frame as numpy array, or None if the data is not JPEG, TurboJPEG
+        is unavailable, or libjpeg-turbo cannot decode it (e.g. CMYK)
+    """
+    return _decode(data, input_size, None)
+
+
+class FrameDecoder:
+    """JPEG decoder that reuses its output arrays.
+
+    Camera streams arrive at a fixed resolution, so instead of allocating a
+    new frame per call, each thread keeps one preallocated BGR buffer per
+    output shape and libjpeg-turbo decodes into it.
+
+    The returned array is overwritten by the next call on the same thread;
+    callers must finish with (or copy) a frame before decoding the next one.
+    """
+
+    # Distinct shapes kept per thread before the slots are reset
+    MAX_SLOTS = 4
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def _buffer_for(self, shape: Tuple[int, int, int]) -> np.ndarray:
+        slots: Optional[Dict[Tuple[int, int, int], np.ndarray]]
+        slots = getattr(self._local, "slots", None)
+        if slots is None:
+            slots = self._local.slots = {}
+        buffer = slots.get(shape)
+        if buffer is None:
+            if len(slots) >= self.MAX_SLOTS:
+                slots.clear()
+            buffer = slots[shape] = np.empty(shape, dtype=np.uint8)
+        return buffer
+
+    def __call__(
+        self, data: Union[bytes, bytearray, memoryview], input_size: Optional[int] = None
+    ) -> Optional[np.ndarray]:
+        """Decode JPEG bytes into this thread's buffer for the frame shape.
+
+        Args:
+            data: Raw image bytes
+            input_size: Optional downscale hint (see decode_jpeg)
+
+        Returns:
+            BGR frame backed by a reused buffer, or None under the same
+            conditions as decode_jpeg
+        """
+        return _decode(data, input_size, self._buffer_for)
@@ -0,0 +1,106 @@
+"""Background prefetching for frame and result iterators.
+
+Video tools consume ``model(video_path, stream=True)``, a generator that
+decodes a frame and runs inference before yielding. Driving that generator
+from a worker thread lets frame N+1 be decoded and inferred while the caller
+post-processes frame N (tracking, JSON conversion, progress callbacks).
+
+batched() groups frames so several can be sent to the model in one call.
+"""
+
+import queue
+import threading
+from typing import Any, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Raised:
+    """Carries an exception from the producer thread to the consumer."""
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+def prefetch(iterable: Iterable[T], maxsize: int = 8) -> Iterator[T]:
+    """Iterate ``iterable`` on a background thread.
+
+    Items are buffered in a bounded queue, so at most ``maxsize`` items are
+    produced ahead of the consumer. Order is preserved, exceptions raised by
+    the producer are re-raised in the consumer, and stopping iteration early
+    shuts the producer down and closes the source generator. Closing the
+    returned iterator waits for the producer to exit, so the source (and any
+    model it drives) is idle once ``close()`` returns.
+
+    Args:
+        iterable: Source iterable (e.g. an Ultralytics stream generator)
+        maxsize: Maximum number of items buffered ahead of the consumer
+
+    Yields:
+        Items from ``iterable`` in their original order
+    """
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def _put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce() -> None:
+        try:
+            for item in iterable:
+                if not _put(item):
+                    break
+        except BaseException as e:  # noqa: B036 - re-raised in consumer
+            _put(_Raised(e))
+        finally:
+            # Close generators so their resources (e.g. video capture) are
+            # released as soon as the consumer stops.
+            close = getattr(iterable, "close", None)
+            if close is not None:
+                close()
+            _put(_DONE)
+
+    worker = threading.Thread(target=_produce, name="prefetch", daemon=True)
+    worker.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Raised):
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
+        # The producer notices stop after its current item at the latest
+        worker.join()
+
+
+def batched(iterable: Iterable[T], batch_size: int) -> Iterator[List[T]]:
+    """Group items into lists of ``batch_size``; the last batch may be shorter.
+
+    Args:
+        iterable: Source iterable (e.g. a video frame generator)
+        batch_size: Items per batch (values below 1 are treated as 1)
+
+    Yields:
+        Lists of consecutive items
+    """
+    batch_size = max(batch_size, 1)
+    batch: List[T] = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -1,11 +1,57 @@
 """Soccer pitch visualization utilities."""
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
 
 import cv2
 import numpy as np
 import supervision as sv
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is optional; the NumPy Voronoi implementation is used without it
+    njit = None
+    prange = range
+
+# Squared-distance sentinel for "no player"; finite so fastmath may assume no infs
+_FAR = 3.0e38
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)  # type: ignore[misc]
+    def _voronoi_fill(
+        team_1_xy: np.ndarray,
+        team_2_xy: np.ndarray,
+        height: int,
+        width: int,
+        padding: int,
+        team_1_color: np.ndarray,
+        team_2_color: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        """Colour each pixel by the team owning its nearest (pre-scaled) player."""
+        for y in prange(height):
+            py = np.float32(y - padding)
+            for x in range(width):
+                px = np.float32(x - padding)
+                best_1 = np.float32(_FAR)
+                for k in range(team_1_xy.shape[0]):
+                    dx = team_1_xy[k, 0] - px
+                    dy = team_1_xy[k, 1] - py
+                    best_1 = min(best_1, dx * dx + dy * dy)
+                best_2 = np.float32(_FAR)
+                for k in range(team_2_xy.shape[0]):
+                    dx = team_2_xy[k, 0] - px
+                    dy = team_2_xy[k, 1] - py
+                    best_2 = min(best_2, dx * dx + dy * dy)
+                color = team_1_color if best_1 < best_2 else team_2_color
+                for c in range(3):
+                    out[y, x, c] = color[c]
+
+else:
+    _voronoi_fill = None
+
 
 def draw_pitch(
     config: object,
@@ -42,27 +88,24 @@ def draw_pitch(
     scaled_circle_radius = int(config.centre_circle_radius * scale)
     scaled_penalty_spot_distance = int(config.penalty_spot_distance * scale)
 
-    pitch_image = np.ones(
+    # Single fill pass; ones * color would allocate and traverse twice
+    pitch_image = np.empty(
         (scaled_width + 2 * padding, scaled_length + 2 * padding, 3),
         dtype=np.uint8,
-    ) * np.array(background_color.as_bgr(), dtype=np.uint8)
+    )
+    pitch_image[:] = np.asarray(background_color.as_bgr(), dtype=np.uint8)
 
-    for start, end in config.edges:
-        point1 = (
-            int(config.vertices[start - 1][0] * scale) + padding,
-            int(config.vertices[start - 1][1] * scale) + padding,
-        )
-        point2 = (
-            int(config.vertices[end - 1][0] * scale) + padding,
-            int(config.vertices[end - 1][1] * scale) + padding,
-        )
-        cv2.line(
-            img=pitch_image,
-            pt1=point1,
-            pt2=point2,
-            color=line_color.as_bgr(),
-            thickness=line_thickness,
-        )
+    # Scale every vertex once and draw all edges as 2-point polylines in one call
+    scaled_vertices = (np.asarray(config.vertices, dtype=np.float64) * scale).astype(np.int32)
+    scaled_vertices += padding
+    segments = scaled_vertices[np.asarray(config.edges, dtype=np.intp).reshape(-1, 2) - 1]
+    cv2.polylines(
+        img=pitch_image,
+        pts=list(segments.reshape(-1, 2, 1, 2)),
+        isClosed=False,
+        color=line_color.as_bgr(),
+        thickness=line_thickness,
+    )
 
     centre_circle_center = (
         scaled_length // 2 + padding,
@@ -98,6 +141,44 @@ def draw_pitch(
     return pitch_image
 
 
+class _PitchGeometry(NamedTuple):
+    """Hashable snapshot of the config fields draw_pitch reads."""
+
+    width: float
+    length: float
+    centre_circle_radius: float
+    penalty_spot_distance: float
+    edges: Tuple[Tuple[int, int], ...]
+    vertices: Tuple[Tuple[float, float], ...]
+
+
+def _pitch_geometry(config: object) -> _PitchGeometry:
+    return _PitchGeometry(
+        width=config.width,
+        length=config.length,
+        centre_circle_radius=config.centre_circle_radius,
+        penalty_spot_distance=config.penalty_spot_distance,
+        edges=tuple(tuple(edge) for edge in config.edges),
+        vertices=tuple(tuple(vertex) for vertex in config.vertices),
+    )
+
+
+@lru_cache(maxsize=8)
+def _cached_pitch(geometry: _PitchGeometry, padding: int, scale: float) -> np.ndarray:
+    """Default-styled pitch, drawn once per geometry/padding/scale.
+
+    The returned image is read-only; callers draw on a copy.
+    """
+    pitch = draw_pitch(config=geometry, padding=padding, scale=scale)
+    pitch.flags.writeable = False
+    return pitch
+
+
+def _blank_pitch(config: object, padding: int, scale: float) -> np.ndarray:
+    """Get a writable default pitch image (a memcpy of the cached background)."""
+    return _cached_pitch(_pitch_geometry(config), padding, scale).copy()
+
+
 def draw_points_on_pitch(
     config: object,
     xy: np.ndarray,
@@ -130,25 +211,28 @@ def draw_points_on_pitch(
         np.ndarray: Image of soccer pitch with points drawn.
     """
     if pitch is None:
-        pitch = draw_pitch(config=config, padding=padding, scale=scale)
+        pitch = _blank_pitch(config, padding, scale)
 
-    for point in xy:
-        scaled_point = (
-            int(point[0] * scale) + padding,
-            int(point[1] * scale) + padding,
-        )
+    # Scale all points in one pass; astype truncates toward zero like int()
+    scaled_points = (np.asarray(xy, dtype=np.float64).reshape(-1, 2) * scale).astype(np.int32)
+    scaled_points += padding
+    face_bgr = face_color.as_bgr()
+    edge_bgr = edge_color.as_bgr()
+
+    for scaled_point in scaled_points.tolist():
+        center = (scaled_point[0], scaled_point[1])
         cv2.circle(
             img=pitch,
-            center=scaled_point,
+            center=center,
             radius=radius,
-            color=face_color.as_bgr(),
+            color=face_bgr,
             thickness=-1,
         )
         cv2.circle(
             img=pitch,
-            center=scaled_point,
+            center=center,
             radius=radius,
-            color=edge_color.as_bgr(),
+            color=edge_bgr,
             thickness=thickness,
         )
 
@@ -182,28 +266,28 @@ def draw_paths_on_pitch(
         np.ndarray: Image of soccer pitch with paths drawn.
     """
     if pitch is None:
-        pitch = draw_pitch(config=config, padding=padding, scale=scale)
+        pitch = _blank_pitch(config, padding, scale)
+
+    color_bgr = color.as_bgr()
 
     for path in paths:
-        scaled_path = [
-            (int(point[0] * scale) + padding, int(point[1] * scale) + padding)
-            for point in path
-            if point.size > 0
-        ]
+        # Empty entries mark frames where the object was not located
+        points = [point for point in path if point.size > 0]
 
-        if len(scaled_path) < 2:
+        if len(points) < 2:
             continue
 
-        for i in range(len(scaled_path) - 1):
-            cv2.line(
-                img=pitch,
-                pt1=scaled_path[i],
-                pt2=scaled_path[i + 1],
-                color=color.as_bgr(),
-                thickness=thickness,
-            )
+        scaled_path = (np.asarray(points, dtype=np.float64).reshape(-1, 2) * scale).astype(np.int32)
+        scaled_path += padding
 
-        return pitch
+        # One C call per path instead of one cv2.line per segment
+        cv2.polylines(
+            img=pitch,
+            pts=[scaled_path.reshape(-1, 1, 2)],
+            isClosed=False,
+            color=color_bgr,
+            thickness=thickness,
+        )
 
     return pitch
 
@@ -238,9 +322,14 @@ def draw_pitch_voronoi_diagram(
 
     Returns:
         np.ndarray: Image of soccer pitch with Voronoi diagram overlay.
+
+    Raises:
+        ValueError: If ``pitch`` does not match the size given by ``config``,
+            ``padding`` and ``scale``.
     """
     if pitch is None:
-        pitch = draw_pitch(config=config, padding=padding, scale=scale)
+        # Only read by addWeighted below, so the cached image needs no copy
+        pitch = _cached_pitch(_pitch_geometry(config), padding, scale)
 
     scaled_width = int(config.width * scale)
     scaled_length = int(config.length * scale)
@@ -250,31 +339,56 @@ def draw_pitch_voronoi_diagram(
     team_1_color_bgr = np.array(team_1_color.as_bgr(), dtype=np.uint8)
     team_2_color_bgr = np.array(team_2_color.as_bgr(), dtype=np.uint8)
 
-    y_coordinates, x_coordinates = np.indices(
-        (scaled_width + 2 * padding, scaled_length + 2 * padding)
-    )
-
-    y_coordinates = y_coordinates.astype(np.float32) - padding
-    x_coordinates = x_coordinates.astype(np.float32) - padding
-
-    def calculate_distances(xy: np.ndarray) -> np.ndarray:
-        """Calculate distances from points to all grid coordinates."""
-        return np.sqrt(
-            (xy[:, 0][:, None, None] * scale - x_coordinates) ** 2
-            + (xy[:, 1][:, None, None] * scale - y_coordinates) ** 2
+    height = scaled_width + 2 * padding
+    width = scaled_length + 2 * padding
+    # The numba kernel writes (height, width) pixels without bounds checks
+    if voronoi.shape != (height, width, 3):
+        raise ValueError(
+            f"pitch must have shape {(height, width, 3)} for this config, padding "
+            f"and scale, got {voronoi.shape}"
         )
-
-    distances_team_1 = calculate_distances(team_1_xy)
-    distances_team_2 = calculate_distances(team_2_xy)
-
-    min_distances_team_1 = np.min(distances_team_1, axis=0)
-    min_distances_team_2 = np.min(distances_team_2, axis=0)
-
-    control_mask = min_distances_team_1 < min_distances_team_2
-
-    voronoi[control_mask] = team_1_color_bgr
-    voronoi[~control_mask] = team_2_color_bgr
-
-    overlay = cv2.addWeighted(voronoi, opacity, pitch, 1 - opacity, 0)
+    team_1_scaled = np.asarray(team_1_xy, dtype=np.float32).reshape(-1, 2) * np.float32(scale)
+    team_2_scaled = np.asarray(team_2_xy, dtype=np.float32).reshape(-1, 2) * np.float32(scale)
+
+    if _voronoi_fill is not None:
+        # Fused parallel kernel: no per-pixel temporaries
+        _voronoi_fill(
+            team_1_scaled,
+            team_2_scaled,
+            height,
+            width,
+            padding,
+            team_1_color_bgr,
+            team_2_color_bgr,
+            voronoi,
+        )
+    else:
+        # 1D pixel-centre coordinates; broadcasting (1, W) against (H, 1)
+        # avoids materialising full coordinate grids
+        x_coordinates = np.arange(width, dtype=np.float32) - padding
+        y_coordinates = np.arange(height, dtype=np.float32) - padding
+
+        def min_squared_distances(xy: np.ndarray) -> np.ndarray:
+            """Running minimum of squared distances from points to every pixel.
+
+            sqrt is monotone, so squared distances give the same nearest point.
+            """
+            best = np.full((height, width), _FAR, dtype=np.float32)
+            dy = np.empty((height, 1), dtype=np.float32)
+            dx = np.empty((1, width), dtype=np.float32)
+            for px, py in xy:
+                np.square(py - y_coordinates, out=dy[:, 0])
+                np.square(px - x_coordinates, out=dx[0])
+                np.minimum(best, dy + dx, out=best)
+            return best
+
+        control_mask = min_squared_distances(team_1_scaled) < min_squared_distances(team_2_scaled)
+
+        # Plain fill + one masked write; avoids building and indexing ~control_mask
+        voronoi[:] = team_2_color_bgr
+        voronoi[control_mask] = team_1_color_bgr
+
+    # Blend into the voronoi buffer itself rather than allocating another image
+    overlay = cv2.addWeighted(voronoi, opacity, pitch, 1 - opacity, 0, dst=voronoi)
 
     return overlay
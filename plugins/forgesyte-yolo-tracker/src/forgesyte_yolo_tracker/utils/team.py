@@ -1,10 +1,12 @@
 """Team classification utilities."""
 
+import logging
 from typing import Generator, Iterable, List, TypeVar
 
+import cv2
 import numpy as np
-import supervision as sv
 import torch
+from PIL import Image
 from sklearn.cluster import KMeans
 from tqdm import tqdm
 from transformers import AutoProcessor, SiglipVisionModel
@@ -15,10 +17,22 @@ except ImportError:
     # umap is optional and may not be installed
     umap = None  # type: ignore[assignment]
 
+logger = logging.getLogger(__name__)
+
 V = TypeVar("V")
 
 SIGLIP_MODEL_PATH = "google/siglip-base-patch16-224"
 
+# OpenCV equivalents of the PIL filters Hugging Face image processors resize with
+_CV2_INTERPOLATION = {
+    Image.Resampling.NEAREST: cv2.INTER_NEAREST,
+    Image.Resampling.BILINEAR: cv2.INTER_LINEAR,
+    Image.Resampling.BICUBIC: cv2.INTER_CUBIC,
+    Image.Resampling.LANCZOS: cv2.INTER_LANCZOS4,
+    Image.Resampling.BOX: cv2.INTER_AREA,
+    Image.Resampling.HAMMING: cv2.INTER_LINEAR,
+}
+
 
 def create_batches(sequence: Iterable[V], batch_size: int) -> Generator[List[V], None, None]:
     """
@@ -43,24 +57,58 @@ def create_batches(sequence: Iterable[V], batch_size: int) -> Generator[List[V],
         yield current_batch
 
 
+def quantize_for_cpu(model: torch.nn.Module) -> torch.nn.Module:
+    """
+    Dynamically quantize a model's linear layers to INT8 for CPU inference.
+
+    Weights are stored as int8 and activations are quantized on the fly, so
+    the transformer GEMMs run on int8 kernels and model memory roughly halves.
+    Falls back to the original model if quantization is not supported.
+
+    Args:
+        model (torch.nn.Module): The FP32 model to quantize.
+
+    Returns:
+        torch.nn.Module: The quantized model, or the original model on failure.
+    """
+    try:
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    except Exception as e:
+        logger.warning(f"INT8 quantization unavailable, using FP32 model: {e}")
+        return model
+
+
 class TeamClassifier:
     """
     A classifier that uses a pre-trained SiglipVisionModel for feature extraction,
     UMAP for dimensionality reduction, and KMeans for clustering.
     """
 
-    def __init__(self, device: str = "cpu", batch_size: int = 32) -> None:
+    def __init__(self, device: str = "cpu", batch_size: int = 32, quantize: bool = True) -> None:
         """
         Initialize the TeamClassifier with device and batch size.
 
         Args:
             device (str): The device to run the model on ('cpu' or 'cuda').
             batch_size (int): The batch size for processing images.
+            quantize (bool): On CPU, quantize the SigLIP linear layers to INT8.
         """
         self.device = device
         self.batch_size = batch_size
         self.features_model = SiglipVisionModel.from_pretrained(SIGLIP_MODEL_PATH).to(device)
+        if quantize and device == "cpu":
+            self.features_model = quantize_for_cpu(self.features_model)
         self.processor = AutoProcessor.from_pretrained(SIGLIP_MODEL_PATH)
+        # SigLIP's preprocessing, applied to whole batches by _pixel_values()
+        image_processor = getattr(self.processor, "image_processor", self.processor)
+        self._input_hw = (int(image_processor.size["height"]), int(image_processor.size["width"]))
+        # SigLIP resizes with BICUBIC by default
+        self._interpolation = _CV2_INTERPOLATION.get(
+            getattr(image_processor, "resample", Image.Resampling.BICUBIC), cv2.INTER_CUBIC
+        )
+        self._rescale_factor = float(image_processor.rescale_factor)
+        self._image_mean = [float(v) for v in image_processor.image_mean]
+        self._image_std = [float(v) for v in image_processor.image_std]
         if umap is not None:
             self.reducer = umap.UMAP(n_components=3)
         else:
@@ -70,24 +118,57 @@ class TeamClassifier:
             self.reducer = StandardScaler()  # type: ignore[assignment]
         self.cluster_model = KMeans(n_clusters=2)
 
+    def _pixel_values(self, crops: List[np.ndarray]) -> torch.Tensor:
+        """
+        Preprocess a batch of crops the way the SigLIP processor does.
+
+        Crops are resized with OpenCV, using the OpenCV counterpart of the
+        processor's resample filter, straight into one preallocated uint8
+        array, then moved to the device in a single copy, where the channel
+        swap, rescale and normalization run on the whole batch. This replaces
+        converting and resizing every crop through PIL. OpenCV's filters do
+        not antialias or weight pixels exactly like PIL's, so values can
+        differ from the processor's by a few intensity levels.
+
+        Args:
+            crops (List[np.ndarray]): BGR image crops of any size.
+
+        Returns:
+            torch.Tensor: Normalized RGB batch of shape (N, 3, H, W).
+        """
+        height, width = self._input_hw
+        batch = np.empty((len(crops), height, width, 3), dtype=np.uint8)
+        for crop, dst in zip(crops, batch):
+            cv2.resize(crop, (width, height), dst=dst, interpolation=self._interpolation)
+
+        pixels = torch.from_numpy(batch)
+        if str(self.device).startswith("cuda"):
+            # Page-locked memory lets the host-to-device copy run asynchronously
+            pixels = pixels.pin_memory()
+        pixels = pixels.to(self.device, non_blocking=True)
+
+        # NHWC BGR uint8 -> NCHW RGB float
+        pixels = pixels.permute(0, 3, 1, 2).flip(1).float()
+        mean = torch.tensor(self._image_mean, device=pixels.device).view(1, -1, 1, 1)
+        std = torch.tensor(self._image_std, device=pixels.device).view(1, -1, 1, 1)
+        return (pixels * self._rescale_factor - mean) / std
+
     def extract_features(self, crops: List[np.ndarray]) -> np.ndarray:
         """
         Extract features from a list of image crops using the pre-trained
         SiglipVisionModel.
 
         Args:
-            crops (List[np.ndarray]): List of image crops.
+            crops (List[np.ndarray]): List of BGR image crops.
 
         Returns:
             np.ndarray: Extracted features as a numpy array.
         """
-        crops_pil = [sv.cv2_to_pillow(crop) for crop in crops]
-        batches = create_batches(crops_pil, self.batch_size)
+        batches = create_batches(crops, self.batch_size)
         data = []
         with torch.no_grad():
             for batch in tqdm(batches, desc="Embedding extraction"):
-                inputs = self.processor(images=batch, return_tensors="pt").to(self.device)
-                outputs = self.features_model(**inputs)
+                outputs = self.features_model(pixel_values=self._pixel_values(batch))
                 embeddings = torch.mean(outputs.last_hidden_state, dim=1).cpu().numpy()
                 data.append(embeddings)
 
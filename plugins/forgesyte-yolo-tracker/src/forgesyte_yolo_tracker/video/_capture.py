@@ -0,0 +1,65 @@
+"""Video frame reader for the video modules.
+
+sv.get_video_frames_generator opens a plain cv2.VideoCapture, so FFmpeg
+decodes on the CPU. Here the capture asks FFmpeg for any available hardware
+decoder (VAAPI, D3D11, NVDEC, ...) and falls back to software decoding when
+none is available or OpenCV predates the hardware acceleration API.
+"""
+
+import logging
+from typing import Any, Iterator
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _open_capture(source_path: str) -> Any:
+    """Open a capture, preferring hardware-accelerated decoding.
+
+    Args:
+        source_path: Path to the video file
+
+    Returns:
+        Opened cv2.VideoCapture
+
+    Raises:
+        ValueError: If the video cannot be opened
+    """
+    hw_property = getattr(cv2, "CAP_PROP_HW_ACCELERATION", None)
+    hw_any = getattr(cv2, "VIDEO_ACCELERATION_ANY", None)
+    if hw_property is not None and hw_any is not None:
+        capture = cv2.VideoCapture(source_path, cv2.CAP_FFMPEG, [hw_property, hw_any])
+        if capture.isOpened():
+            return capture
+        capture.release()
+        logger.debug(f"Hardware-accelerated capture unavailable for {source_path}")
+
+    capture = cv2.VideoCapture(source_path)
+    if not capture.isOpened():
+        raise ValueError(f"Could not open video at {source_path}")
+    return capture
+
+
+def get_video_frames(source_path: str) -> Iterator[np.ndarray]:
+    """Yield BGR frames from a video file.
+
+    Args:
+        source_path: Path to the video file
+
+    Yields:
+        Decoded frames as numpy arrays
+
+    Raises:
+        ValueError: If the video cannot be opened
+    """
+    capture = _open_capture(source_path)
+    try:
+        while True:
+            success, frame = capture.read()
+            if not success:
+                break
+            yield frame
+    finally:
+        capture.release()
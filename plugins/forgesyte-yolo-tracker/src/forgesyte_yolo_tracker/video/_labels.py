@@ -0,0 +1,42 @@
+"""Class-ID to label-string lookup for the video modules' annotators."""
+
+from typing import Dict, List
+
+import numpy as np
+
+
+class LabelTable:
+    """Precomputed label strings indexed by class ID.
+
+    Labels are built once, so each frame turns its class IDs into labels with
+    one NumPy gather instead of a dict lookup and string format per detection.
+    IDs outside the table fall back to ``class_<id>``.
+    """
+
+    def __init__(self, class_names: Dict[int, str]) -> None:
+        """Build the table.
+
+        Args:
+            class_names: Dict mapping class IDs to display names
+        """
+        size = max(class_names, default=-1) + 1
+        self._labels = np.array(
+            [class_names.get(i, f"class_{i}") for i in range(size)], dtype=object
+        )
+
+    def __call__(self, class_ids: np.ndarray) -> List[str]:
+        """Look up the label of every class ID.
+
+        Args:
+            class_ids: Array of class IDs
+
+        Returns:
+            One label per ID, in input order
+        """
+        class_ids = np.asarray(class_ids, dtype=np.int64)
+        if class_ids.size and (class_ids.min() < 0 or class_ids.max() >= len(self._labels)):
+            return [
+                self._labels[i] if 0 <= i < len(self._labels) else f"class_{i}"
+                for i in class_ids.tolist()
+            ]
+        return self._labels.take(class_ids).tolist()
@@ -0,0 +1,96 @@
+"""Video file writer for the video modules.
+
+sv.VideoSink opens a plain cv2.VideoWriter, so every frame is encoded in
+software. Here the writer first asks FFmpeg for a hardware H.264 encoder
+(NVENC, VAAPI, QSV, MSMF, ...) and falls back to the same software MPEG-4
+writer sv.VideoSink uses when none is available or OpenCV predates the
+hardware acceleration API.
+"""
+
+import logging
+from typing import Any, Optional, Tuple
+
+import cv2
+import numpy as np
+import supervision as sv
+
+logger = logging.getLogger(__name__)
+
+HW_CODEC = "avc1"
+FALLBACK_CODEC = "mp4v"
+
+
+def _open_writer(target_path: str, fps: float, size: Tuple[int, int]) -> Any:
+    """Open a writer, preferring hardware-accelerated encoding.
+
+    Args:
+        target_path: Path of the output video
+        fps: Output frame rate
+        size: Frame (width, height)
+
+    Returns:
+        Opened cv2.VideoWriter
+
+    Raises:
+        RuntimeError: If no writer can be opened for the path
+    """
+    hw_property = getattr(cv2, "VIDEOWRITER_PROP_HW_ACCELERATION", None)
+    hw_any = getattr(cv2, "VIDEO_ACCELERATION_ANY", None)
+    if hw_property is not None and hw_any is not None:
+        writer = cv2.VideoWriter(
+            target_path,
+            cv2.CAP_FFMPEG,
+            cv2.VideoWriter_fourcc(*HW_CODEC),
+            fps,
+            size,
+            [hw_property, hw_any],
+        )
+        if writer.isOpened():
+            return writer
+        writer.release()
+        logger.debug(f"Hardware-accelerated writer unavailable for {target_path}")
+
+    writer = cv2.VideoWriter(target_path, cv2.VideoWriter_fourcc(*FALLBACK_CODEC), fps, size)
+    if not writer.isOpened():
+        writer.release()
+        raise RuntimeError(f"Could not open video writer for {target_path}")
+    return writer
+
+
+class HWVideoSink:
+    """Drop-in replacement for sv.VideoSink that prefers hardware encoding."""
+
+    def __init__(self, target_path: str, video_info: sv.VideoInfo) -> None:
+        """Store the output settings; the writer opens on ``__enter__``.
+
+        Args:
+            target_path: Path of the output video
+            video_info: Source video info providing fps and resolution
+        """
+        self.target_path = target_path
+        self.video_info = video_info
+        self._writer: Optional[Any] = None
+
+    def __enter__(self) -> "HWVideoSink":
+        self._writer = _open_writer(
+            self.target_path, self.video_info.fps, self.video_info.resolution_wh
+        )
+        return self
+
+    def write_frame(self, frame: np.ndarray) -> None:
+        """Write one BGR frame.
+
+        Args:
+            frame: Frame of the video's resolution
+
+        Raises:
+            RuntimeError: If called outside the ``with`` block
+        """
+        if self._writer is None:
+            raise RuntimeError("write_frame requires an open HWVideoSink context")
+        self._writer.write(frame)
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
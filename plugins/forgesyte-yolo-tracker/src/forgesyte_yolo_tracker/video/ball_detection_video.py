@@ -6,48 +6,59 @@ Roboflow-style full video processing:
 """
 
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import ContextManager, Iterator
 
 import numpy as np
 import supervision as sv
 from ultralytics import YOLO
 
 from forgesyte_yolo_tracker.configs import get_model_path
+from forgesyte_yolo_tracker.inference._base_detector import (
+    checkout_model as _checkout_model,
+    use_half_precision,
+)
+from forgesyte_yolo_tracker.utils.prefetch import batched, prefetch
+from forgesyte_yolo_tracker.video._capture import get_video_frames
+from forgesyte_yolo_tracker.video._sink import HWVideoSink
 
 MODEL_NAME = get_model_path("ball_detection")
 MODEL_PATH = str(Path(__file__).parent.parent / "models" / MODEL_NAME)
 BALL_COLOR = sv.Color.from_hex("#FF6347")
 DEFAULT_CONFIDENCE = 0.20
+# Frames per model call at imgsz=640
+DEFAULT_BATCH_SIZE = 8
 
-_model: Optional[YOLO] = None
 
-
-def get_model(device: str = "cpu") -> YOLO:
-    global _model
-    if _model is None:
-        _model = YOLO(MODEL_PATH).to(device=device)
-    return _model
+def checkout_model(device: str = "cpu") -> ContextManager[YOLO]:
+    """Borrow a pooled YOLO model for this device for the length of one stream."""
+    return _checkout_model(MODEL_PATH, device, half=use_half_precision(device))
 
 
 def run_ball_detection_video_frames(
     source_video_path: str,
     device: str = "cpu",
     confidence: float = DEFAULT_CONFIDENCE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> Iterator[np.ndarray]:
-    """Generate ball detection frames from video."""
-    model = get_model(device)
-    frame_generator = sv.get_video_frames_generator(source_path=source_video_path)
+    """Generate ball detection frames from video.
+
+    Frames are sent to the model ``batch_size`` at a time, in FP16 on CUDA.
+    """
+    with checkout_model(device) as model:
+        half = use_half_precision(device)
+        frame_generator = get_video_frames(source_video_path)
 
-    box_annotator = sv.BoxAnnotator(color=BALL_COLOR, thickness=2)
+        box_annotator = sv.BoxAnnotator(color=BALL_COLOR, thickness=2)
 
-    for frame in frame_generator:
-        result = model(frame, imgsz=640, conf=confidence, verbose=False)[0]
-        detections = sv.Detections.from_ultralytics(result)
+        # Reader stage: decode the next frames while this batch is inferred
+        for batch in batched(prefetch(frame_generator), batch_size):
+            results = model(batch, imgsz=640, conf=confidence, half=half, verbose=False)
 
-        annotated = frame.copy()
-        annotated = box_annotator.annotate(annotated, detections)
+            for frame, result in zip(batch, results):
+                detections = sv.Detections.from_ultralytics(result)
 
-        yield annotated
+                # Frames are freshly decoded and never reused, so draw in place
+                yield box_annotator.annotate(frame, detections)
 
 
 def run_ball_detection_video(
@@ -55,6 +66,7 @@ def run_ball_detection_video(
     target_video_path: str,
     device: str = "cpu",
     confidence: float = DEFAULT_CONFIDENCE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> None:
     """Process video and save ball detection output."""
     if not source_video_path:
@@ -63,10 +75,14 @@ def run_ball_detection_video(
             "detail": "video_path must be provided"
         }
     video_info = sv.VideoInfo.from_video_path(source_video_path)
-    with sv.VideoSink(target_video_path, video_info) as sink:
-        for frame in run_ball_detection_video_frames(
-            source_video_path=source_video_path,
-            device=device,
-            confidence=confidence,
+    with HWVideoSink(target_video_path, video_info) as sink:
+        # Inference stage runs on its own thread; this thread only encodes
+        for frame in prefetch(
+            run_ball_detection_video_frames(
+                source_video_path=source_video_path,
+                device=device,
+                confidence=confidence,
+                batch_size=batch_size,
+            )
         ):
             sink.write_frame(frame)
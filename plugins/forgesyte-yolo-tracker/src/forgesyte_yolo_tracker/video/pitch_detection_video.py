@@ -6,7 +6,7 @@ Roboflow-style full video processing:
 """
 
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import ContextManager, Iterator
 
 import cv2
 import numpy as np
@@ -15,6 +15,13 @@ from ultralytics import YOLO
 
 from forgesyte_yolo_tracker.configs import get_model_path
 from forgesyte_yolo_tracker.configs.soccer import SoccerPitchConfiguration
+from forgesyte_yolo_tracker.inference._base_detector import (
+    checkout_model as _checkout_model,
+    use_half_precision,
+)
+from forgesyte_yolo_tracker.utils.prefetch import batched, prefetch
+from forgesyte_yolo_tracker.video._capture import get_video_frames
+from forgesyte_yolo_tracker.video._sink import HWVideoSink
 
 MODEL_NAME = get_model_path("pitch_detection")
 MODEL_PATH = str(Path(__file__).parent.parent / "models" / MODEL_NAME)
@@ -22,55 +29,64 @@ CONFIG = SoccerPitchConfiguration()
 
 PITCH_COLOR = sv.Color.from_hex("#00FF00")
 KEYPOINT_COLOR = sv.Color.from_hex("#FF0000")
+# Display labels built once; keypoint_names rebuilds its dict on each access
+KEYPOINT_LABELS = {i: name.replace("_", " ") for i, name in CONFIG.keypoint_names.items()}
 DEFAULT_CONFIDENCE = 0.25
+# Frames per model call; kept small since imgsz=1280 inputs are large
+DEFAULT_BATCH_SIZE = 2
 
-_model: Optional[YOLO] = None
 
-
-def get_model(device: str = "cpu") -> YOLO:
-    global _model
-    if _model is None:
-        _model = YOLO(MODEL_PATH).to(device=device)
-    return _model
+def checkout_model(device: str = "cpu") -> ContextManager[YOLO]:
+    """Borrow a pooled YOLO model for this device for the length of one stream."""
+    return _checkout_model(MODEL_PATH, device, half=use_half_precision(device))
 
 
 def run_pitch_detection_video_frames(
     source_video_path: str,
     device: str = "cpu",
     confidence: float = DEFAULT_CONFIDENCE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> Iterator[np.ndarray]:
-    """Generate pitch detection frames from video."""
-    model = get_model(device)
-    frame_generator = sv.get_video_frames_generator(source_path=source_video_path)
-
-    for frame in frame_generator:
-        result = model(frame, imgsz=1280, conf=confidence, verbose=False)[0]
-        annotated = frame.copy()
-
-        if result.keypoints is not None and result.keypoints.xy is not None:
-            keypoints_xy = result.keypoints.xy.cpu().numpy()[0]
-            keypoints_conf = (
-                result.keypoints.conf.cpu().numpy()[0]
-                if result.keypoints.conf is not None
-                else None
-            )
-
-            for i, (x, y) in enumerate(keypoints_xy):
-                conf = keypoints_conf[i] if keypoints_conf is not None else 1.0
-                if conf > confidence * 0.5:
-                    x_int, y_int = int(x), int(y)
-                    cv2.circle(annotated, (x_int, y_int), 5, (0, 0, 255), -1)
-                    name = CONFIG.keypoint_names.get(i, f"kp_{i}")
-                    cv2.putText(
-                        annotated,
-                        name.replace("_", " "),
-                        (x_int + 5, y_int),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.4,
-                        (0, 0, 255),
+    """Generate pitch detection frames from video.
+
+    Frames are sent to the model ``batch_size`` at a time, in FP16 on CUDA.
+    """
+    with checkout_model(device) as model:
+        half = use_half_precision(device)
+        frame_generator = get_video_frames(source_video_path)
+
+        # Reader stage: decode the next frames while this batch is inferred
+        for batch in batched(prefetch(frame_generator), batch_size):
+            results = model(batch, imgsz=1280, conf=confidence, half=half, verbose=False)
+
+            for frame, result in zip(batch, results):
+                # Frames are freshly decoded and never reused, so draw in place
+                annotated = frame
+
+                if result.keypoints is not None and result.keypoints.xy is not None:
+                    keypoints_xy = result.keypoints.xy.cpu().numpy()[0]
+                    keypoints_conf = (
+                        result.keypoints.conf.cpu().numpy()[0]
+                        if result.keypoints.conf is not None
+                        else np.ones(len(keypoints_xy), dtype=np.float32)
                     )
 
-        yield annotated
+                    # Filter and truncate coordinates in NumPy; only drawing loops
+                    visible = np.flatnonzero(keypoints_conf > confidence * 0.5)
+                    points = keypoints_xy[visible].astype(np.int32)
+
+                    for i, (x_int, y_int) in zip(visible.tolist(), points.tolist()):
+                        cv2.circle(annotated, (x_int, y_int), 5, (0, 0, 255), -1)
+                        cv2.putText(
+                            annotated,
+                            KEYPOINT_LABELS.get(i, f"kp {i}"),
+                            (x_int + 5, y_int),
+                            cv2.FONT_HERSHEY_SIMPLEX,
+                            0.4,
+                            (0, 0, 255),
+                        )
+
+                yield annotated
 
 
 def run_pitch_detection_video(
@@ -78,6 +94,7 @@ def run_pitch_detection_video(
     target_video_path: str,
     device: str = "cpu",
     confidence: float = DEFAULT_CONFIDENCE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> None:
     """Process video and save pitch detection output."""
     if not source_video_path:
@@ -86,10 +103,14 @@ def run_pitch_detection_video(
             "detail": "video_path must be provided"
         }
     video_info = sv.VideoInfo.from_video_path(source_video_path)
-    with sv.VideoSink(target_video_path, video_info) as sink:
-        for frame in run_pitch_detection_video_frames(
-            source_video_path=source_video_path,
-            device=device,
-            confidence=confidence,
+    with HWVideoSink(target_video_path, video_info) as sink:
+        # Inference stage runs on its own thread; this thread only encodes
+        for frame in prefetch(
+            run_pitch_detection_video_frames(
+                source_video_path=source_video_path,
+                device=device,
+                confidence=confidence,
+                batch_size=batch_size,
+            )
         ):
             sink.write_frame(frame)
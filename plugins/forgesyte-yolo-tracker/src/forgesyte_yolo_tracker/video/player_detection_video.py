@@ -6,7 +6,7 @@ Roboflow-style full video processing:
 """
 
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import ContextManager, Iterable, Iterator, Tuple
 
 import numpy as np
 import supervision as sv
@@ -14,34 +14,55 @@ from ultralytics import YOLO
 
 from forgesyte_yolo_tracker.configs import get_model_path
 from forgesyte_yolo_tracker.configs.soccer import SoccerPitchConfiguration
+from forgesyte_yolo_tracker.inference._base_detector import (
+    checkout_model as _checkout_model,
+    use_half_precision,
+)
+from forgesyte_yolo_tracker.utils.prefetch import batched, prefetch
+from forgesyte_yolo_tracker.video._capture import get_video_frames
+from forgesyte_yolo_tracker.video._labels import LabelTable
+from forgesyte_yolo_tracker.video._sink import HWVideoSink
 
 MODEL_NAME = get_model_path("player_detection")
 MODEL_PATH = str(Path(__file__).parent.parent / "models" / MODEL_NAME)
 CONFIG = SoccerPitchConfiguration()
 
 CLASS_NAMES = {0: "player", 1: "goalkeeper", 2: "referee"}
+CLASS_LABELS = LabelTable(CLASS_NAMES)
 TEAM_COLORS = {
     0: "#00BFFF",  # Team A
     1: "#FFD700",  # Goalkeeper
     2: "#FF6347",  # Referee
 }
 DEFAULT_CONFIDENCE = 0.25
+# Frames per model call; kept small since imgsz=1280 inputs are large
+DEFAULT_BATCH_SIZE = 2
 
-_model: Optional[YOLO] = None
 
+def checkout_model(device: str = "cpu") -> ContextManager[YOLO]:
+    """Borrow a pooled YOLO model for this device for the length of one stream."""
+    return _checkout_model(MODEL_PATH, device, half=use_half_precision(device))
 
-def get_model(device: str = "cpu") -> YOLO:
-    """Get or create cached YOLO model."""
-    global _model
-    if _model is None:
-        _model = YOLO(MODEL_PATH).to(device=device)
-    return _model
+
+def _detect_frames(
+    model: YOLO,
+    frames: Iterable[np.ndarray],
+    confidence: float,
+    batch_size: int,
+    half: bool,
+) -> Iterator[Tuple[np.ndarray, sv.Detections]]:
+    """Inference stage: run the model ``batch_size`` frames at a time."""
+    for batch in batched(frames, batch_size):
+        results = model(batch, imgsz=1280, conf=confidence, half=half, verbose=False)
+        for frame, result in zip(batch, results):
+            yield frame, sv.Detections.from_ultralytics(result)
 
 
 def run_player_detection_video_frames(
     source_video_path: str,
     device: str = "cpu",
     confidence: float = DEFAULT_CONFIDENCE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> Iterator[np.ndarray]:
     """Generate annotated frames from video.
 
@@ -49,33 +70,46 @@ def run_player_detection_video_frames(
         source_video_path: Path to input video
         device: Device to run model on ('cpu' or 'cuda')
         confidence: Detection confidence threshold
+        batch_size: Frames sent to the model per call
 
     Yields:
         Annotated frames as numpy arrays
     """
-    model = get_model(device)
-    frame_generator = sv.get_video_frames_generator(source_path=source_video_path)
-
-    colors = sv.ColorPalette.from_hex(list(TEAM_COLORS.values()))
-    box_annotator = sv.BoxAnnotator(color=colors, thickness=2)
-    label_annotator = sv.LabelAnnotator(
-        color=colors,
-        text_color=sv.Color.from_hex("#FFFFFF"),
-        text_padding=5,
-        text_thickness=1,
-    )
-
-    for frame in frame_generator:
-        result = model(frame, imgsz=1280, conf=confidence, verbose=False)[0]
-        detections = sv.Detections.from_ultralytics(result)
-
-        labels = [CLASS_NAMES.get(int(cls), f"class_{cls}") for cls in detections.class_id]
-
-        annotated = frame.copy()
-        annotated = box_annotator.annotate(annotated, detections)
-        annotated = label_annotator.annotate(annotated, detections, labels=labels)
-
-        yield annotated
+    with checkout_model(device) as model:
+        frame_generator = get_video_frames(source_video_path)
+
+        colors = sv.ColorPalette.from_hex(list(TEAM_COLORS.values()))
+        box_annotator = sv.BoxAnnotator(color=colors, thickness=2)
+        label_annotator = sv.LabelAnnotator(
+            color=colors,
+            text_color=sv.Color.from_hex("#FFFFFF"),
+            text_padding=5,
+            text_thickness=1,
+        )
+
+        # Reader and inference stages each run on their own thread, so decoding,
+        # inference and the annotation below overlap
+        detected = prefetch(
+            _detect_frames(
+                model,
+                prefetch(frame_generator),
+                confidence,
+                batch_size,
+                half=use_half_precision(device),
+            )
+        )
+        try:
+            for frame, detections in detected:
+                labels = CLASS_LABELS(detections.class_id)
+
+                # Frames are freshly decoded and never reused, so draw in place
+                annotated = box_annotator.annotate(frame, detections)
+                annotated = label_annotator.annotate(annotated, detections, labels=labels)
+
+                yield annotated
+        finally:
+            # Wait for the inference thread before the model goes back to the pool
+            detected.close()
 
 
 def run_player_detection_video(
@@ -83,6 +117,7 @@ def run_player_detection_video(
     target_video_path: str,
     device: str = "cpu",
     confidence: float = DEFAULT_CONFIDENCE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> None:
     """Process video and save annotated output.
 
@@ -91,6 +126,7 @@ def run_player_detection_video(
         target_video_path: Path to output video
         device: Device to run model on ('cpu' or 'cuda')
         confidence: Detection confidence threshold
+        batch_size: Frames sent to the model per call
     """
     if not source_video_path:
         return {
@@ -98,10 +134,14 @@ def run_player_detection_video(
             "detail": "video_path must be provided"
         }
     video_info = sv.VideoInfo.from_video_path(source_video_path)
-    with sv.VideoSink(target_video_path, video_info) as sink:
-        for frame in run_player_detection_video_frames(
-            source_video_path=source_video_path,
-            device=device,
-            confidence=confidence,
+    with HWVideoSink(target_video_path, video_info) as sink:
+        # Inference stage runs on its own thread; this thread only encodes
+        for frame in prefetch(
+            run_player_detection_video_frames(
+                source_video_path=source_video_path,
+                device=device,
+                confidence=confidence,
+                batch_size=batch_size,
+            )
         ):
             sink.write_frame(frame)
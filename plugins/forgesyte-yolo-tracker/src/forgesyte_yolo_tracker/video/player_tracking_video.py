@@ -6,65 +6,112 @@ Roboflow-style full video processing with ByteTrack:
 """
 
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import ContextManager, Iterable, Iterator, Tuple
 
 import numpy as np
 import supervision as sv
 from ultralytics import YOLO
 
 from forgesyte_yolo_tracker.configs import get_model_path
-from forgesyte_yolo_tracker.tracking import ByteTrackFactory
+from forgesyte_yolo_tracker.tracking import ByteTrackFactory, get_tracker_ids
+from forgesyte_yolo_tracker.inference._base_detector import (
+    checkout_model as _checkout_model,
+    use_half_precision,
+)
+from forgesyte_yolo_tracker.utils.prefetch import batched, prefetch
+from forgesyte_yolo_tracker.video._capture import get_video_frames
+from forgesyte_yolo_tracker.video._labels import LabelTable
+from forgesyte_yolo_tracker.video._sink import HWVideoSink
 
 MODEL_NAME = get_model_path("player_detection")
 MODEL_PATH = str(Path(__file__).parent.parent / "models" / MODEL_NAME)
 
 CLASS_NAMES = {0: "player", 1: "goalkeeper", 2: "referee"}
+CLASS_LABELS = LabelTable(CLASS_NAMES)
 TRACK_COLORS = sv.ColorPalette.from_hex(["#00BFFF", "#FFD700", "#FF6347"])
 DEFAULT_CONFIDENCE = 0.25
+# Frames per model call; kept small since imgsz=1280 inputs are large
+DEFAULT_BATCH_SIZE = 2
 
-_model: Optional[YOLO] = None
 
+def checkout_model(device: str = "cpu") -> ContextManager[YOLO]:
+    """Borrow a pooled YOLO model for this device for the length of one stream."""
+    return _checkout_model(MODEL_PATH, device, half=use_half_precision(device))
 
-def get_model(device: str = "cpu") -> YOLO:
-    global _model
-    if _model is None:
-        _model = YOLO(MODEL_PATH).to(device=device)
-    return _model
+
+def _track_frames(
+    model: YOLO,
+    tracker: sv.ByteTrack,
+    frames: Iterable[np.ndarray],
+    confidence: float,
+    batch_size: int,
+    half: bool,
+) -> Iterator[Tuple[np.ndarray, sv.Detections]]:
+    """Inference stage: run the model ``batch_size`` frames at a time and track.
+
+    Results come back in frame order, so the tracker still sees one frame at
+    a time.
+    """
+    for batch in batched(frames, batch_size):
+        results = model(batch, imgsz=1280, conf=confidence, half=half, verbose=False)
+        for frame, result in zip(batch, results):
+            detections = sv.Detections.from_ultralytics(result)
+            yield frame, tracker.update_with_detections(detections)
 
 
 def run_player_tracking_video_frames(
     source_video_path: str,
     device: str = "cpu",
     confidence: float = DEFAULT_CONFIDENCE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> Iterator[np.ndarray]:
-    """Generate tracked frames from video."""
-    model = get_model(device)
-    tracker = ByteTrackFactory.get()
-    frame_generator = sv.get_video_frames_generator(source_path=source_video_path)
-
-    box_annotator = sv.BoxAnnotator(color=TRACK_COLORS, thickness=2)
-    label_annotator = sv.LabelAnnotator(
-        color=TRACK_COLORS,
-        text_color=sv.Color.from_hex("#FFFFFF"),
-        text_padding=5,
-        text_thickness=1,
-    )
-
-    for frame in frame_generator:
-        result = model(frame, imgsz=1280, conf=confidence, verbose=False)[0]
-        detections = sv.Detections.from_ultralytics(result)
-        detections = tracker.update_with_detections(detections)
-
-        labels = [
-            f"#{int(tid) if tid is not None else '?'} {CLASS_NAMES.get(int(cls), f'class_{cls}')}"
-            for tid, cls in zip(detections.track_id if detections.track_id is not None else [-1] * len(detections), detections.class_id)
-        ]
-
-        annotated = frame.copy()
-        annotated = box_annotator.annotate(annotated, detections)
-        annotated = label_annotator.annotate(annotated, detections, labels=labels)
-
-        yield annotated
+    """Generate tracked frames from video.
+
+    Frames are sent to the model ``batch_size`` at a time.
+    """
+    with checkout_model(device) as model:
+        tracker = ByteTrackFactory.get()
+        frame_generator = get_video_frames(source_video_path)
+
+        box_annotator = sv.BoxAnnotator(color=TRACK_COLORS, thickness=2)
+        label_annotator = sv.LabelAnnotator(
+            color=TRACK_COLORS,
+            text_color=sv.Color.from_hex("#FFFFFF"),
+            text_padding=5,
+            text_thickness=1,
+        )
+
+        # Reader and inference stages each run on their own thread, so decoding,
+        # inference and the annotation below overlap
+        tracked = prefetch(
+            _track_frames(
+                model,
+                tracker,
+                prefetch(frame_generator),
+                confidence,
+                batch_size,
+                half=use_half_precision(device),
+            )
+        )
+        try:
+            for frame, detections in tracked:
+                tracker_ids = get_tracker_ids(detections)
+                if tracker_ids is None:
+                    tracker_ids = np.full(len(detections), -1)
+
+                labels = [
+                    f"#{tid} {name}"
+                    for tid, name in zip(tracker_ids.tolist(), CLASS_LABELS(detections.class_id))
+                ]
+
+                # Frames are freshly decoded and never reused, so draw in place
+                annotated = box_annotator.annotate(frame, detections)
+                annotated = label_annotator.annotate(annotated, detections, labels=labels)
+
+                yield annotated
+        finally:
+            # Wait for the inference thread before the model goes back to the pool
+            tracked.close()
 
 
 def run_player_tracking_video(
@@ -72,6 +119,7 @@ def run_player_tracking_video(
     target_video_path: str,
     device: str = "cpu",
     confidence: float = DEFAULT_CONFIDENCE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> None:
     """Process video and save tracked output."""
     if not source_video_path:
@@ -80,10 +128,14 @@ def run_player_tracking_video(
             "detail": "video_path must be provided"
         }
     video_info = sv.VideoInfo.from_video_path(source_video_path)
-    with sv.VideoSink(target_video_path, video_info) as sink:
-        for frame in run_player_tracking_video_frames(
-            source_video_path=source_video_path,
-            device=device,
-            confidence=confidence,
+    with HWVideoSink(target_video_path, video_info) as sink:
+        # Inference stage runs on its own thread; this thread only encodes
+        for frame in prefetch(
+            run_player_tracking_video_frames(
+                source_video_path=source_video_path,
+                device=device,
+                confidence=confidence,
+                batch_size=batch_size,
+            )
         ):
             sink.write_frame(frame)
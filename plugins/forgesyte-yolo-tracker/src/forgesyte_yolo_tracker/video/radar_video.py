@@ -5,8 +5,9 @@ Roboflow-style full video processing:
 - run_radar_video_frames(): Generator yielding frames with radar
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, Optional, Tuple
+from typing import Any, ContextManager, Iterable, Iterator, List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -15,49 +16,83 @@ from ultralytics import YOLO
 
 from forgesyte_yolo_tracker.configs import get_model_path
 from forgesyte_yolo_tracker.configs.soccer import SoccerPitchConfiguration
+from forgesyte_yolo_tracker.inference._base_detector import (
+    checkout_model as _checkout_model,
+    use_half_precision,
+)
 from forgesyte_yolo_tracker.utils import ViewTransformer
+from forgesyte_yolo_tracker.utils.prefetch import batched, prefetch
+from forgesyte_yolo_tracker.video._capture import get_video_frames
+from forgesyte_yolo_tracker.video._sink import HWVideoSink
 
 PLAYER_MODEL_NAME = get_model_path("player_detection")
 PLAYER_MODEL_PATH = str(Path(__file__).parent.parent / "models" / PLAYER_MODEL_NAME)
 PITCH_MODEL_NAME = get_model_path("pitch_detection")
 PITCH_MODEL_PATH = str(Path(__file__).parent.parent / "models" / PITCH_MODEL_NAME)
 CONFIG = SoccerPitchConfiguration()
+# Pitch keypoint coordinates as one array, gathered by index per frame
+PITCH_VERTICES = CONFIG.vertices
 
 TEAM_A_COLOR = (0, 191, 255)
 TEAM_B_COLOR = (255, 20, 147)
 GK_COLOR = (0, 215, 255)
 BALL_COLOR = (135, 206, 250)
 DEFAULT_CONFIDENCE = 0.25
+# Frames per model call; kept small since imgsz=1280 inputs are large
+DEFAULT_BATCH_SIZE = 2
+# Run the pitch model on every frame; moving cameras change the homography
+DEFAULT_PITCH_INTERVAL = 1
 
-_player_model: Optional[YOLO] = None
-_pitch_model: Optional[YOLO] = None
 
+def checkout_player_model(device: str = "cpu") -> ContextManager[YOLO]:
+    """Borrow a pooled player detection model for this device for one stream."""
+    return _checkout_model(PLAYER_MODEL_PATH, device, half=use_half_precision(device))
 
-def get_player_model(device: str = "cpu") -> YOLO:
-    global _player_model
-    if _player_model is None:
-        _player_model = YOLO(PLAYER_MODEL_PATH).to(device=device)
-    return _player_model
 
+def checkout_pitch_model(device: str = "cpu") -> ContextManager[YOLO]:
+    """Borrow a pooled pitch detection model for this device for one stream."""
+    return _checkout_model(PITCH_MODEL_PATH, device, half=use_half_precision(device))
 
-def get_pitch_model(device: str = "cpu") -> YOLO:
-    global _pitch_model
-    if _pitch_model is None:
-        _pitch_model = YOLO(PITCH_MODEL_PATH).to(device=device)
-    return _pitch_model
+
+@lru_cache(maxsize=8)
+def _radar_background(radar_w: int, radar_h: int) -> np.ndarray:
+    """Static radar outline, center line and circle, drawn once per size.
+
+    The returned image is read-only; callers copy it into their own buffer.
+    """
+    radar = np.zeros((radar_h, radar_w, 3), dtype=np.uint8)
+    cv2.rectangle(radar, (0, 0), (radar_w, radar_h), (50, 50, 50), 2)
+    cv2.line(radar, (radar_w // 2, 0), (radar_w // 2, radar_h), (100, 100, 100), 1)
+    cv2.circle(radar, (radar_w // 2, radar_h // 2), 20, (100, 100, 100), 1)
+    radar.flags.writeable = False
+    return radar
 
 
 def _create_radar_image(
     radar_points: list,
     radar_size: Tuple[int, int] = (600, 300),
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    """Create radar visualization."""
+    """Create radar visualization.
+
+    Args:
+        radar_points: Points to draw, each with "xy" and optional
+            "team_id" / "type"
+        radar_size: Radar (width, height)
+        out: Optional (height, width, 3) buffer, e.g. a region of the
+            output frame, to draw into instead of allocating a new image
+
+    Returns:
+        The radar image (``out`` when given)
+    """
     radar_w, radar_h = radar_size
-    radar = np.zeros((radar_h, radar_w, 3), dtype=np.uint8)
-
-    cv2.rectangle(radar, (0, 0), (radar_w, radar_h), (50, 50, 50), 2)
-    cv2.line(radar, (radar_w // 2, 0), (radar_w // 2, radar_h), (100, 100, 100), 1)
-    cv2.circle(radar, (radar_w // 2, radar_h // 2), 20, (100, 100, 100), 1)
+    # Pitch outline, center line and center circle never change
+    background = _radar_background(radar_w, radar_h)
+    if out is None:
+        radar = background.copy()
+    else:
+        radar = out
+        np.copyto(radar, background)
 
     for point in radar_points:
         x, y = point["xy"]
@@ -85,91 +120,181 @@ def _create_radar_image(
     return radar
 
 
+def _infer_frames(
+    player_model: YOLO,
+    pitch_model: YOLO,
+    frames: Iterable[np.ndarray],
+    confidence: float,
+    batch_size: int,
+    half: bool,
+    pitch_interval: int,
+) -> Iterator[Tuple[np.ndarray, Any, Optional[Any]]]:
+    """Inference stage: run both models on each batch of ``batch_size`` frames.
+
+    The pitch model only sees every ``pitch_interval``-th frame.
+
+    Yields:
+        (frame, player result, pitch result) in frame order; the pitch result
+        is None for frames the pitch model skipped
+    """
+    pitch_interval = max(pitch_interval, 1)
+    frame_index = 0
+    for batch in batched(frames, batch_size):
+        player_results = player_model(batch, imgsz=1280, conf=confidence, half=half, verbose=False)
+
+        pitch_results: List[Optional[Any]] = [None] * len(batch)
+        pitch_slots = [
+            i for i in range(len(batch)) if (frame_index + i) % pitch_interval == 0
+        ]
+        if pitch_slots:
+            # Every frame at interval 1: reuse the batch list as is
+            pitch_batch = (
+                batch if len(pitch_slots) == len(batch) else [batch[i] for i in pitch_slots]
+            )
+            results = pitch_model(
+                pitch_batch,
+                imgsz=1280,
+                conf=confidence,
+                half=half,
+                verbose=False,
+            )
+            for i, result in zip(pitch_slots, results):
+                pitch_results[i] = result
+
+        frame_index += len(batch)
+        yield from zip(batch, player_results, pitch_results)
+
+
+def _pitch_transformer(pitch_result: Any, confidence: float) -> Optional[ViewTransformer]:
+    """Build the frame-to-pitch homography from pitch keypoints.
+
+    Args:
+        pitch_result: Ultralytics pitch keypoint result for one frame
+        confidence: Detection confidence threshold; keypoints need half of it
+
+    Returns:
+        ViewTransformer, or None if fewer than four keypoints are confident
+        or no homography can be fitted
+    """
+    if pitch_result.keypoints is None:
+        return None
+
+    # Rows are [x, y, (conf)]; one device-to-host copy instead of one for
+    # xy and another for conf
+    keypoints = pitch_result.keypoints.data.cpu().numpy()
+    if len(keypoints) == 0:
+        return None
+    keypoints_xy = keypoints[0, :, :2]
+    keypoints_conf = (
+        keypoints[0, :, 2]
+        if keypoints.shape[2] > 2
+        else np.ones(len(keypoints_xy), dtype=np.float32)
+    )
+
+    # First four confident keypoints, selected with one mask
+    valid_kp_indices = np.flatnonzero(keypoints_conf > confidence * 0.5)[:4]
+    if len(valid_kp_indices) < 4:
+        return None
+
+    src_pts = keypoints_xy[valid_kp_indices].astype(np.float32)
+    tgt_pts = PITCH_VERTICES[valid_kp_indices]
+    try:
+        return ViewTransformer(src_pts, tgt_pts)
+    except Exception:
+        return None
+
+
 def run_radar_video_frames(
     source_video_path: str,
     device: str = "cpu",
     confidence: float = DEFAULT_CONFIDENCE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    pitch_interval: int = DEFAULT_PITCH_INTERVAL,
 ) -> Iterator[np.ndarray]:
-    """Generate frames with radar overlay from video."""
+    """Generate frames with radar overlay from video.
+
+    Frames are sent to both models ``batch_size`` at a time. With a
+    ``pitch_interval`` above 1, the pitch model only runs on every
+    ``pitch_interval``-th frame and the frames in between reuse its
+    homography; use this only for fixed cameras.
+    """
     if not source_video_path:
         return {
             "error": "missing_video_path",
             "detail": "video_path must be provided"
         }
-    player_model = get_player_model(device)
-    pitch_model = get_pitch_model(device)
-    frame_generator = sv.get_video_frames_generator(source_path=source_video_path)
-
-    radar_w, radar_h = CONFIG.radar_resolution
-
-    for frame in frame_generator:
-        player_result = player_model(frame, imgsz=1280, conf=confidence, verbose=False)[0]
-        pitch_result = pitch_model(frame, imgsz=1280, conf=confidence, verbose=False)[0]
-
-        player_detections = sv.Detections.from_ultralytics(player_result)
-        radar_points = []
-
-        if pitch_result.keypoints is not None and pitch_result.keypoints.xy is not None:
-            keypoints_xy = pitch_result.keypoints.xy.cpu().numpy()[0]
-            keypoints_conf = (
-                pitch_result.keypoints.conf.cpu().numpy()[0]
-                if pitch_result.keypoints.conf is not None
-                else None
+    with checkout_player_model(device) as player_model, checkout_pitch_model(
+        device
+    ) as pitch_model:
+        frame_generator = get_video_frames(source_video_path)
+
+        radar_w, radar_h = CONFIG.radar_resolution
+
+        # Reader and inference stages each run on their own thread, so decoding,
+        # inference and the radar drawing below overlap
+        inferred = prefetch(
+            _infer_frames(
+                player_model,
+                pitch_model,
+                prefetch(frame_generator),
+                confidence,
+                batch_size,
+                half=use_half_precision(device),
+                pitch_interval=pitch_interval,
             )
-
-            valid_kp_indices = [
-                i for i, conf in enumerate(keypoints_conf) if conf > confidence * 0.5
-            ]
-
-            if len(valid_kp_indices) >= 4:
-                src_pts = np.array(
-                    [keypoints_xy[i] for i in valid_kp_indices[:4]], dtype=np.float32
-                )
-                tgt_pts = np.array(
-                    [CONFIG.vertices[i] for i in valid_kp_indices[:4]], dtype=np.float32
-                )
-
-                try:
-                    transformer = ViewTransformer(src_pts, tgt_pts)
-
-                    for i in range(len(player_detections)):
-                        xyxy = player_detections.xyxy[i]
-                        cls = int(player_detections.class_id[i])
-
-                        center_x = float((xyxy[0] + xyxy[2]) / 2)
-                        center_y = float((xyxy[1] + xyxy[3]) / 2)
-
-                        transformed = transformer.transform_points(
-                            np.array([[center_x, center_y]], dtype=np.float32)
-                        )
-                        rx, ry = CONFIG.world_to_radar(transformed[0][0], transformed[0][1])
-
-                        radar_points.append(
+        )
+        transformer: Optional[ViewTransformer] = None
+        try:
+            for frame, player_result, pitch_result in inferred:
+                if pitch_result is not None:
+                    transformer = _pitch_transformer(pitch_result, confidence)
+
+                player_detections = sv.Detections.from_ultralytics(player_result)
+                radar_points = []
+
+                if transformer is not None:
+                    try:
+                        # All detections are mapped in one call each
+                        xyxy = player_detections.xyxy
+                        centers = ((xyxy[:, 0:2] + xyxy[:, 2:4]) * 0.5).astype(np.float32)
+                        transformed = transformer.transform_points(centers)
+                        rxs, rys = CONFIG.world_to_radar_batch(transformed[:, 0], transformed[:, 1])
+
+                        radar_points = [
                             {
                                 "xy": [rx, ry],
                                 "team_id": -1,
                                 "type": "goalkeeper" if cls == 1 else "player",
                             }
-                        )
-                except Exception:
-                    pass
-
-        radar_image = _create_radar_image(radar_points, (radar_w, radar_h))
-
-        annotated = frame.copy()
-        radar_h, radar_w = radar_image.shape[:2]
-        annotated[-radar_h - 10 : -10, -radar_w - 10 : -10] = radar_image
-        cv2.putText(
-            annotated,
-            "Radar",
-            (annotated.shape[1] - radar_w, annotated.shape[0] - radar_h - 15),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            1,
-            (255, 255, 255),
-            2,
-        )
+                            for rx, ry, cls in zip(
+                                rxs.tolist(), rys.tolist(), player_detections.class_id.tolist()
+                            )
+                        ]
+                    except Exception:
+                        pass
+
+                # Frames are freshly decoded and never reused, so the radar is drawn
+                # straight into its corner of the frame: no frame copy, no radar image
+                annotated = frame
+                _create_radar_image(
+                    radar_points,
+                    (radar_w, radar_h),
+                    out=annotated[-radar_h - 10 : -10, -radar_w - 10 : -10],
+                )
+                cv2.putText(
+                    annotated,
+                    "Radar",
+                    (annotated.shape[1] - radar_w, annotated.shape[0] - radar_h - 15),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    1,
+                    (255, 255, 255),
+                    2,
+                )
 
-        yield annotated
+                yield annotated
+        finally:
+            # Wait for the inference thread before the model goes back to the pool
+            inferred.close()
 
 
 def run_radar_video(
@@ -177,13 +302,20 @@ def run_radar_video(
     target_video_path: str,
     device: str = "cpu",
     confidence: float = DEFAULT_CONFIDENCE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    pitch_interval: int = DEFAULT_PITCH_INTERVAL,
 ) -> None:
     """Process video and save with radar overlay."""
     video_info = sv.VideoInfo.from_video_path(source_video_path)
-    with sv.VideoSink(target_video_path, video_info) as sink:
-        for frame in run_radar_video_frames(
-            source_video_path=source_video_path,
-            device=device,
-            confidence=confidence,
+    with HWVideoSink(target_video_path, video_info) as sink:
+        # Inference stage runs on its own thread; this thread only encodes
+        for frame in prefetch(
+            run_radar_video_frames(
+                source_video_path=source_video_path,
+                device=device,
+                confidence=confidence,
+                batch_size=batch_size,
+                pitch_interval=pitch_interval,
+            )
         ):
             sink.write_frame(frame)
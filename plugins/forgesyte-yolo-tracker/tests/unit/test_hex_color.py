@@ -0,0 +1,48 @@
+"""Unit tests for the cached hex color parser used by detector annotation."""
+
+import pytest
+import supervision as sv
+
+
+class TestHexToColor:
+    """Tests for hex_to_color parsing and caching."""
+
+    @pytest.mark.parametrize("hex_color", ["#FF6347", "#00ff00", "#FFF", "1E90FF"])
+    def test_matches_supervision(self, hex_color: str) -> None:
+        """Verify parsing agrees with sv.Color.from_hex."""
+        from forgesyte_yolo_tracker.inference._base_detector import hex_to_color
+
+        assert hex_to_color(hex_color) == sv.Color.from_hex(hex_color)
+
+    def test_repeated_lookups_are_cached(self) -> None:
+        """Verify the same palette entry is parsed once."""
+        from forgesyte_yolo_tracker.inference._base_detector import hex_to_color
+
+        assert hex_to_color("#123456") is hex_to_color("#123456")
+
+    def test_invalid_hex_raises(self) -> None:
+        """Verify malformed colors are rejected."""
+        from forgesyte_yolo_tracker.inference._base_detector import hex_to_color
+
+        with pytest.raises(ValueError):
+            hex_to_color("#12345")
+
+
+class TestDetectorPalette:
+    """Tests for the palette BaseDetector precomputes from its hex colors."""
+
+    def test_class_colors_parsed_at_init(self) -> None:
+        """Verify hex colors are converted once when the detector is built."""
+        from forgesyte_yolo_tracker.inference._base_detector import BaseDetector
+
+        detector = BaseDetector(
+            detector_name="test",
+            model_name="missing.pt",
+            default_confidence=0.5,
+            colors={0: "#FF0000", 1: "#0000FF"},
+        )
+
+        assert detector._class_colors == {
+            0: sv.Color(r=255, g=0, b=0),
+            1: sv.Color(r=0, g=0, b=255),
+        }
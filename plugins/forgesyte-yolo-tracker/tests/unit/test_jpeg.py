@@ -0,0 +1,151 @@
+"""Unit tests for the libjpeg-turbo JPEG helpers and their fallbacks."""
+
+from typing import Any, Optional, Tuple
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+
+class FakeTurboJPEG:
+    """Stand-in for TurboJPEG that records the requested scaling factor."""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.scaling_factor: Optional[Tuple[int, int]] = None
+
+    def decode_header(self, data: bytes) -> Tuple[int, int, int, int]:
+        return self.width, self.height, 0, 0
+
+    def decode(
+        self, data: bytes, pixel_format: Any = None, scaling_factor: Any = None, dst: Any = None
+    ) -> Any:
+        self.scaling_factor = scaling_factor
+        if dst is not None:
+            dst[...] = 0
+            return dst
+        return np.zeros((self.height, self.width, 3), dtype=np.uint8)
+
+
+def _jpeg_bytes(width: int, height: int) -> bytes:
+    ok, buf = cv2.imencode(".jpg", np.zeros((height, width, 3), dtype=np.uint8))
+    assert ok
+    return buf.tobytes()
+
+
+class TestDecodeJpeg:
+    """Tests for decode_jpeg fast path selection."""
+
+    def test_returns_none_for_non_jpeg(self) -> None:
+        """Verify non-JPEG input is left to the caller's decoder."""
+        from forgesyte_yolo_tracker.utils import jpeg
+
+        fake = FakeTurboJPEG(10, 10)
+        with patch.object(jpeg, "get_turbo_jpeg", return_value=fake):
+            assert jpeg.decode_jpeg(b"\x89PNG\r\n\x1a\n") is None
+
+    def test_returns_none_without_turbojpeg(self) -> None:
+        """Verify missing libjpeg-turbo falls back to the caller's decoder."""
+        from forgesyte_yolo_tracker.utils import jpeg
+
+        with patch.object(jpeg, "get_turbo_jpeg", return_value=None):
+            assert jpeg.decode_jpeg(_jpeg_bytes(16, 16)) is None
+
+    def test_input_size_picks_smallest_covering_scale(self) -> None:
+        """Verify input_size selects the most aggressive scale that still covers it."""
+        from forgesyte_yolo_tracker.utils import jpeg
+
+        fake = FakeTurboJPEG(1280, 720)
+        with patch.object(jpeg, "get_turbo_jpeg", return_value=fake):
+            jpeg.decode_jpeg(_jpeg_bytes(16, 16), input_size=320)
+            assert fake.scaling_factor == (1, 2)
+
+            jpeg.decode_jpeg(_jpeg_bytes(16, 16), input_size=90)
+            assert fake.scaling_factor == (1, 8)
+
+            jpeg.decode_jpeg(_jpeg_bytes(16, 16))
+            assert fake.scaling_factor is None
+
+    def test_accepts_bytes_like_buffers(self) -> None:
+        """Verify bytearray and memoryview input take the fast path without a copy."""
+        from forgesyte_yolo_tracker.utils import jpeg
+
+        fake = FakeTurboJPEG(16, 16)
+        data = _jpeg_bytes(16, 16)
+        with patch.object(jpeg, "get_turbo_jpeg", return_value=fake):
+            assert jpeg.decode_jpeg(bytearray(data)) is not None
+            assert jpeg.decode_jpeg(memoryview(data)) is not None
+
+
+class TestFrameDecoder:
+    """Tests for FrameDecoder buffer reuse."""
+
+    def test_reuses_buffer_per_shape(self) -> None:
+        """Verify same-shape frames decode into one buffer and new shapes get their own."""
+        from forgesyte_yolo_tracker.utils import jpeg
+
+        decoder = jpeg.FrameDecoder()
+        fake = FakeTurboJPEG(64, 32)
+        with patch.object(jpeg, "get_turbo_jpeg", return_value=fake):
+            first = decoder(_jpeg_bytes(16, 16))
+            second = decoder(_jpeg_bytes(16, 16))
+            assert first is second
+            assert first.shape == (32, 64, 3)
+
+            scaled = decoder(_jpeg_bytes(16, 16), input_size=16)
+            assert scaled is not first
+            assert scaled.shape == (16, 32, 3)
+
+    def test_buffers_are_per_thread(self) -> None:
+        """Verify threads never share a decode buffer."""
+        import threading
+
+        from forgesyte_yolo_tracker.utils import jpeg
+
+        decoder = jpeg.FrameDecoder()
+        fake = FakeTurboJPEG(8, 8)
+        frames = []
+        with patch.object(jpeg, "get_turbo_jpeg", return_value=fake):
+            frames.append(decoder(_jpeg_bytes(8, 8)))
+            worker = threading.Thread(target=lambda: frames.append(decoder(_jpeg_bytes(8, 8))))
+            worker.start()
+            worker.join()
+
+        assert frames[0] is not frames[1]
+
+
+class TestEncodeJpeg:
+    """Tests for encode_jpeg."""
+
+    def test_falls_back_to_opencv(self) -> None:
+        """Verify cv2.imencode output is used when TurboJPEG is unavailable."""
+        from forgesyte_yolo_tracker.utils import jpeg
+
+        with patch.object(jpeg, "get_turbo_jpeg", return_value=None):
+            encoded = jpeg.encode_jpeg(np.zeros((8, 8, 3), dtype=np.uint8))
+
+        assert bytes(encoded[:3]) == jpeg.JPEG_MAGIC
+
+    def test_quality_controls_size(self) -> None:
+        """Verify a lower quality produces a smaller JPEG."""
+        from forgesyte_yolo_tracker.utils import jpeg
+
+        frame = np.random.default_rng(0).integers(0, 256, (64, 64, 3), dtype=np.uint8)
+        with patch.object(jpeg, "get_turbo_jpeg", return_value=None):
+            low = jpeg.encode_jpeg(frame, quality=30)
+            high = jpeg.encode_jpeg(frame, quality=95)
+
+        assert len(low) < len(high)
+
+    def test_base64_round_trips(self) -> None:
+        """Verify encode_jpeg_base64 yields base64 of a JPEG."""
+        import base64
+
+        from forgesyte_yolo_tracker.utils import jpeg
+
+        with patch.object(jpeg, "get_turbo_jpeg", return_value=None):
+            encoded = jpeg.encode_jpeg_base64(np.zeros((8, 8, 3), dtype=np.uint8))
+
+        assert isinstance(encoded, str)
+        assert base64.b64decode(encoded)[:3] == jpeg.JPEG_MAGIC
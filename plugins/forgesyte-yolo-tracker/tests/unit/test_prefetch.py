@@ -0,0 +1,94 @@
+"""Unit tests for the background prefetch iterator used by video tools."""
+
+import threading
+from typing import Iterator
+
+import pytest
+
+
+class TestPrefetch:
+    """Tests for prefetch ordering, error propagation and shutdown."""
+
+    def test_preserves_order(self) -> None:
+        """Verify items come out in the order the source produced them."""
+        from forgesyte_yolo_tracker.utils.prefetch import prefetch
+
+        assert list(prefetch(range(100), maxsize=4)) == list(range(100))
+
+    def test_empty_iterable(self) -> None:
+        """Verify an empty source yields nothing."""
+        from forgesyte_yolo_tracker.utils.prefetch import prefetch
+
+        assert list(prefetch([])) == []
+
+    def test_producer_exception_is_reraised(self) -> None:
+        """Verify exceptions from the source surface in the consumer."""
+        from forgesyte_yolo_tracker.utils.prefetch import prefetch
+
+        def source() -> Iterator[int]:
+            yield 1
+            raise RuntimeError("decode failed")
+
+        it = prefetch(source())
+        assert next(it) == 1
+        with pytest.raises(RuntimeError, match="decode failed"):
+            next(it)
+
+    def test_early_close_stops_producer(self) -> None:
+        """Verify closing the consumer stops the producer thread."""
+        from forgesyte_yolo_tracker.utils.prefetch import prefetch
+
+        finished = threading.Event()
+
+        def source() -> Iterator[int]:
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+            finally:
+                finished.set()
+
+        it = prefetch(source(), maxsize=2)
+        assert next(it) == 0
+        it.close()
+
+        assert finished.wait(timeout=5)
+
+    def test_close_waits_for_producer(self) -> None:
+        """Verify close() returns only after the source has been closed."""
+        from forgesyte_yolo_tracker.utils.prefetch import prefetch
+
+        finished = threading.Event()
+
+        def source() -> Iterator[int]:
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+            finally:
+                finished.set()
+
+        it = prefetch(source(), maxsize=2)
+        assert next(it) == 0
+        it.close()
+
+        assert finished.is_set()
+
+
+class TestBatched:
+    """Tests for grouping frames into model batches."""
+
+    def test_groups_with_short_tail(self) -> None:
+        """Verify full batches are emitted and the remainder comes last."""
+        from forgesyte_yolo_tracker.utils.prefetch import batched
+
+        assert list(batched(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_empty_and_minimum_size(self) -> None:
+        """Verify empty input yields nothing and sizes below 1 act as 1."""
+        from forgesyte_yolo_tracker.utils.prefetch import batched
+
+        assert list(batched([], 4)) == []
+        assert list(batched("ab", 0)) == [["a"], ["b"]]
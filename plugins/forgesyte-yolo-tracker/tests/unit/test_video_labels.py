@@ -0,0 +1,24 @@
+"""Unit tests for the video modules' class label table."""
+
+import numpy as np
+
+
+class TestLabelTable:
+    """Tests for LabelTable lookups."""
+
+    def test_known_ids_map_to_names(self) -> None:
+        """Verify IDs in the table return their names in order."""
+        from forgesyte_yolo_tracker.video._labels import LabelTable
+
+        table = LabelTable({0: "player", 2: "referee"})
+
+        assert table(np.array([2, 0, 1])) == ["referee", "player", "class_1"]
+
+    def test_unknown_ids_fall_back(self) -> None:
+        """Verify IDs outside the table are labelled class_<id>."""
+        from forgesyte_yolo_tracker.video._labels import LabelTable
+
+        table = LabelTable({0: "player"})
+
+        assert table(np.array([0, 5, -1])) == ["player", "class_5", "class_-1"]
+        assert table(np.array([], dtype=np.int64)) == []
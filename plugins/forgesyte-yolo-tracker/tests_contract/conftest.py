@@ -3,6 +3,8 @@
 import sys
 from unittest.mock import MagicMock
 
+import pytest
+
 # Patch inference modules BEFORE they can be imported
 # This prevents YOLO, Torch, ByteTrack, OpenCV from loading during contract tests
 
@@ -99,3 +101,13 @@ sys.modules["forgesyte_yolo_tracker.inference.radar"].generate_radar_json = Magi
 sys.modules["forgesyte_yolo_tracker.inference.radar"].radar_json_with_annotated_frame = MagicMock(
     return_value={"radar": None, "annotated_frame": ""}
 )
+
+
+@pytest.fixture(autouse=True)
+def _clear_model_cache():
+    """Drop pooled video-tool models so each test sees its own patched YOLO."""
+    from forgesyte_yolo_tracker.inference._base_detector import clear_model_cache
+
+    clear_model_cache()
+    yield
+    clear_model_cache()
@@ -128,3 +128,33 @@ class TestPhase12InputContract:
         """Verify unknown tool names raise ValueError."""
         with pytest.raises(ValueError, match="Unknown tool"):
             plugin.run_tool("nonexistent_tool", {"image_bytes": b"test"})
+
+    def test_input_size_hint_reduces_jpeg_decode(self) -> None:
+        """Verify input_size lets JPEG decode at a reduced DCT scale."""
+        from forgesyte_yolo_tracker.plugin import _decode_image_bytes
+
+        buffer = io.BytesIO()
+        Image.new("RGB", (1280, 720), color="green").save(buffer, format="JPEG")
+
+        frame, error = _decode_image_bytes(buffer.getvalue(), "test", 320)
+        assert error is None
+        assert frame.shape == (360, 640, 3)
+
+        frame, error = _decode_image_bytes(buffer.getvalue(), "test")
+        assert error is None
+        assert frame.shape == (720, 1280, 3)
+
+    def test_input_size_reports_decode_scale(self, plugin: Plugin) -> None:
+        """Verify a downscaled decode reports both sizes so clients can map boxes back."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (1280, 720), color="green").save(buffer, format="JPEG")
+
+        result = plugin.run_tool(
+            "player_detection", {"image_bytes": buffer.getvalue(), "input_size": 320}
+        )
+        assert result["result"]["original_size"] == [1280, 720]
+        assert result["result"]["decoded_size"] == [640, 360]
+
+        result = plugin.run_tool("player_detection", {"image_bytes": buffer.getvalue()})
+        assert "original_size" not in result["result"]
+        assert "decoded_size" not in result["result"]
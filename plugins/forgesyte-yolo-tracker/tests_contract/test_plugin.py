@@ -301,6 +301,23 @@ class TestPluginLifecycle:
         """Test on_load lifecycle hook does not raise errors."""
         plugin.on_load()  # Should not raise
 
+    def test_on_load_warms_up_detectors(self, plugin: Plugin) -> None:
+        """Test on_load warms up the player, ball and pitch detectors."""
+        with patch("forgesyte_yolo_tracker.plugin.PLAYER_DETECTOR") as player, patch(
+            "forgesyte_yolo_tracker.plugin.BALL_DETECTOR"
+        ) as ball, patch("forgesyte_yolo_tracker.plugin.PITCH_DETECTOR") as pitch:
+            plugin.on_load()
+
+        player.warmup.assert_called_once()
+        ball.warmup.assert_called_once()
+        pitch.warmup.assert_called_once()
+
+    def test_on_load_tolerates_warmup_failure(self, plugin: Plugin) -> None:
+        """Test on_load still succeeds when a model cannot be loaded."""
+        with patch("forgesyte_yolo_tracker.plugin.BALL_DETECTOR") as ball:
+            ball.warmup.side_effect = FileNotFoundError("missing weights")
+            plugin.on_load()  # Should not raise
+
     def test_on_unload_does_not_crash(self, plugin: Plugin) -> None:
         """Test on_unload lifecycle hook does not raise errors."""
         plugin.on_unload()  # Should not raise
@@ -238,3 +238,23 @@ class TestVideoToolDevice:
             )
 
         mock_model.to.assert_called_with(device="cuda")
+
+
+class TestVideoToolModelReuse:
+    """Tests for reusing loaded models across video tool calls."""
+
+    def test_two_calls_load_the_weights_once(self) -> None:
+        """Verify a second call reuses the model the first call returned to the pool."""
+        plugin = Plugin()
+
+        mock_model = MockYOLOModel(frame_results=[[]])
+
+        with patch(YOLO_PATCH_PATH, return_value=mock_model) as mock_yolo:
+            for _ in range(2):
+                result = plugin.run_tool(
+                    TEST_TOOL,
+                    {"video_path": "/tmp/test.mp4", "device": "cpu"},
+                )
+                assert result.get("success") is True
+
+        mock_yolo.assert_called_once()
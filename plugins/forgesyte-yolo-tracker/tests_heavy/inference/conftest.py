@@ -0,0 +1,33 @@
+"""Shared fixtures for the inference tests."""
+
+import numpy as np
+import pytest
+
+from tests_heavy.constants import PLAYER_MODEL_PATH, RUN_MODEL_TESTS
+
+
+@pytest.fixture(scope="session")
+def zero_frame() -> np.ndarray:
+    """Blank 640x480 BGR frame shared by every test.
+
+    Read-only, so a detector that writes into its input fails loudly instead
+    of leaking state into later tests.
+    """
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    frame.flags.writeable = False
+    return frame
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_player_detector() -> None:
+    """Pay the first-inference setup cost once, before any test runs.
+
+    Without this the first model test absorbs predictor setup and layer
+    fusing. A no-op unless the model tests are enabled and the weights exist.
+    """
+    if not RUN_MODEL_TESTS or not PLAYER_MODEL_PATH.exists():
+        return
+
+    from forgesyte_yolo_tracker.inference.player_detection import PLAYER_DETECTOR
+
+    PLAYER_DETECTOR.warmup(device="cpu")
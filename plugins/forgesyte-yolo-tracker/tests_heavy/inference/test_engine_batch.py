@@ -0,0 +1,72 @@
+"""Tests that TensorRT engines accept every batch the pipelines send."""
+
+import importlib
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import supervision as sv
+
+# The modules under test import ultralytics at load time
+pytest.importorskip("ultralytics")
+
+VIDEO_MODULES = [
+    "ball_detection_video",
+    "pitch_detection_video",
+    "player_detection_video",
+    "player_tracking_video",
+    "radar_video",
+]
+
+
+def _detector() -> Any:
+    from forgesyte_yolo_tracker.inference._base_detector import BaseDetector
+
+    return BaseDetector(detector_name="test", model_name="test.pt", default_confidence=0.25)
+
+
+class TestEngineBatch:
+    """Tests for the engine batch limit."""
+
+    @pytest.mark.parametrize("module_name", VIDEO_MODULES)
+    def test_video_batches_fit_the_engine(self, module_name: str) -> None:
+        """Verify no video pipeline batches more frames than the engine accepts."""
+        from forgesyte_yolo_tracker.inference._base_detector import ENGINE_MAX_BATCH
+
+        module = importlib.import_module(f"forgesyte_yolo_tracker.video.{module_name}")
+
+        assert module.DEFAULT_BATCH_SIZE <= ENGINE_MAX_BATCH
+
+    def test_export_builds_dynamic_engine_by_default(self) -> None:
+        """Verify the default export is a dynamic engine sized for ENGINE_MAX_BATCH."""
+        from forgesyte_yolo_tracker.inference._base_detector import ENGINE_MAX_BATCH
+
+        with patch("ultralytics.YOLO") as mock_yolo:
+            _detector().export_engine()
+
+        kwargs = mock_yolo.return_value.export.call_args.kwargs
+        assert kwargs["dynamic"] is True
+        assert kwargs["batch"] == ENGINE_MAX_BATCH
+
+    def test_export_rejects_batch_below_pipeline_batches(self) -> None:
+        """Verify an engine too small for the video pipelines is never built."""
+        with patch("ultralytics.YOLO") as mock_yolo, pytest.raises(ValueError):
+            _detector().export_engine(batch=1)
+
+        mock_yolo.assert_not_called()
+
+    def test_detect_json_batch_splits_long_inputs(self) -> None:
+        """Verify detect_json_batch never sends the model more than ENGINE_MAX_BATCH frames."""
+        from forgesyte_yolo_tracker.inference._base_detector import ENGINE_MAX_BATCH
+
+        model = MagicMock(side_effect=lambda frames, **kwargs: [MagicMock()] * len(frames))
+        frames = [np.zeros((8, 8, 3), dtype=np.uint8)] * (ENGINE_MAX_BATCH + 2)
+        detector = _detector()
+        with patch.object(detector, "get_model", return_value=model), patch.object(
+            sv.Detections, "from_ultralytics", return_value=sv.Detections.empty()
+        ):
+            results = detector.detect_json_batch(frames)
+
+        assert [len(c.args[0]) for c in model.call_args_list] == [ENGINE_MAX_BATCH, 2]
+        assert len(results) == len(frames)
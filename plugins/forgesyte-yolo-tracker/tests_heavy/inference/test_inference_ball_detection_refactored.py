@@ -13,48 +13,53 @@ import pytest
 
 from tests_heavy.constants import MODELS_EXIST, RUN_MODEL_TESTS
 
-pytestmark = pytest.mark.skipif(
-    not RUN_MODEL_TESTS or not MODELS_EXIST,
-    reason="Set RUN_MODEL_TESTS=1 AND download models to run",
+# Skip before importing the detector, which pulls in ultralytics and torch
+if not RUN_MODEL_TESTS or not MODELS_EXIST:
+    pytest.skip("Set RUN_MODEL_TESTS=1 AND download models to run", allow_module_level=True)
+
+from forgesyte_yolo_tracker.inference.ball_detection import (  # noqa: E402
+    BALL_DETECTOR,
+    detect_ball_json,
+    detect_ball_json_batch,
+    detect_ball_json_with_annotated_frame,
+    get_ball_detection_model,
+    run_ball_detection,
 )
 
 
+@pytest.fixture(scope="module")
+def ball_json(zero_frame: np.ndarray) -> Dict[str, Any]:
+    """detect_ball_json on the zero frame, run once for every test that only reads it."""
+    return detect_ball_json(zero_frame, device="cpu")
+
+
+@pytest.fixture(scope="module")
+def ball_json_annotated(zero_frame: np.ndarray) -> Dict[str, Any]:
+    """detect_ball_json_with_annotated_frame on the zero frame, run once."""
+    return detect_ball_json_with_annotated_frame(zero_frame, device="cpu")
+
+
 class TestBallDetectorConfiguration:
     """Tests for ball detector configuration."""
 
     def test_ball_detector_name_is_correct(self) -> None:
         """Verify detector name is 'ball'."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            BALL_DETECTOR
-
         assert BALL_DETECTOR.detector_name == "ball"
 
     def test_ball_default_confidence_is_0_20(self) -> None:
         """Verify default confidence is 0.20."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            BALL_DETECTOR
-
         assert BALL_DETECTOR.default_confidence == 0.20
 
     def test_ball_imgsz_is_640(self) -> None:
         """Verify imgsz is 640 for ball."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            BALL_DETECTOR
-
         assert BALL_DETECTOR.imgsz == 640
 
     def test_ball_class_names_is_none(self) -> None:
         """Verify class_names is None for ball."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            BALL_DETECTOR
-
         assert BALL_DETECTOR.class_names is None
 
     def test_ball_colors_defined(self) -> None:
         """Verify colors defined for ball detector."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            BALL_DETECTOR
-
         assert BALL_DETECTOR.colors is not None
         assert len(BALL_DETECTOR.colors) > 0
 
@@ -62,230 +67,150 @@ class TestBallDetectorConfiguration:
 class TestDetectBallJSON:
     """Tests for detect_ball_json function."""
 
-    def test_detect_ball_json_returns_dict(self) -> None:
+    def test_detect_ball_json_returns_dict(self, ball_json: Dict[str, Any]) -> None:
         """Verify detect_ball_json returns dictionary."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json(frame, device="cpu")
-
-        assert isinstance(result, dict)
+        assert isinstance(ball_json, dict)
 
-    def test_detect_ball_json_returns_detections_key(self) -> None:
+    def test_detect_ball_json_returns_detections_key(self, ball_json: Dict[str, Any]) -> None:
         """Verify detections key in result."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json
+        assert "detections" in ball_json
+        assert isinstance(ball_json["detections"], list)
 
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json(frame, device="cpu")
-
-        assert "detections" in result
-        assert isinstance(result["detections"], list)
-
-    def test_detect_ball_json_returns_count(self) -> None:
+    def test_detect_ball_json_returns_count(self, ball_json: Dict[str, Any]) -> None:
         """Verify count key in result."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json(frame, device="cpu")
+        assert "count" in ball_json
+        assert isinstance(ball_json["count"], int)
 
-        assert "count" in result
-        assert isinstance(result["count"], int)
-
-    def test_detect_ball_json_returns_ball_key(self) -> None:
+    def test_detect_ball_json_returns_ball_key(self, ball_json: Dict[str, Any]) -> None:
         """Verify ball key with primary detection."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json(frame, device="cpu")
+        assert "ball" in ball_json
 
-        assert "ball" in result
-
-    def test_detect_ball_json_returns_ball_detected_boolean(self) -> None:
+    def test_detect_ball_json_returns_ball_detected_boolean(
+        self, ball_json: Dict[str, Any]
+    ) -> None:
         """Verify ball_detected boolean key."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json(frame, device="cpu")
+        assert "ball_detected" in ball_json
+        assert isinstance(ball_json["ball_detected"], bool)
 
-        assert "ball_detected" in result
-        assert isinstance(result["ball_detected"], bool)
-
-    def test_detect_ball_json_ball_detected_matches_ball_exists(self) -> None:
+    def test_detect_ball_json_ball_detected_matches_ball_exists(
+        self, ball_json: Dict[str, Any]
+    ) -> None:
         """Verify ball_detected matches if ball exists."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json(frame, device="cpu")
+        assert (ball_json["ball_detected"] is True) == (ball_json["ball"] is not None)
 
-        assert (result["ball_detected"] is True) == (result["ball"] is not None)
-
-    def test_detect_ball_json_count_matches_detections_length(self) -> None:
+    def test_detect_ball_json_count_matches_detections_length(
+        self, ball_json: Dict[str, Any]
+    ) -> None:
         """Verify count matches length of detections list."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json(frame, device="cpu")
+        assert ball_json["count"] == len(ball_json["detections"])
 
-        assert result["count"] == len(result["detections"])
-
-    def test_detect_ball_json_detections_have_xyxy(self) -> None:
+    def test_detect_ball_json_detections_have_xyxy(self, ball_json: Dict[str, Any]) -> None:
         """Verify each detection has xyxy coordinates."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json(frame, device="cpu")
-
-        for det in result["detections"]:
+        for det in ball_json["detections"]:
             assert "xyxy" in det
             assert len(det["xyxy"]) == 4
 
-    def test_detect_ball_json_detections_have_confidence(self) -> None:
+    def test_detect_ball_json_detections_have_confidence(self, ball_json: Dict[str, Any]) -> None:
         """Verify each detection has confidence score."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json(frame, device="cpu")
-
-        for det in result["detections"]:
+        for det in ball_json["detections"]:
             assert "confidence" in det
             assert isinstance(det["confidence"], float)
             assert 0.0 <= det["confidence"] <= 1.0
 
-    def test_detect_ball_json_ball_is_highest_confidence(self) -> None:
+    def test_detect_ball_json_ball_is_highest_confidence(self, ball_json: Dict[str, Any]) -> None:
         """Verify ball is highest confidence detection."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json(frame, device="cpu")
+        if ball_json["detections"]:
+            max_conf = max(d["confidence"] for d in ball_json["detections"])
+            assert ball_json["ball"]["confidence"] == max_conf
 
-        if result["detections"]:
-            max_conf = max(d["confidence"] for d in result["detections"])
-            assert result["ball"]["confidence"] == max_conf
-
-    def test_detect_ball_json_respects_confidence_parameter(self) -> None:
+    def test_detect_ball_json_respects_confidence_parameter(self, zero_frame: np.ndarray) -> None:
         """Verify confidence parameter is respected."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result_low = detect_ball_json(frame, device="cpu", confidence=0.10)
-        result_high = detect_ball_json(frame, device="cpu", confidence=0.90)
+        result_low = detect_ball_json(zero_frame, device="cpu", confidence=0.10)
+        result_high = detect_ball_json(zero_frame, device="cpu", confidence=0.90)
 
         # Higher confidence should result in fewer or equal detections
         assert result_high["count"] <= result_low["count"]
 
-    def test_detect_ball_json_accepts_device_parameter(self) -> None:
+    def test_detect_ball_json_accepts_device_parameter(self, ball_json: Dict[str, Any]) -> None:
         """Verify device parameter is accepted."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json(frame, device="cpu")
-
-        assert result is not None
+        assert ball_json is not None
 
 
 class TestDetectBallJSONWithAnnotated:
     """Tests for detect_ball_json_with_annotated_frame function."""
 
-    def test_detect_ball_with_annotated_returns_dict(self) -> None:
+    def test_detect_ball_with_annotated_returns_dict(
+        self, ball_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify returns dictionary."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json_with_annotated_frame(frame, device="cpu")
+        assert isinstance(ball_json_annotated, dict)
 
-        assert isinstance(result, dict)
-
-    def test_detect_ball_with_annotated_includes_detections(self) -> None:
+    def test_detect_ball_with_annotated_includes_detections(
+        self, ball_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify includes detections key."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json_with_annotated_frame(frame, device="cpu")
-
-        assert "detections" in result
-        assert isinstance(result["detections"], list)
+        assert "detections" in ball_json_annotated
+        assert isinstance(ball_json_annotated["detections"], list)
 
-    def test_detect_ball_with_annotated_includes_count(self) -> None:
+    def test_detect_ball_with_annotated_includes_count(
+        self, ball_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify includes count key."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json_with_annotated_frame(frame, device="cpu")
+        assert "count" in ball_json_annotated
+        assert isinstance(ball_json_annotated["count"], int)
 
-        assert "count" in result
-        assert isinstance(result["count"], int)
-
-    def test_detect_ball_with_annotated_includes_ball_detected(self) -> None:
+    def test_detect_ball_with_annotated_includes_ball_detected(
+        self, ball_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify includes ball_detected boolean."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json_with_annotated_frame(frame, device="cpu")
+        assert "ball_detected" in ball_json_annotated
+        assert isinstance(ball_json_annotated["ball_detected"], bool)
 
-        assert "ball_detected" in result
-        assert isinstance(result["ball_detected"], bool)
-
-    def test_detect_ball_with_annotated_returns_base64(self) -> None:
+    def test_detect_ball_with_annotated_returns_base64(
+        self, ball_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify returns annotated_frame_base64 key."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json_with_annotated_frame(frame, device="cpu")
-
-        assert "annotated_frame_base64" in result
-        assert isinstance(result["annotated_frame_base64"], str)
+        assert "annotated_frame_base64" in ball_json_annotated
+        assert isinstance(ball_json_annotated["annotated_frame_base64"], str)
 
-    def test_detect_ball_with_annotated_base64_is_valid(self) -> None:
+    def test_detect_ball_with_annotated_base64_is_valid(
+        self, ball_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify annotated_frame_base64 is valid base64."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json_with_annotated_frame(frame, device="cpu")
-
         try:
-            decoded = base64.b64decode(result["annotated_frame_base64"])
+            decoded = base64.b64decode(ball_json_annotated["annotated_frame_base64"])
             assert len(decoded) > 0
         except Exception as exc:
             pytest.fail(f"Invalid base64: {exc}")
 
-    def test_detect_ball_with_annotated_respects_device(self) -> None:
+    def test_detect_ball_with_annotated_respects_device(
+        self, ball_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify respects device parameter."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json_with_annotated_frame
+        assert ball_json_annotated is not None
 
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json_with_annotated_frame(frame, device="cpu")
+    def test_detect_ball_with_annotated_respects_confidence(self, zero_frame: np.ndarray) -> None:
+        """Verify respects confidence parameter."""
+        result = detect_ball_json_with_annotated_frame(zero_frame, device="cpu", confidence=0.50)
 
         assert result is not None
+        assert "annotated_frame_base64" in result
 
-    def test_detect_ball_with_annotated_respects_confidence(self) -> None:
-        """Verify respects confidence parameter."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            detect_ball_json_with_annotated_frame
 
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_ball_json_with_annotated_frame(frame, device="cpu", confidence=0.50)
+class TestDetectBallJSONBatch:
+    """Tests for detect_ball_json_batch function."""
 
-        assert result is not None
-        assert "annotated_frame_base64" in result
+    def test_detect_ball_json_batch_returns_one_result_per_frame(
+        self, zero_frame: np.ndarray
+    ) -> None:
+        """Verify one result dict per frame with ball-specific fields."""
+        frames = [zero_frame] * 2
+        results = detect_ball_json_batch(frames, device="cpu")
+
+        assert len(results) == 2
+        for result in results:
+            assert "ball" in result
+            assert result["ball_detected"] == (result["ball"] is not None)
 
 
 class TestBallDetectionModelCaching:
@@ -293,17 +218,11 @@ class TestBallDetectionModelCaching:
 
     def test_get_ball_detection_model_returns_instance(self) -> None:
         """Verify get_ball_detection_model returns model."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            get_ball_detection_model
-
         model = get_ball_detection_model(device="cpu")
         assert model is not None
 
     def test_get_ball_detection_model_cached(self) -> None:
         """Verify model is cached after first call."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            get_ball_detection_model
-
         model1 = get_ball_detection_model(device="cpu")
         model2 = get_ball_detection_model(device="cpu")
 
@@ -313,59 +232,39 @@ class TestBallDetectionModelCaching:
 class TestRunBallDetection:
     """Tests for legacy run_ball_detection function."""
 
-    def test_run_ball_detection_returns_dict(self) -> None:
+    def test_run_ball_detection_returns_dict(self, zero_frame: np.ndarray) -> None:
         """Verify run_ball_detection returns dictionary."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            run_ball_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu", "include_annotated": False}
-        result = run_ball_detection(frame, config)
+        result = run_ball_detection(zero_frame, config)
 
         assert isinstance(result, dict)
 
-    def test_run_ball_detection_json_mode(self) -> None:
+    def test_run_ball_detection_json_mode(self, zero_frame: np.ndarray) -> None:
         """Verify JSON mode returns detections without base64."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            run_ball_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu", "include_annotated": False}
-        result = run_ball_detection(frame, config)
+        result = run_ball_detection(zero_frame, config)
 
         assert "detections" in result
         assert "annotated_frame_base64" not in result
 
-    def test_run_ball_detection_annotated_mode(self) -> None:
+    def test_run_ball_detection_annotated_mode(self, zero_frame: np.ndarray) -> None:
         """Verify annotated mode includes base64."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            run_ball_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu", "include_annotated": True}
-        result = run_ball_detection(frame, config)
+        result = run_ball_detection(zero_frame, config)
 
         assert "detections" in result
         assert "annotated_frame_base64" in result
 
-    def test_run_ball_detection_respects_config_device(self) -> None:
+    def test_run_ball_detection_respects_config_device(self, zero_frame: np.ndarray) -> None:
         """Verify config device parameter is respected."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            run_ball_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu"}
-        result = run_ball_detection(frame, config)
+        result = run_ball_detection(zero_frame, config)
 
         assert result is not None
 
-    def test_run_ball_detection_respects_config_confidence(self) -> None:
+    def test_run_ball_detection_respects_config_confidence(self, zero_frame: np.ndarray) -> None:
         """Verify config confidence parameter is respected."""
-        from forgesyte_yolo_tracker.inference.ball_detection import \
-            run_ball_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu", "confidence": 0.30}
-        result = run_ball_detection(frame, config)
+        result = run_ball_detection(zero_frame, config)
 
         assert result is not None
@@ -13,285 +13,187 @@ import pytest
 
 from tests_heavy.constants import MODELS_EXIST, RUN_MODEL_TESTS
 
-pytestmark = pytest.mark.skipif(
-    not RUN_MODEL_TESTS or not MODELS_EXIST,
-    reason="Set RUN_MODEL_TESTS=1 AND download models to run",
+# Skip before importing the detector, which pulls in ultralytics and torch
+if not RUN_MODEL_TESTS or not MODELS_EXIST:
+    pytest.skip("Set RUN_MODEL_TESTS=1 AND download models to run", allow_module_level=True)
+
+from forgesyte_yolo_tracker.inference.pitch_detection import (  # noqa: E402
+    PITCH_DETECTOR,
+    detect_pitch_json,
+    detect_pitch_json_with_annotated_frame,
+    get_pitch_detection_model,
+    run_pitch_detection,
 )
 
 
+@pytest.fixture(scope="module")
+def pitch_json(zero_frame: np.ndarray) -> Dict[str, Any]:
+    """detect_pitch_json on the zero frame, run once for every test that only reads it."""
+    return detect_pitch_json(zero_frame, device="cpu")
+
+
+@pytest.fixture(scope="module")
+def pitch_json_annotated(zero_frame: np.ndarray) -> Dict[str, Any]:
+    """detect_pitch_json_with_annotated_frame on the zero frame, run once."""
+    return detect_pitch_json_with_annotated_frame(zero_frame, device="cpu")
+
+
 class TestPitchDetectorConfiguration:
     """Tests for pitch detector configuration."""
 
     def test_pitch_detector_name_is_correct(self) -> None:
         """Verify detector name is 'pitch'."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            PITCH_DETECTOR
-
         assert PITCH_DETECTOR.detector_name == "pitch"
 
     def test_pitch_default_confidence_is_0_25(self) -> None:
         """Verify default confidence is 0.25."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            PITCH_DETECTOR
-
         assert PITCH_DETECTOR.default_confidence == 0.25
 
     def test_pitch_imgsz_is_1280(self) -> None:
         """Verify imgsz is 1280 for pitch."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            PITCH_DETECTOR
-
         assert PITCH_DETECTOR.imgsz == 1280
 
     def test_pitch_class_names_is_none(self) -> None:
         """Verify class_names is None (uses keypoints)."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            PITCH_DETECTOR
-
         assert PITCH_DETECTOR.class_names is None
 
     def test_pitch_colors_defined(self) -> None:
         """Verify colors defined for pitch detector."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            PITCH_DETECTOR
-
         assert PITCH_DETECTOR.colors is not None
 
 
 class TestDetectPitchJSON:
     """Tests for detect_pitch_json function."""
 
-    def test_detect_pitch_json_returns_dict(self) -> None:
+    def test_detect_pitch_json_returns_dict(self, pitch_json: Dict[str, Any]) -> None:
         """Verify detect_pitch_json returns dictionary."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json(frame, device="cpu")
-
-        assert isinstance(result, dict)
+        assert isinstance(pitch_json, dict)
 
-    def test_detect_pitch_json_returns_keypoints_key(self) -> None:
+    def test_detect_pitch_json_returns_keypoints_key(self, pitch_json: Dict[str, Any]) -> None:
         """Verify keypoints key in result."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json
+        assert "keypoints" in pitch_json
+        assert isinstance(pitch_json["keypoints"], list)
 
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json(frame, device="cpu")
-
-        assert "keypoints" in result
-        assert isinstance(result["keypoints"], list)
-
-    def test_detect_pitch_json_returns_count(self) -> None:
+    def test_detect_pitch_json_returns_count(self, pitch_json: Dict[str, Any]) -> None:
         """Verify count key in result."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json(frame, device="cpu")
+        assert "count" in pitch_json
+        assert isinstance(pitch_json["count"], int)
 
-        assert "count" in result
-        assert isinstance(result["count"], int)
-
-    def test_detect_pitch_json_returns_pitch_polygon(self) -> None:
+    def test_detect_pitch_json_returns_pitch_polygon(self, pitch_json: Dict[str, Any]) -> None:
         """Verify pitch_polygon key in result."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json(frame, device="cpu")
+        assert "pitch_polygon" in pitch_json
+        assert isinstance(pitch_json["pitch_polygon"], list)
 
-        assert "pitch_polygon" in result
-        assert isinstance(result["pitch_polygon"], list)
-
-    def test_detect_pitch_json_returns_pitch_detected_boolean(self) -> None:
+    def test_detect_pitch_json_returns_pitch_detected_boolean(
+        self, pitch_json: Dict[str, Any]
+    ) -> None:
         """Verify pitch_detected boolean key."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json(frame, device="cpu")
+        assert "pitch_detected" in pitch_json
+        assert isinstance(pitch_json["pitch_detected"], bool)
 
-        assert "pitch_detected" in result
-        assert isinstance(result["pitch_detected"], bool)
-
-    def test_detect_pitch_json_returns_homography(self) -> None:
+    def test_detect_pitch_json_returns_homography(self, pitch_json: Dict[str, Any]) -> None:
         """Verify homography key in result."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json(frame, device="cpu")
+        assert "homography" in pitch_json
 
-        assert "homography" in result
-
-    def test_detect_pitch_json_pitch_detected_true_when_4_corners(self) -> None:
+    def test_detect_pitch_json_pitch_detected_true_when_4_corners(
+        self, pitch_json: Dict[str, Any]
+    ) -> None:
         """Verify pitch_detected is true when >= 4 corners."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json(frame, device="cpu")
+        assert (pitch_json["pitch_detected"] is True) == (len(pitch_json["pitch_polygon"]) >= 4)
 
-        assert (result["pitch_detected"] is True) == (len(result["pitch_polygon"]) >= 4)
-
-    def test_detect_pitch_json_keypoints_have_xy(self) -> None:
+    def test_detect_pitch_json_keypoints_have_xy(self, pitch_json: Dict[str, Any]) -> None:
         """Verify each keypoint has xy coordinates."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json(frame, device="cpu")
-
-        for kp in result["keypoints"]:
+        for kp in pitch_json["keypoints"]:
             assert "xy" in kp
             assert len(kp["xy"]) == 2
 
-    def test_detect_pitch_json_keypoints_have_confidence(self) -> None:
+    def test_detect_pitch_json_keypoints_have_confidence(self, pitch_json: Dict[str, Any]) -> None:
         """Verify each keypoint has confidence."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json(frame, device="cpu")
-
-        for kp in result["keypoints"]:
+        for kp in pitch_json["keypoints"]:
             assert "confidence" in kp
             assert isinstance(kp["confidence"], float)
 
-    def test_detect_pitch_json_keypoints_have_name(self) -> None:
+    def test_detect_pitch_json_keypoints_have_name(self, pitch_json: Dict[str, Any]) -> None:
         """Verify each keypoint has name."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json(frame, device="cpu")
-
-        for kp in result["keypoints"]:
+        for kp in pitch_json["keypoints"]:
             assert "name" in kp
             assert isinstance(kp["name"], str)
 
-    def test_detect_pitch_json_count_matches_keypoints_length(self) -> None:
+    def test_detect_pitch_json_count_matches_keypoints_length(
+        self, pitch_json: Dict[str, Any]
+    ) -> None:
         """Verify count matches length of keypoints list."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json(frame, device="cpu")
+        assert pitch_json["count"] == len(pitch_json["keypoints"])
 
-        assert result["count"] == len(result["keypoints"])
-
-    def test_detect_pitch_json_respects_confidence_parameter(self) -> None:
+    def test_detect_pitch_json_respects_confidence_parameter(self, zero_frame: np.ndarray) -> None:
         """Verify confidence parameter is respected."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result_low = detect_pitch_json(frame, device="cpu", confidence=0.10)
-        result_high = detect_pitch_json(frame, device="cpu", confidence=0.90)
+        result_low = detect_pitch_json(zero_frame, device="cpu", confidence=0.10)
+        result_high = detect_pitch_json(zero_frame, device="cpu", confidence=0.90)
 
         # Higher confidence should result in fewer or equal detections
         assert result_high["count"] <= result_low["count"]
 
-    def test_detect_pitch_json_accepts_device_parameter(self) -> None:
+    def test_detect_pitch_json_accepts_device_parameter(self, pitch_json: Dict[str, Any]) -> None:
         """Verify device parameter is accepted."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json(frame, device="cpu")
-
-        assert result is not None
+        assert pitch_json is not None
 
 
 class TestDetectPitchJSONWithAnnotated:
     """Tests for detect_pitch_json_with_annotated_frame function."""
 
-    def test_detect_pitch_with_annotated_returns_dict(self) -> None:
+    def test_detect_pitch_with_annotated_returns_dict(
+        self, pitch_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify returns dictionary."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json_with_annotated_frame(frame, device="cpu")
-
-        assert isinstance(result, dict)
+        assert isinstance(pitch_json_annotated, dict)
 
-    def test_detect_pitch_with_annotated_includes_keypoints(self) -> None:
+    def test_detect_pitch_with_annotated_includes_keypoints(
+        self, pitch_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify includes keypoints key."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json_with_annotated_frame
+        assert "keypoints" in pitch_json_annotated
+        assert isinstance(pitch_json_annotated["keypoints"], list)
 
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json_with_annotated_frame(frame, device="cpu")
-
-        assert "keypoints" in result
-        assert isinstance(result["keypoints"], list)
-
-    def test_detect_pitch_with_annotated_includes_count(self) -> None:
+    def test_detect_pitch_with_annotated_includes_count(
+        self, pitch_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify includes count key."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json_with_annotated_frame(frame, device="cpu")
+        assert "count" in pitch_json_annotated
+        assert isinstance(pitch_json_annotated["count"], int)
 
-        assert "count" in result
-        assert isinstance(result["count"], int)
-
-    def test_detect_pitch_with_annotated_includes_pitch_detected(self) -> None:
+    def test_detect_pitch_with_annotated_includes_pitch_detected(
+        self, pitch_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify includes pitch_detected boolean."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json_with_annotated_frame(frame, device="cpu")
+        assert "pitch_detected" in pitch_json_annotated
+        assert isinstance(pitch_json_annotated["pitch_detected"], bool)
 
-        assert "pitch_detected" in result
-        assert isinstance(result["pitch_detected"], bool)
-
-    def test_detect_pitch_with_annotated_returns_base64(self) -> None:
+    def test_detect_pitch_with_annotated_returns_base64(
+        self, pitch_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify returns annotated_frame_base64 key."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json_with_annotated_frame(frame, device="cpu")
+        assert "annotated_frame_base64" in pitch_json_annotated
+        assert isinstance(pitch_json_annotated["annotated_frame_base64"], str)
 
-        assert "annotated_frame_base64" in result
-        assert isinstance(result["annotated_frame_base64"], str)
-
-    def test_detect_pitch_with_annotated_base64_is_valid(self) -> None:
+    def test_detect_pitch_with_annotated_base64_is_valid(
+        self, pitch_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify annotated_frame_base64 is valid base64."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json_with_annotated_frame(frame, device="cpu")
-
         try:
-            decoded = base64.b64decode(result["annotated_frame_base64"])
+            decoded = base64.b64decode(pitch_json_annotated["annotated_frame_base64"])
             assert len(decoded) > 0
         except Exception as exc:
             pytest.fail(f"Invalid base64: {exc}")
 
-    def test_detect_pitch_with_annotated_respects_device(self) -> None:
+    def test_detect_pitch_with_annotated_respects_device(
+        self, pitch_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify respects device parameter."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json_with_annotated_frame
+        assert pitch_json_annotated is not None
 
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json_with_annotated_frame(frame, device="cpu")
-
-        assert result is not None
-
-    def test_detect_pitch_with_annotated_respects_confidence(self) -> None:
+    def test_detect_pitch_with_annotated_respects_confidence(self, zero_frame: np.ndarray) -> None:
         """Verify respects confidence parameter."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            detect_pitch_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_pitch_json_with_annotated_frame(frame, device="cpu", confidence=0.50)
+        result = detect_pitch_json_with_annotated_frame(zero_frame, device="cpu", confidence=0.50)
 
         assert result is not None
         assert "annotated_frame_base64" in result
@@ -302,17 +204,11 @@ class TestPitchDetectionModelCaching:
 
     def test_get_pitch_detection_model_returns_instance(self) -> None:
         """Verify get_pitch_detection_model returns model."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            get_pitch_detection_model
-
         model = get_pitch_detection_model(device="cpu")
         assert model is not None
 
     def test_get_pitch_detection_model_cached(self) -> None:
         """Verify model is cached after first call."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            get_pitch_detection_model
-
         model1 = get_pitch_detection_model(device="cpu")
         model2 = get_pitch_detection_model(device="cpu")
 
@@ -322,59 +218,39 @@ class TestPitchDetectionModelCaching:
 class TestRunPitchDetection:
     """Tests for legacy run_pitch_detection function."""
 
-    def test_run_pitch_detection_returns_dict(self) -> None:
+    def test_run_pitch_detection_returns_dict(self, zero_frame: np.ndarray) -> None:
         """Verify run_pitch_detection returns dictionary."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            run_pitch_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu", "include_annotated": False}
-        result = run_pitch_detection(frame, config)
+        result = run_pitch_detection(zero_frame, config)
 
         assert isinstance(result, dict)
 
-    def test_run_pitch_detection_json_mode(self) -> None:
+    def test_run_pitch_detection_json_mode(self, zero_frame: np.ndarray) -> None:
         """Verify JSON mode returns keypoints without base64."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            run_pitch_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu", "include_annotated": False}
-        result = run_pitch_detection(frame, config)
+        result = run_pitch_detection(zero_frame, config)
 
         assert "keypoints" in result
         assert "annotated_frame_base64" not in result
 
-    def test_run_pitch_detection_annotated_mode(self) -> None:
+    def test_run_pitch_detection_annotated_mode(self, zero_frame: np.ndarray) -> None:
         """Verify annotated mode includes base64."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            run_pitch_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu", "include_annotated": True}
-        result = run_pitch_detection(frame, config)
+        result = run_pitch_detection(zero_frame, config)
 
         assert "keypoints" in result
         assert "annotated_frame_base64" in result
 
-    def test_run_pitch_detection_respects_config_device(self) -> None:
+    def test_run_pitch_detection_respects_config_device(self, zero_frame: np.ndarray) -> None:
         """Verify config device parameter is respected."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            run_pitch_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu"}
-        result = run_pitch_detection(frame, config)
+        result = run_pitch_detection(zero_frame, config)
 
         assert result is not None
 
-    def test_run_pitch_detection_respects_config_confidence(self) -> None:
+    def test_run_pitch_detection_respects_config_confidence(self, zero_frame: np.ndarray) -> None:
         """Verify config confidence parameter is respected."""
-        from forgesyte_yolo_tracker.inference.pitch_detection import \
-            run_pitch_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu", "confidence": 0.30}
-        result = run_pitch_detection(frame, config)
+        result = run_pitch_detection(zero_frame, config)
 
         assert result is not None
@@ -13,81 +13,74 @@ import pytest
 
 from tests_heavy.constants import MODELS_EXIST, RUN_MODEL_TESTS
 
-pytestmark = pytest.mark.skipif(
-    not RUN_MODEL_TESTS or not MODELS_EXIST,
-    reason="Set RUN_MODEL_TESTS=1 AND download models to run",
+# Skip before importing the detector, which pulls in ultralytics and torch
+if not RUN_MODEL_TESTS or not MODELS_EXIST:
+    pytest.skip("Set RUN_MODEL_TESTS=1 AND download models to run", allow_module_level=True)
+
+from forgesyte_yolo_tracker.inference.player_detection import (  # noqa: E402
+    PLAYER_DETECTOR,
+    detect_players_json,
+    detect_players_json_batch,
+    detect_players_json_with_annotated_frame,
+    get_player_detection_model,
+    run_player_detection,
 )
 
 
+@pytest.fixture(scope="module")
+def players_json(zero_frame: np.ndarray) -> Dict[str, Any]:
+    """detect_players_json on the zero frame, run once for every test that only reads it."""
+    return detect_players_json(zero_frame, device="cpu")
+
+
+@pytest.fixture(scope="module")
+def players_json_annotated(zero_frame: np.ndarray) -> Dict[str, Any]:
+    """detect_players_json_with_annotated_frame on the zero frame, run once."""
+    return detect_players_json_with_annotated_frame(zero_frame, device="cpu")
+
+
 class TestPlayerDetectorConfiguration:
     """Tests for player detector configuration."""
 
     def test_player_detector_name_is_correct(self) -> None:
         """Verify detector name is 'player'."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            PLAYER_DETECTOR
-
         assert PLAYER_DETECTOR.detector_name == "player"
 
     def test_player_default_confidence_is_0_25(self) -> None:
         """Verify default confidence is 0.25."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            PLAYER_DETECTOR
-
         assert PLAYER_DETECTOR.default_confidence == 0.25
 
     def test_player_imgsz_is_1280(self) -> None:
         """Verify imgsz is 1280 for players."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            PLAYER_DETECTOR
-
         assert PLAYER_DETECTOR.imgsz == 1280
 
     def test_player_class_names_has_4_classes(self) -> None:
         """Verify 4 class names defined."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            PLAYER_DETECTOR
-
         assert PLAYER_DETECTOR.class_names is not None
         assert len(PLAYER_DETECTOR.class_names) == 4
 
     def test_player_class_names_includes_ball(self) -> None:
         """Verify 'ball' in class names."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            PLAYER_DETECTOR
-
         assert PLAYER_DETECTOR.class_names is not None
         assert "ball" in PLAYER_DETECTOR.class_names.values()
 
     def test_player_class_names_includes_goalkeeper(self) -> None:
         """Verify 'goalkeeper' in class names."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            PLAYER_DETECTOR
-
         assert PLAYER_DETECTOR.class_names is not None
         assert "goalkeeper" in PLAYER_DETECTOR.class_names.values()
 
     def test_player_class_names_includes_player(self) -> None:
         """Verify 'player' in class names."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            PLAYER_DETECTOR
-
         assert PLAYER_DETECTOR.class_names is not None
         assert "player" in PLAYER_DETECTOR.class_names.values()
 
     def test_player_class_names_includes_referee(self) -> None:
         """Verify 'referee' in class names."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            PLAYER_DETECTOR
-
         assert PLAYER_DETECTOR.class_names is not None
         assert "referee" in PLAYER_DETECTOR.class_names.values()
 
     def test_player_colors_defined(self) -> None:
         """Verify colors defined for player detector."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            PLAYER_DETECTOR
-
         assert PLAYER_DETECTOR.colors is not None
         assert len(PLAYER_DETECTOR.colors) > 0
 
@@ -95,224 +88,161 @@ class TestPlayerDetectorConfiguration:
 class TestDetectPlayersJSON:
     """Tests for detect_players_json function."""
 
-    def test_detect_players_json_returns_dict(self) -> None:
+    def test_detect_players_json_returns_dict(self, players_json: Dict[str, Any]) -> None:
         """Verify detect_players_json returns dictionary."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json
+        assert isinstance(players_json, dict)
 
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json(frame, device="cpu")
-
-        assert isinstance(result, dict)
-
-    def test_detect_players_json_returns_detections_key(self) -> None:
+    def test_detect_players_json_returns_detections_key(self, players_json: Dict[str, Any]) -> None:
         """Verify detections key in result."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json(frame, device="cpu")
+        assert "detections" in players_json
+        assert isinstance(players_json["detections"], list)
 
-        assert "detections" in result
-        assert isinstance(result["detections"], list)
-
-    def test_detect_players_json_returns_count(self) -> None:
+    def test_detect_players_json_returns_count(self, players_json: Dict[str, Any]) -> None:
         """Verify count key in result."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json(frame, device="cpu")
-
-        assert "count" in result
-        assert isinstance(result["count"], int)
+        assert "count" in players_json
+        assert isinstance(players_json["count"], int)
 
-    def test_detect_players_json_returns_classes(self) -> None:
+    def test_detect_players_json_returns_classes(self, players_json: Dict[str, Any]) -> None:
         """Verify classes key in result."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json
+        assert "classes" in players_json
+        assert isinstance(players_json["classes"], dict)
 
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json(frame, device="cpu")
-
-        assert "classes" in result
-        assert isinstance(result["classes"], dict)
-
-    def test_detect_players_json_classes_has_all_4_keys(self) -> None:
+    def test_detect_players_json_classes_has_all_4_keys(self, players_json: Dict[str, Any]) -> None:
         """Verify classes dict has all 4 class names."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json(frame, device="cpu")
-
-        classes = result["classes"]
+        classes = players_json["classes"]
         assert "ball" in classes
         assert "goalkeeper" in classes
         assert "player" in classes
         assert "referee" in classes
 
-    def test_detect_players_json_count_matches_detections_length(self) -> None:
+    def test_detect_players_json_count_matches_detections_length(
+        self, players_json: Dict[str, Any]
+    ) -> None:
         """Verify count matches length of detections list."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json
+        assert players_json["count"] == len(players_json["detections"])
 
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json(frame, device="cpu")
-
-        assert result["count"] == len(result["detections"])
-
-    def test_detect_players_json_detections_have_xyxy(self) -> None:
+    def test_detect_players_json_detections_have_xyxy(self, players_json: Dict[str, Any]) -> None:
         """Verify each detection has xyxy coordinates."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json(frame, device="cpu")
-
-        for det in result["detections"]:
+        for det in players_json["detections"]:
             assert "xyxy" in det
             assert len(det["xyxy"]) == 4
 
-    def test_detect_players_json_detections_have_confidence(self) -> None:
+    def test_detect_players_json_detections_have_confidence(
+        self, players_json: Dict[str, Any]
+    ) -> None:
         """Verify each detection has confidence score."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json(frame, device="cpu")
-
-        for det in result["detections"]:
+        for det in players_json["detections"]:
             assert "confidence" in det
             assert isinstance(det["confidence"], float)
             assert 0.0 <= det["confidence"] <= 1.0
 
-    def test_detect_players_json_detections_have_class_name(self) -> None:
+    def test_detect_players_json_detections_have_class_name(
+        self, players_json: Dict[str, Any]
+    ) -> None:
         """Verify each detection has class_name."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json(frame, device="cpu")
-
-        for det in result["detections"]:
+        for det in players_json["detections"]:
             assert "class_name" in det
             assert det["class_name"] in ["ball", "goalkeeper", "player", "referee"]
 
-    def test_detect_players_json_respects_confidence_parameter(self) -> None:
+    def test_detect_players_json_respects_confidence_parameter(
+        self, zero_frame: np.ndarray
+    ) -> None:
         """Verify confidence parameter is respected."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result_low = detect_players_json(frame, device="cpu", confidence=0.10)
-        result_high = detect_players_json(frame, device="cpu", confidence=0.90)
+        result_low = detect_players_json(zero_frame, device="cpu", confidence=0.10)
+        result_high = detect_players_json(zero_frame, device="cpu", confidence=0.90)
 
         # Higher confidence should result in fewer or equal detections
         assert result_high["count"] <= result_low["count"]
 
-    def test_detect_players_json_accepts_device_parameter(self) -> None:
+    def test_detect_players_json_accepts_device_parameter(
+        self, players_json: Dict[str, Any]
+    ) -> None:
         """Verify device parameter is accepted."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json(frame, device="cpu")
-
-        assert result is not None
+        assert players_json is not None
 
 
 class TestDetectPlayersJSONWithAnnotated:
     """Tests for detect_players_json_with_annotated_frame function."""
 
-    def test_detect_players_with_annotated_returns_dict(self) -> None:
+    def test_detect_players_with_annotated_returns_dict(
+        self, players_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify returns dictionary."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json_with_annotated_frame(frame, device="cpu")
+        assert isinstance(players_json_annotated, dict)
 
-        assert isinstance(result, dict)
-
-    def test_detect_players_with_annotated_includes_detections(self) -> None:
+    def test_detect_players_with_annotated_includes_detections(
+        self, players_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify includes detections key."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json_with_annotated_frame
+        assert "detections" in players_json_annotated
+        assert isinstance(players_json_annotated["detections"], list)
 
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json_with_annotated_frame(frame, device="cpu")
-
-        assert "detections" in result
-        assert isinstance(result["detections"], list)
-
-    def test_detect_players_with_annotated_includes_count(self) -> None:
+    def test_detect_players_with_annotated_includes_count(
+        self, players_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify includes count key."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json_with_annotated_frame(frame, device="cpu")
+        assert "count" in players_json_annotated
+        assert isinstance(players_json_annotated["count"], int)
 
-        assert "count" in result
-        assert isinstance(result["count"], int)
-
-    def test_detect_players_with_annotated_includes_classes(self) -> None:
+    def test_detect_players_with_annotated_includes_classes(
+        self, players_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify includes classes dict."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json_with_annotated_frame(frame, device="cpu")
+        assert "classes" in players_json_annotated
+        assert isinstance(players_json_annotated["classes"], dict)
 
-        assert "classes" in result
-        assert isinstance(result["classes"], dict)
-
-    def test_detect_players_with_annotated_returns_base64(self) -> None:
+    def test_detect_players_with_annotated_returns_base64(
+        self, players_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify returns annotated_frame_base64 key."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json_with_annotated_frame(frame, device="cpu")
-
-        assert "annotated_frame_base64" in result
-        assert isinstance(result["annotated_frame_base64"], str)
+        assert "annotated_frame_base64" in players_json_annotated
+        assert isinstance(players_json_annotated["annotated_frame_base64"], str)
 
-    def test_detect_players_with_annotated_base64_is_valid(self) -> None:
+    def test_detect_players_with_annotated_base64_is_valid(
+        self, players_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify annotated_frame_base64 is valid base64."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json_with_annotated_frame
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json_with_annotated_frame(frame, device="cpu")
-
         try:
-            decoded = base64.b64decode(result["annotated_frame_base64"])
+            decoded = base64.b64decode(players_json_annotated["annotated_frame_base64"])
             assert len(decoded) > 0
         except Exception as exc:
             pytest.fail(f"Invalid base64: {exc}")
 
-    def test_detect_players_with_annotated_respects_device(self) -> None:
+    def test_detect_players_with_annotated_respects_device(
+        self, players_json_annotated: Dict[str, Any]
+    ) -> None:
         """Verify respects device parameter."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json_with_annotated_frame
+        assert players_json_annotated is not None
 
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json_with_annotated_frame(frame, device="cpu")
+    def test_detect_players_with_annotated_respects_confidence(
+        self, zero_frame: np.ndarray
+    ) -> None:
+        """Verify respects confidence parameter."""
+        result = detect_players_json_with_annotated_frame(zero_frame, device="cpu", confidence=0.50)
 
         assert result is not None
+        assert "annotated_frame_base64" in result
 
-    def test_detect_players_with_annotated_respects_confidence(self) -> None:
-        """Verify respects confidence parameter."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            detect_players_json_with_annotated_frame
 
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = detect_players_json_with_annotated_frame(frame, device="cpu", confidence=0.50)
+class TestDetectPlayersJSONBatch:
+    """Tests for detect_players_json_batch function."""
 
-        assert result is not None
-        assert "annotated_frame_base64" in result
+    def test_detect_players_json_batch_returns_one_result_per_frame(
+        self, zero_frame: np.ndarray
+    ) -> None:
+        """Verify one result dict per input frame."""
+        frames = [zero_frame] * 3
+        results = detect_players_json_batch(frames, device="cpu")
+
+        assert len(results) == 3
+        for result in results:
+            assert "detections" in result
+            assert "count" in result
+            assert "classes" in result
+
+    def test_detect_players_json_batch_empty_input(self) -> None:
+        """Verify empty input returns empty list."""
+        assert detect_players_json_batch([], device="cpu") == []
 
 
 class TestPlayerDetectionModelCaching:
@@ -320,17 +250,11 @@ class TestPlayerDetectionModelCaching:
 
     def test_get_player_detection_model_returns_instance(self) -> None:
         """Verify get_player_detection_model returns model."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            get_player_detection_model
-
         model = get_player_detection_model(device="cpu")
         assert model is not None
 
     def test_get_player_detection_model_cached(self) -> None:
         """Verify model is cached after first call."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            get_player_detection_model
-
         model1 = get_player_detection_model(device="cpu")
         model2 = get_player_detection_model(device="cpu")
 
@@ -340,59 +264,39 @@ class TestPlayerDetectionModelCaching:
 class TestRunPlayerDetection:
     """Tests for legacy run_player_detection function."""
 
-    def test_run_player_detection_returns_dict(self) -> None:
+    def test_run_player_detection_returns_dict(self, zero_frame: np.ndarray) -> None:
         """Verify run_player_detection returns dictionary."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            run_player_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu", "include_annotated": False}
-        result = run_player_detection(frame, config)
+        result = run_player_detection(zero_frame, config)
 
         assert isinstance(result, dict)
 
-    def test_run_player_detection_json_mode(self) -> None:
+    def test_run_player_detection_json_mode(self, zero_frame: np.ndarray) -> None:
         """Verify JSON mode returns detections without base64."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            run_player_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu", "include_annotated": False}
-        result = run_player_detection(frame, config)
+        result = run_player_detection(zero_frame, config)
 
         assert "detections" in result
         assert "annotated_frame_base64" not in result
 
-    def test_run_player_detection_annotated_mode(self) -> None:
+    def test_run_player_detection_annotated_mode(self, zero_frame: np.ndarray) -> None:
         """Verify annotated mode includes base64."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            run_player_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu", "include_annotated": True}
-        result = run_player_detection(frame, config)
+        result = run_player_detection(zero_frame, config)
 
         assert "detections" in result
         assert "annotated_frame_base64" in result
 
-    def test_run_player_detection_respects_config_device(self) -> None:
+    def test_run_player_detection_respects_config_device(self, zero_frame: np.ndarray) -> None:
         """Verify config device parameter is respected."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            run_player_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu"}
-        result = run_player_detection(frame, config)
+        result = run_player_detection(zero_frame, config)
 
         assert result is not None
 
-    def test_run_player_detection_respects_config_confidence(self) -> None:
+    def test_run_player_detection_respects_config_confidence(self, zero_frame: np.ndarray) -> None:
         """Verify config confidence parameter is respected."""
-        from forgesyte_yolo_tracker.inference.player_detection import \
-            run_player_detection
-
-        frame = np.zeros((480, 640, 3), dtype=np.uint8)
         config: Dict[str, Any] = {"device": "cpu", "confidence": 0.50}
-        result = run_player_detection(frame, config)
+        result = run_player_detection(zero_frame, config)
 
         assert result is not None
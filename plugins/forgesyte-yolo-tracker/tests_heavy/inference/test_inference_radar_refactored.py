@@ -8,9 +8,8 @@ Run with: RUN_MODEL_TESTS=1 pytest src/tests/test_inference_radar_refactored.py
 """
 
 import base64
-import os
 from io import BytesIO
-from typing import Any
+from typing import Any, Dict
 
 import numpy as np
 import pytest
@@ -20,18 +19,24 @@ try:
 except ImportError:
     Image = None
 
-RUN_MODEL_TESTS = os.getenv("RUN_MODEL_TESTS", "0") == "1"
+from tests_heavy.constants import MODELS_EXIST, RUN_MODEL_TESTS
 
-pytestmark = pytest.mark.skipif(
-    not RUN_MODEL_TESTS,
-    reason="Set RUN_MODEL_TESTS=1 to run (requires YOLO model)",
-)
+if not RUN_MODEL_TESTS or not MODELS_EXIST:
+    pytest.skip("Set RUN_MODEL_TESTS=1 AND download models to run", allow_module_level=True)
 
 
 @pytest.fixture  # type: ignore
-def sample_frame() -> np.ndarray:
-    """Create a sample frame."""
-    return np.zeros((480, 640, 3), dtype=np.uint8)
+def sample_frame(zero_frame: np.ndarray) -> np.ndarray:
+    """Blank sample frame (the shared read-only zero frame)."""
+    return zero_frame
+
+
+@pytest.fixture(scope="module")
+def radar_annotated(zero_frame: np.ndarray) -> Dict[str, Any]:
+    """radar_json_with_annotated_frame on the zero frame, run once for every test that reads it."""
+    from forgesyte_yolo_tracker.inference.radar import radar_json_with_annotated_frame
+
+    return radar_json_with_annotated_frame(zero_frame, device="cpu")
 
 
 @pytest.fixture  # type: ignore
@@ -168,23 +173,17 @@ class TestRadarPointStructure:
 class TestAnnotatedRadarFrame:
     """Tests for annotated radar frame output."""
 
-    def test_annotated_radar_returns_base64(self, sample_frame: np.ndarray) -> None:
+    def test_annotated_radar_returns_base64(self, radar_annotated: Dict[str, Any]) -> None:
         """Verify annotated radar includes base64."""
-        from forgesyte_yolo_tracker.inference.radar import \
-            radar_json_with_annotated_frame
-
-        result = radar_json_with_annotated_frame(sample_frame, device="cpu")
+        result = radar_annotated
 
         assert "radar_base64" in result
         assert isinstance(result["radar_base64"], str)
         assert len(result["radar_base64"]) > 0
 
-    def test_annotated_radar_base64_valid(self, sample_frame: np.ndarray) -> None:
+    def test_annotated_radar_base64_valid(self, radar_annotated: Dict[str, Any]) -> None:
         """Verify base64 string is valid."""
-        from forgesyte_yolo_tracker.inference.radar import \
-            radar_json_with_annotated_frame
-
-        result = radar_json_with_annotated_frame(sample_frame, device="cpu")
+        result = radar_annotated
         b64_str = result["radar_base64"]
 
         try:
@@ -202,15 +201,12 @@ class TestAnnotatedRadarFrame:
 class TestBase64Encoding:
     """Tests for base64 encoding and decoding."""
 
-    def test_base64_decodes_to_png(self, sample_frame: np.ndarray) -> None:
+    def test_base64_decodes_to_png(self, radar_annotated: Dict[str, Any]) -> None:
         """Verify base64 decodes to PNG image."""
         if Image is None:
             pytest.skip("PIL not available")
 
-        from forgesyte_yolo_tracker.inference.radar import \
-            radar_json_with_annotated_frame
-
-        result = radar_json_with_annotated_frame(sample_frame, device="cpu")
+        result = radar_annotated
         b64_str = result["radar_base64"]
 
         try:
@@ -220,22 +216,16 @@ class TestBase64Encoding:
         except Exception as e:
             pytest.fail(f"Could not decode base64 to image: {e}")
 
-    def test_base64_string_not_empty(self, sample_frame: np.ndarray) -> None:
+    def test_base64_string_not_empty(self, radar_annotated: Dict[str, Any]) -> None:
         """Verify base64 string has content."""
-        from forgesyte_yolo_tracker.inference.radar import \
-            radar_json_with_annotated_frame
-
-        result = radar_json_with_annotated_frame(sample_frame, device="cpu")
+        result = radar_annotated
         b64_str = result["radar_base64"]
 
         assert len(b64_str) > 100, "Base64 string too short"
 
-    def test_base64_decode_length(self, sample_frame: np.ndarray) -> None:
+    def test_base64_decode_length(self, radar_annotated: Dict[str, Any]) -> None:
         """Verify decoded base64 has reasonable size."""
-        from forgesyte_yolo_tracker.inference.radar import \
-            radar_json_with_annotated_frame
-
-        result = radar_json_with_annotated_frame(sample_frame, device="cpu")
+        result = radar_annotated
         b64_str = result["radar_base64"]
 
         decoded = base64.b64decode(b64_str)
@@ -326,14 +316,11 @@ class TestRadarJSONSerialization:
         except (TypeError, ValueError) as e:
             pytest.fail(f"Result not JSON serializable: {e}")
 
-    def test_annotated_radar_json_serializable(self, sample_frame: np.ndarray) -> None:
+    def test_annotated_radar_json_serializable(self, radar_annotated: Dict[str, Any]) -> None:
         """Verify annotated radar JSON is serializable."""
         import json
 
-        from forgesyte_yolo_tracker.inference.radar import \
-            radar_json_with_annotated_frame
-
-        result = radar_json_with_annotated_frame(sample_frame, device="cpu")
+        result = radar_annotated
 
         try:
             json_str = json.dumps(result)
@@ -395,24 +382,19 @@ class TestRadarPointCoordinates:
 class TestEmptyFrameHandling:
     """Tests for handling empty frames."""
 
-    def test_empty_frame_returns_valid_response(self) -> None:
+    def test_empty_frame_returns_valid_response(self, zero_frame: np.ndarray) -> None:
         """Verify empty frame returns valid response."""
         from forgesyte_yolo_tracker.inference.radar import generate_radar_json
 
-        empty_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = generate_radar_json(empty_frame, device="cpu")
+        result = generate_radar_json(zero_frame, device="cpu")
 
         assert isinstance(result, dict)
         assert "radar_points" in result
         assert isinstance(result["radar_points"], list)
 
-    def test_empty_frame_with_annotated(self) -> None:
+    def test_empty_frame_with_annotated(self, radar_annotated: Dict[str, Any]) -> None:
         """Verify empty frame returns annotated frame."""
-        from forgesyte_yolo_tracker.inference.radar import \
-            radar_json_with_annotated_frame
-
-        empty_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        result = radar_json_with_annotated_frame(empty_frame, device="cpu")
+        result = radar_annotated
 
         assert isinstance(result, dict)
         assert "radar_base64" in result
@@ -0,0 +1,59 @@
+"""Tests for load_yolo_model's preference for exported models."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# The modules under test import ultralytics at load time
+pytest.importorskip("ultralytics")
+
+
+@pytest.fixture
+def weights(tmp_path: Path) -> Path:
+    path = tmp_path / "model.pt"
+    path.touch()
+    return path
+
+
+class TestLoadYoloModel:
+    """Tests for choosing between .pt, .engine and .onnx files."""
+
+    @pytest.mark.parametrize("device", ["cpu", "cuda"])
+    def test_uses_pt_without_exports(self, weights: Path, device: str) -> None:
+        """Verify the PyTorch weights are loaded and moved when nothing is exported."""
+        from forgesyte_yolo_tracker.inference._base_detector import load_yolo_model
+
+        with (
+            patch("ultralytics.YOLO") as mock_yolo,
+            patch.dict("sys.modules", {"torch": MagicMock()}),
+        ):
+            load_yolo_model(str(weights), device=device)
+
+        mock_yolo.assert_called_once_with(str(weights))
+        mock_yolo.return_value.to.assert_called_once_with(device=device)
+
+    def test_cuda_prefers_engine(self, weights: Path) -> None:
+        """Verify a TensorRT engine next to the weights is used on CUDA."""
+        from forgesyte_yolo_tracker.inference._base_detector import load_yolo_model
+
+        weights.with_suffix(".engine").touch()
+        weights.with_suffix(".onnx").touch()
+        with (
+            patch("ultralytics.YOLO") as mock_yolo,
+            patch.dict("sys.modules", {"torch": MagicMock()}),
+        ):
+            load_yolo_model(str(weights), device="cuda")
+
+        mock_yolo.assert_called_once_with(str(weights.with_suffix(".engine")))
+
+    def test_cpu_prefers_onnx(self, weights: Path) -> None:
+        """Verify an ONNX export is used on CPU and the engine is ignored."""
+        from forgesyte_yolo_tracker.inference._base_detector import load_yolo_model
+
+        weights.with_suffix(".engine").touch()
+        weights.with_suffix(".onnx").touch()
+        with patch("ultralytics.YOLO", return_value=MagicMock()) as mock_yolo:
+            load_yolo_model(str(weights), device="cpu")
+
+        mock_yolo.assert_called_once_with(str(weights.with_suffix(".onnx")))
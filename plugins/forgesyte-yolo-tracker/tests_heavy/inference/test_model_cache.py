@@ -0,0 +1,204 @@
+"""Tests for the shared model cache and the video model pool."""
+
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# The modules under test import ultralytics at load time
+pytest.importorskip("ultralytics")
+
+
+@pytest.fixture
+def isolated_model_cache() -> Iterator[None]:
+    """Run a test against an empty model cache, then restore the previous entries.
+
+    Keeps mock models from leaking into later tests and keeps the models warmed
+    by the session fixture from being discarded.
+    """
+    from forgesyte_yolo_tracker.inference import _base_detector
+
+    with _base_detector._MODELS_LOCK:
+        saved = dict(_base_detector._MODELS)
+        saved_idle = {key: list(idle) for key, idle in _base_detector._IDLE_MODELS.items()}
+        _base_detector._MODELS.clear()
+        _base_detector._IDLE_MODELS.clear()
+    try:
+        yield
+    finally:
+        with _base_detector._MODELS_LOCK:
+            _base_detector._MODELS.clear()
+            _base_detector._MODELS.update(saved)
+            _base_detector._IDLE_MODELS.clear()
+            _base_detector._IDLE_MODELS.update(saved_idle)
+
+
+@pytest.mark.usefixtures("isolated_model_cache")
+class TestModelCache:
+    """Tests for get_cached_model keying and reuse."""
+
+    def test_models_are_cached_per_path_and_device(self) -> None:
+        """Verify each (path, device) loads once and devices never share a model."""
+        from forgesyte_yolo_tracker.inference import _base_detector
+
+        with patch.object(
+            _base_detector, "load_yolo_model", side_effect=lambda path, device: MagicMock()
+        ) as mock_load:
+            cpu_model = _base_detector.get_cached_model("ball.pt", "cpu")
+            cuda_model = _base_detector.get_cached_model("ball.pt", "cuda")
+
+            assert _base_detector.get_cached_model("ball.pt", "cpu") is cpu_model
+            assert cuda_model is not cpu_model
+            assert mock_load.call_count == 2
+
+    def test_video_checkout_honours_device(self) -> None:
+        """Verify a video module borrows the model for the requested device and precision."""
+        from forgesyte_yolo_tracker.video import ball_detection_video
+
+        with patch.object(ball_detection_video, "_checkout_model") as mock_checkout:
+            ball_detection_video.checkout_model("cuda")
+
+        mock_checkout.assert_called_once_with(ball_detection_video.MODEL_PATH, "cuda", half=True)
+
+    def test_models_are_cached_per_precision(self) -> None:
+        """Verify FP16 callers never share an FP32 model."""
+        from forgesyte_yolo_tracker.inference import _base_detector
+
+        with patch.object(
+            _base_detector, "load_yolo_model", side_effect=lambda path, device: MagicMock()
+        ):
+            fp32 = _base_detector.get_cached_model("ball.pt", "cuda")
+            fp16 = _base_detector.get_cached_model("ball.pt", "cuda", half=True)
+
+            assert fp16 is not fp32
+            assert _base_detector.get_cached_model("ball.pt", "cuda", half=True) is fp16
+
+    def test_fp16_and_fp32_calls_get_their_own_weights(self) -> None:
+        """Verify an FP16 call converts its own copy and leaves a later FP32 call alone."""
+        from forgesyte_yolo_tracker.inference import _base_detector
+
+        with patch.object(
+            _base_detector, "load_yolo_model", side_effect=lambda path, device: MagicMock()
+        ):
+            fp16 = _base_detector.get_cached_model("ball.pt", "cuda", half=True)
+            fp32 = _base_detector.get_cached_model("ball.pt", "cuda", half=False)
+
+            fp16.model.half.assert_called_once()
+            fp32.model.half.assert_not_called()
+
+    def test_player_modules_share_one_model(self) -> None:
+        """Verify tracking, radar and the detector load the player weights once."""
+        from forgesyte_yolo_tracker.inference import _base_detector, player_tracking, radar
+        from forgesyte_yolo_tracker.inference.player_detection import PLAYER_DETECTOR
+        from forgesyte_yolo_tracker.video import player_detection_video
+
+        weights = MagicMock(st_size=4096)
+        with patch.object(
+            _base_detector, "load_yolo_model", side_effect=lambda path, device: MagicMock()
+        ) as mock_load, patch.object(
+            _base_detector.Path, "exists", return_value=True
+        ), patch.object(_base_detector.Path, "stat", return_value=weights):
+            model = player_tracking.get_player_detection_model("cpu")
+
+            assert radar.get_player_detection_model("cpu") is model
+            assert PLAYER_DETECTOR.get_model("cpu") is model
+            assert mock_load.call_count == 1
+
+            # The video pipeline streams from its own thread, so it gets its own copy
+            with player_detection_video.checkout_model("cpu") as video_model:
+                assert video_model is not model
+            assert mock_load.call_count == 2
+
+    def test_detector_caches_a_model_per_device(self) -> None:
+        """Verify CPU and CUDA models live side by side instead of evicting each other."""
+        from forgesyte_yolo_tracker.inference import _base_detector
+
+        detector = _base_detector.BaseDetector(
+            detector_name="test", model_name="test.pt", default_confidence=0.25
+        )
+        weights = MagicMock(st_size=4096)
+        with patch.object(
+            _base_detector, "load_yolo_model", side_effect=lambda path, device: MagicMock()
+        ) as mock_load, patch.object(
+            _base_detector.Path, "exists", return_value=True
+        ), patch.object(_base_detector.Path, "stat", return_value=weights):
+            cpu_model = detector.get_model("cpu")
+            cuda_model = detector.get_model("cuda")
+
+            assert cuda_model is not cpu_model
+            assert detector.get_model("cpu") is cpu_model
+            assert detector.get_model("cuda") is cuda_model
+            assert mock_load.call_count == 2
+
+    def test_clearing_the_cache_reloads_detector_models(self) -> None:
+        """Verify a detector picks up the same fresh model as other modules after a clear."""
+        from forgesyte_yolo_tracker.inference import _base_detector, player_tracking
+        from forgesyte_yolo_tracker.inference.player_detection import PLAYER_DETECTOR
+
+        weights = MagicMock(st_size=4096)
+        with patch.object(
+            _base_detector, "load_yolo_model", side_effect=lambda path, device: MagicMock()
+        ), patch.object(_base_detector.Path, "exists", return_value=True), patch.object(
+            _base_detector.Path, "stat", return_value=weights
+        ):
+            before = PLAYER_DETECTOR.get_model("cpu")
+            _base_detector.clear_model_cache()
+            after = PLAYER_DETECTOR.get_model("cpu")
+
+            assert after is not before
+            assert player_tracking.get_player_detection_model("cpu") is after
+
+
+@pytest.mark.usefixtures("isolated_model_cache")
+class TestModelPool:
+    """Tests for checkout_model reuse and exclusivity."""
+
+    def test_sequential_streams_reuse_one_model(self) -> None:
+        """Verify a returned model is handed to the next stream instead of reloading."""
+        from forgesyte_yolo_tracker.inference import _base_detector
+
+        with patch.object(
+            _base_detector, "load_yolo_model", side_effect=lambda path, device: MagicMock()
+        ) as mock_load:
+            with _base_detector.checkout_model("ball.pt", "cuda", half=True) as first:
+                pass
+            with _base_detector.checkout_model("ball.pt", "cuda", half=True) as second:
+                pass
+
+        assert second is first
+        assert mock_load.call_count == 1
+        first.model.half.assert_called_once()
+
+    def test_concurrent_streams_get_their_own_models(self) -> None:
+        """Verify a model is never handed out while another stream holds it."""
+        from forgesyte_yolo_tracker.inference import _base_detector
+
+        with patch.object(
+            _base_detector, "load_yolo_model", side_effect=lambda path, device: MagicMock()
+        ) as mock_load:
+            with _base_detector.checkout_model("ball.pt", "cpu") as first:
+                with _base_detector.checkout_model("ball.pt", "cpu") as second:
+                    assert second is not first
+                    assert _base_detector.get_cached_model("ball.pt", "cpu") not in (
+                        first,
+                        second,
+                    )
+            with _base_detector.checkout_model("ball.pt", "cpu") as third:
+                assert third in (first, second)
+
+        assert mock_load.call_count == 3
+
+    def test_model_is_returned_when_the_stream_fails(self) -> None:
+        """Verify an exception inside the stream still puts the model back."""
+        from forgesyte_yolo_tracker.inference import _base_detector
+
+        with patch.object(
+            _base_detector, "load_yolo_model", side_effect=lambda path, device: MagicMock()
+        ) as mock_load:
+            with pytest.raises(RuntimeError):
+                with _base_detector.checkout_model("ball.pt", "cpu"):
+                    raise RuntimeError("decode failed")
+            with _base_detector.checkout_model("ball.pt", "cpu"):
+                pass
+
+        assert mock_load.call_count == 1
@@ -0,0 +1,39 @@
+"""Tests for the track IDs player tracking inference reads from ByteTrack."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import supervision as sv
+
+# The modules under test import ultralytics at load time
+pytest.importorskip("ultralytics")
+
+
+def _tracked_detections() -> sv.Detections:
+    return sv.Detections(
+        xyxy=np.array([[0, 0, 10, 10], [5, 5, 20, 20]], dtype=np.float32),
+        confidence=np.array([0.9, 0.8], dtype=np.float32),
+        class_id=np.array([1, 7]),
+        tracker_id=np.array([3, 4]),
+    )
+
+
+class TestTrackIds:
+    """Tests for _track's detection records."""
+
+    def test_reads_tracker_ids_as_python_ints(self) -> None:
+        """Verify tracker IDs and class IDs come out as plain ints."""
+        from forgesyte_yolo_tracker.inference import player_tracking
+
+        tracker = MagicMock()
+        tracker.update_with_detections.return_value = _tracked_detections()
+        with patch.object(player_tracking, "get_player_detection_model"), patch.object(
+            player_tracking.sv.Detections, "from_ultralytics"
+        ), patch.object(player_tracking.ByteTrackFactory, "get", return_value=tracker):
+            _, result = player_tracking._track(np.zeros((32, 32, 3), dtype=np.uint8), "cpu", 0.5)
+
+        assert result["track_ids"] == [3, 4]
+        assert [d["tracking_id"] for d in result["detections"]] == [3, 4]
+        assert [d["class_name"] for d in result["detections"]] == ["goalkeeper", "class_7"]
+        assert all(type(d["class_id"]) is int for d in result["detections"])  # noqa: E721
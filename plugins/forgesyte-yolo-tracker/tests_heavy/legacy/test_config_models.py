@@ -33,6 +33,19 @@ class TestLoadModelConfig:
         config = load_model_config()
         assert "device" in config
 
+    def test_merge_does_not_mutate_defaults(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """Verify YAML overrides never leak into DEFAULT_MODEL_CONFIG."""
+        from forgesyte_yolo_tracker.configs import DEFAULT_MODEL_CONFIG
+
+        config_path = tmp_path / "models.yaml"
+        config_path.write_text("confidence:\n  player: 0.9\n")
+
+        config = load_model_config(config_path)
+
+        assert config["confidence"]["player"] == 0.9
+        assert DEFAULT_MODEL_CONFIG["confidence"]["player"] == 0.25
+        assert load_model_config(tmp_path / "missing.yaml")["confidence"]["player"] == 0.25
+
 
 class TestModelPaths:
     """Tests for get_model_path function."""
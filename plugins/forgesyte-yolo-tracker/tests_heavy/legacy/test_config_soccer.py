@@ -1,74 +1,85 @@
 """Tests for soccer pitch configuration."""
 
+import numpy as np
+import pytest
+
+from forgesyte_yolo_tracker.configs.soccer import SoccerPitchConfiguration
+
+
+@pytest.fixture(scope="class")
+def pitch_config() -> SoccerPitchConfiguration:
+    """One configuration shared by the read-only tests of a class."""
+    return SoccerPitchConfiguration()
+
 
 class TestSoccerPitchConfiguration:
     """Tests for SoccerPitchConfiguration."""
 
-    def test_config_has_vertices(self) -> None:
+    def test_config_has_vertices(self, pitch_config: SoccerPitchConfiguration) -> None:
         """Verify config has vertices attribute."""
-        from forgesyte_yolo_tracker.configs.soccer import \
-            SoccerPitchConfiguration
+        assert hasattr(pitch_config, "vertices")
 
-        config = SoccerPitchConfiguration()
-        assert hasattr(config, "vertices")
-
-    def test_config_has_edges(self) -> None:
+    def test_config_has_edges(self, pitch_config: SoccerPitchConfiguration) -> None:
         """Verify config has edges attribute."""
-        from forgesyte_yolo_tracker.configs.soccer import \
-            SoccerPitchConfiguration
-
-        config = SoccerPitchConfiguration()
-        assert hasattr(config, "edges")
+        assert hasattr(pitch_config, "edges")
 
-    def test_config_has_dimensions(self) -> None:
+    def test_config_has_dimensions(self, pitch_config: SoccerPitchConfiguration) -> None:
         """Verify config has width and length."""
-        from forgesyte_yolo_tracker.configs.soccer import \
-            SoccerPitchConfiguration
-
-        config = SoccerPitchConfiguration()
-        assert hasattr(config, "width")
-        assert hasattr(config, "length")
-        assert config.width == 7000  # cm
-        assert config.length == 12000  # cm
+        assert hasattr(pitch_config, "width")
+        assert hasattr(pitch_config, "length")
+        assert pitch_config.width == 7000  # cm
+        assert pitch_config.length == 12000  # cm
 
-    def test_vertices_count(self) -> None:
+    def test_vertices_count(self, pitch_config: SoccerPitchConfiguration) -> None:
         """Verify we have expected number of keypoints."""
-        from forgesyte_yolo_tracker.configs.soccer import \
-            SoccerPitchConfiguration
+        assert len(pitch_config.vertices) >= 14  # Standard pitch has 14+ keypoints
 
-        config = SoccerPitchConfiguration()
-        assert len(config.vertices) >= 14  # Standard pitch has 14+ keypoints
-
-    def test_edges_form_complete_graph(self) -> None:
+    def test_edges_form_complete_graph(self, pitch_config: SoccerPitchConfiguration) -> None:
         """Verify edges connect vertices properly."""
-        from forgesyte_yolo_tracker.configs.soccer import \
-            SoccerPitchConfiguration
-
-        config = SoccerPitchConfiguration()
-        assert len(config.edges) > 0
-        # Each edge should be a tuple of two indices
-        for edge in config.edges:
+        assert len(pitch_config.edges) > 0
+        # Each edge should be a pair of vertex indices
+        for edge in pitch_config.edges:
             assert len(edge) == 2
-            assert isinstance(edge[0], int)
-            assert isinstance(edge[1], int)
+            assert isinstance(edge[0], (int, np.integer))
+            assert isinstance(edge[1], (int, np.integer))
+            assert 0 <= min(edge) and max(edge) < len(pitch_config.vertices)
+
+    def test_vertices_are_coordinate_pairs(self, pitch_config: SoccerPitchConfiguration) -> None:
+        """Verify vertices are (x, y) coordinate pairs."""
+        for vertex in pitch_config.vertices:
+            assert isinstance(vertex, (tuple, np.ndarray))
+            assert len(vertex) == 2
+            assert isinstance(vertex[0], (int, float, np.floating))
+            assert isinstance(vertex[1], (int, float, np.floating))
 
-    def test_vertices_are_tuples(self) -> None:
-        """Verify vertices are (x, y) coordinate tuples."""
-        from forgesyte_yolo_tracker.configs.soccer import \
-            SoccerPitchConfiguration
+    def test_vertices_are_a_float32_array(self, pitch_config: SoccerPitchConfiguration) -> None:
+        """Verify vertices are one shared, read-only (N, 2) float32 array."""
+        vertices = pitch_config.vertices
 
-        config = SoccerPitchConfiguration()
-        for vertex in config.vertices:
-            assert isinstance(vertex, tuple)
-            assert len(vertex) == 2
-            assert isinstance(vertex[0], (int, float))
-            assert isinstance(vertex[1], (int, float))
+        assert vertices.dtype == np.float32
+        assert vertices.shape == (len(pitch_config.keypoint_names), 2)
+        assert not vertices.flags.writeable
+        assert SoccerPitchConfiguration().vertices is vertices
 
-    def test_pitch_aspect_ratio(self) -> None:
+    def test_get_keypoint_by_name_returns_float_tuple(
+        self, pitch_config: SoccerPitchConfiguration
+    ) -> None:
+        """Verify named keypoints still come back as plain (x, y) floats."""
+        assert pitch_config.get_keypoint_by_name("top_right_corner") == (12000.0, 7000.0)
+
+    def test_pitch_aspect_ratio(self, pitch_config: SoccerPitchConfiguration) -> None:
         """Verify pitch has correct dimensions."""
-        from forgesyte_yolo_tracker.configs.soccer import \
-            SoccerPitchConfiguration
+        assert pitch_config.length == 12000
+        assert pitch_config.width == 7000
+
+    def test_world_to_radar_batch_matches_scalar(
+        self, pitch_config: SoccerPitchConfiguration
+    ) -> None:
+        """Verify the vectorized radar mapping agrees with world_to_radar."""
+        xs = np.array([0.0, 3000.5, 6000.0, 11999.9], dtype=np.float32)
+        ys = np.array([0.0, 1234.5, 3500.0, 6999.9], dtype=np.float32)
+
+        rxs, rys = pitch_config.world_to_radar_batch(xs, ys)
 
-        config = SoccerPitchConfiguration()
-        assert config.length == 12000
-        assert config.width == 7000
+        expected = [pitch_config.world_to_radar(float(x), float(y)) for x, y in zip(xs, ys)]
+        assert list(zip(rxs.tolist(), rys.tolist())) == expected
@@ -59,7 +59,7 @@ class TestBallAnnotator:
     def test_annotate_with_single_detection(self) -> None:
         """Test annotate with one detection."""
         annotator = BallAnnotator(radius=10)
-        frame = np.ones((480, 640, 3), dtype=np.uint8) * 100  # Non-zero background
+        frame = np.full((480, 640, 3), 100, dtype=np.uint8)  # Non-zero background
 
         # Create detection at (320, 240)
         detections = sv.Detections(
@@ -144,6 +144,17 @@ class TestDrawPointsOnPitchValidation:
         red_count = np.sum(center_area[:, :, 2] == 255)
         assert red_count > 0
 
+    def test_default_pitch_is_not_shared(self, soccer_pitch_config: SoccerPitchConfig) -> None:
+        """Verify drawing on the default pitch never leaks into later calls."""
+        blank = draw_pitch(soccer_pitch_config)
+
+        first = draw_points_on_pitch(soccer_pitch_config, np.array([[50.0, 30.0]]))
+        second = draw_points_on_pitch(soccer_pitch_config, np.empty((0, 2)))
+
+        assert not np.array_equal(first, blank)
+        assert np.array_equal(second, blank)
+        assert second.flags.writeable
+
 
 class TestDrawPathsOnPitchValidation:
     """Tests for draw_paths_on_pitch with real validation."""
@@ -174,6 +185,16 @@ class TestDrawPathsOnPitchValidation:
 
         assert np.any(result[:, :, 0] == 255)
 
+    def test_every_path_is_drawn(self, soccer_pitch_config: SoccerPitchConfig) -> None:
+        """Verify paths after the first are drawn too."""
+        pitch = np.zeros((200, 200, 3), dtype=np.uint8)
+        paths = [np.array([[10.0, 10.0], [20.0, 10.0]]), np.array([[10.0, 90.0], [20.0, 90.0]])]
+
+        result = draw_paths_on_pitch(soccer_pitch_config, paths, pitch=pitch, padding=0, scale=1.0)
+
+        assert result[10, 15, 0] == 255
+        assert result[90, 15, 0] == 255
+
     def test_path_with_existing_pitch(self, soccer_pitch_config: SoccerPitchConfig) -> None:
         """Verify paths can be drawn on existing pitch."""
         existing_pitch = np.ones((200, 200, 3), dtype=np.uint8) * 50
@@ -240,6 +261,29 @@ class TestDrawVoronoiDiagramValidation:
 
         assert result.shape == existing_pitch.shape
 
+    @pytest.mark.parametrize("use_numba", [True, False])
+    def test_voronoi_rejects_mismatched_pitch(
+        self, soccer_pitch_config: SoccerPitchConfig, use_numba: bool
+    ) -> None:
+        """Verify a pitch smaller than the config's size is rejected on both paths."""
+        from unittest.mock import patch
+
+        from forgesyte_yolo_tracker.utils import soccer_pitch
+
+        if use_numba and soccer_pitch._voronoi_fill is None:
+            pytest.skip("numba not installed")
+
+        small_pitch = np.zeros((20, 30, 3), dtype=np.uint8)
+        team_1 = np.array([[50.0, 30.0]])
+        team_2 = np.array([[60.0, 40.0]])
+
+        kernel = soccer_pitch._voronoi_fill if use_numba else None
+        with patch.object(soccer_pitch, "_voronoi_fill", kernel):
+            with pytest.raises(ValueError, match="pitch must have shape"):
+                draw_pitch_voronoi_diagram(
+                    soccer_pitch_config, team_1, team_2, pitch=small_pitch
+                )
+
     def test_voronoi_different_team_positions(self, soccer_pitch_config: SoccerPitchConfig) -> None:
         """Verify Voronoi changes with different team positions."""
         team_1_a = np.array([[30.0, 30.0]])
@@ -252,3 +296,21 @@ class TestDrawVoronoiDiagramValidation:
         result_b = draw_pitch_voronoi_diagram(soccer_pitch_config, team_1_b, team_2_b)
 
         assert not np.array_equal(result_a, result_b)
+
+    def test_voronoi_numba_matches_numpy(self, soccer_pitch_config: SoccerPitchConfig) -> None:
+        """Verify the numba kernel and the NumPy fallback colour pixels identically."""
+        from unittest.mock import patch
+
+        from forgesyte_yolo_tracker.utils import soccer_pitch
+
+        if soccer_pitch._voronoi_fill is None:
+            pytest.skip("numba not installed")
+
+        team_1 = np.array([[10.0, 20.0], [50.0, 30.0], [90.0, 60.0]])
+        team_2 = np.array([[30.0, 50.0], [75.0, 10.0]])
+
+        fused = draw_pitch_voronoi_diagram(soccer_pitch_config, team_1, team_2, scale=1.0)
+        with patch.object(soccer_pitch, "_voronoi_fill", None):
+            fallback = draw_pitch_voronoi_diagram(soccer_pitch_config, team_1, team_2, scale=1.0)
+
+        assert np.array_equal(fused, fallback)
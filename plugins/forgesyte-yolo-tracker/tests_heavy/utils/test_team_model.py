@@ -47,6 +47,20 @@ class TestTeamClassifier:
             assert classifier.device == "cuda"
             assert classifier.batch_size == 64
 
+    def test_initialization_quantizes_on_cpu_only(self) -> None:
+        """Test INT8 quantization is applied on CPU and skipped on GPU or opt-out."""
+        with (
+            patch("forgesyte_yolo_tracker.utils.team.SiglipVisionModel"),
+            patch("forgesyte_yolo_tracker.utils.team.AutoProcessor"),
+            patch("forgesyte_yolo_tracker.utils.team.quantize_for_cpu") as mock_quantize,
+        ):
+            classifier = TeamClassifier(device="cpu")
+            assert classifier.features_model is mock_quantize.return_value
+
+            TeamClassifier(device="cuda")
+            TeamClassifier(device="cpu", quantize=False)
+            mock_quantize.assert_called_once()
+
     @patch("forgesyte_yolo_tracker.utils.team.tqdm")
     @patch("forgesyte_yolo_tracker.utils.team.torch")
     def test_extract_features_basic(self, mock_torch: MagicMock, mock_tqdm: MagicMock) -> None:
@@ -54,7 +68,6 @@ class TestTeamClassifier:
         with (
             patch("forgesyte_yolo_tracker.utils.team.SiglipVisionModel"),
             patch("forgesyte_yolo_tracker.utils.team.AutoProcessor"),
-            patch("forgesyte_yolo_tracker.utils.team.sv.cv2_to_pillow"),
         ):
             classifier = TeamClassifier(device="cpu")
 
@@ -72,6 +85,57 @@ class TestTeamClassifier:
 
             assert isinstance(result, np.ndarray)
 
+    def test_pixel_values_batch_crops_like_processor(self) -> None:
+        """Test crops are resized, converted to RGB and normalized as one batch."""
+        with (
+            patch("forgesyte_yolo_tracker.utils.team.SiglipVisionModel"),
+            patch("forgesyte_yolo_tracker.utils.team.AutoProcessor"),
+        ):
+            classifier = TeamClassifier(device="cpu")
+
+        classifier._input_hw = (4, 6)
+        classifier._rescale_factor = 1 / 255
+        classifier._image_mean = [0.5, 0.5, 0.5]
+        classifier._image_std = [0.5, 0.5, 0.5]
+
+        blue = np.zeros((10, 3, 3), dtype=np.uint8)
+        blue[..., 0] = 255
+        crops = [blue, np.zeros((30, 20, 3), dtype=np.uint8)]
+
+        pixels = classifier._pixel_values(crops).numpy()
+
+        assert pixels.shape == (2, 3, 4, 6)
+        # BGR blue becomes RGB channel 2; 0 -> -1.0 and 255 -> 1.0
+        np.testing.assert_allclose(pixels[0, 2], 1.0)
+        np.testing.assert_allclose(pixels[0, :2], -1.0)
+        np.testing.assert_allclose(pixels[1], -1.0)
+
+        # Against the real SigLIP processor on a non-square, non-linear crop.
+        # PIL's and OpenCV's bicubic kernels differ slightly, so compare with
+        # a tolerance that a bilinear resize (mean error ~0.045) would fail.
+        from transformers import SiglipImageProcessor
+
+        processor = SiglipImageProcessor()
+        with (
+            patch("forgesyte_yolo_tracker.utils.team.SiglipVisionModel"),
+            patch("forgesyte_yolo_tracker.utils.team.AutoProcessor") as mock_auto_processor,
+        ):
+            mock_auto_processor.from_pretrained.return_value = processor
+            classifier = TeamClassifier(device="cpu")
+
+        yy, xx = np.mgrid[0:48, 0:32]
+        phase = xx[..., None] * np.array([0.7, 0.9, 1.3]) + yy[..., None] * 0.4
+        crop = (127.5 + 120 * np.sin(phase)).astype(np.uint8)
+
+        rgb = np.ascontiguousarray(crop[..., ::-1])
+        expected = processor(images=rgb, return_tensors="pt")["pixel_values"].numpy()
+        pixels = classifier._pixel_values([crop]).numpy()
+
+        assert pixels.shape == expected.shape == (1, 3, 224, 224)
+        error = np.abs(pixels - expected)
+        assert error.mean() < 0.035
+        assert error.max() < 0.1
+
     def test_fit_requires_crops(self) -> None:
         """Test fit method requires crop images."""
         with (
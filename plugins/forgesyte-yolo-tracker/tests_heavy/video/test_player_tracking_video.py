@@ -0,0 +1,40 @@
+"""Tests for the labels drawn by player_tracking_video."""
+
+from contextlib import nullcontext
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import supervision as sv
+
+# The modules under test import ultralytics at load time
+pytest.importorskip("ultralytics")
+
+
+class TestPlayerTrackingLabels:
+    """Tests for tracker-ID labels on tracked frames."""
+
+    def test_labels_use_tracker_ids(self) -> None:
+        """Verify labels combine tracker IDs and class names."""
+        from forgesyte_yolo_tracker.video import player_tracking_video as module
+
+        tracked = sv.Detections(
+            xyxy=np.array([[10, 10, 50, 80], [60, 10, 90, 80]], dtype=np.float32),
+            class_id=np.array([0, 2]),
+            tracker_id=np.array([7, 12]),
+        )
+        tracker = MagicMock()
+        tracker.update_with_detections.return_value = tracked
+        model = MagicMock(side_effect=lambda batch, **kwargs: [MagicMock()] * len(batch))
+        frame = np.zeros((120, 160, 3), dtype=np.uint8)
+
+        with (
+            patch.object(module, "checkout_model", return_value=nullcontext(model)),
+            patch.object(module.ByteTrackFactory, "get", return_value=tracker),
+            patch.object(module, "get_video_frames", return_value=iter([frame])),
+            patch.object(module.sv.Detections, "from_ultralytics", return_value=tracked),
+            patch.object(module.sv.LabelAnnotator, "annotate") as mock_annotate,
+        ):
+            list(module.run_player_tracking_video_frames("in.mp4"))
+
+        assert mock_annotate.call_args.kwargs["labels"] == ["#7 player", "#12 referee"]
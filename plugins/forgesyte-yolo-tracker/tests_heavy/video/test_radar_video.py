@@ -0,0 +1,138 @@
+"""Tests for the radar overlay drawn by radar_video."""
+
+from contextlib import nullcontext
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import supervision as sv
+
+# The modules under test import ultralytics at load time
+pytest.importorskip("ultralytics")
+
+EMPTY = sv.Detections.empty()
+
+
+class TestRadarOverlay:
+    """Tests for drawing the radar into the output frame."""
+
+    def test_radar_drawn_in_place(self) -> None:
+        """Verify frames are annotated without a copy and match a standalone radar."""
+        from forgesyte_yolo_tracker.video import radar_video as module
+
+        frame = np.full((400, 700, 3), 7, dtype=np.uint8)
+        model = MagicMock(
+            side_effect=lambda batch, **kwargs: [MagicMock(keypoints=None)] * len(batch)
+        )
+        with (
+            patch.object(module, "checkout_player_model", return_value=nullcontext(model)),
+            patch.object(module, "checkout_pitch_model", return_value=nullcontext(model)),
+            patch.object(module, "get_video_frames", return_value=iter([frame])),
+            patch.object(module.sv.Detections, "from_ultralytics", return_value=EMPTY),
+        ):
+            (annotated,) = list(module.run_radar_video_frames("in.mp4"))
+
+        radar_w, radar_h = module.CONFIG.radar_resolution
+        expected = module._create_radar_image([], (radar_w, radar_h))
+
+        assert annotated is frame
+        assert np.array_equal(annotated[-radar_h - 10 : -10, -radar_w - 10 : -10], expected)
+
+    def test_cached_background_matches_drawn_radar(self) -> None:
+        """Verify the cached background gives the same radar as drawing it each frame."""
+        import cv2
+
+        from forgesyte_yolo_tracker.video import radar_video as module
+
+        points = [{"xy": [100, 50], "type": "goalkeeper"}, {"xy": [300, 150], "team_id": 0}]
+        expected = np.zeros((300, 600, 3), dtype=np.uint8)
+        cv2.rectangle(expected, (0, 0), (600, 300), (50, 50, 50), 2)
+        cv2.line(expected, (300, 0), (300, 300), (100, 100, 100), 1)
+        cv2.circle(expected, (300, 150), 20, (100, 100, 100), 1)
+        cv2.circle(expected, (100, 50), 8, module.GK_COLOR, -1)
+        cv2.circle(expected, (300, 150), 8, module.TEAM_A_COLOR, -1)
+
+        first = module._create_radar_image(points, (600, 300))
+        second = module._create_radar_image(points, (600, 300))
+
+        assert np.array_equal(first, expected)
+        assert np.array_equal(second, expected)
+        assert not module._radar_background(600, 300).flags.writeable
+
+    def test_homography_uses_first_four_confident_keypoints(self) -> None:
+        """Verify low-confidence keypoints are skipped when pairing with pitch vertices."""
+        from forgesyte_yolo_tracker.video import radar_video as module
+
+        xy = np.arange(12, dtype=np.float32).reshape(1, 6, 2)
+        conf = np.array([[0.9, 0.01, 0.9, 0.9, 0.9, 0.9]], dtype=np.float32)
+        pitch_result = MagicMock()
+        pitch_result.keypoints.data.cpu.return_value.numpy.return_value = np.concatenate(
+            [xy, conf[..., None]], axis=-1
+        )
+        player_model = MagicMock(side_effect=lambda batch, **kwargs: [MagicMock()] * len(batch))
+        pitch_model = MagicMock(side_effect=lambda batch, **kwargs: [pitch_result] * len(batch))
+        frame = np.zeros((400, 700, 3), dtype=np.uint8)
+
+        with (
+            patch.object(module, "checkout_player_model", return_value=nullcontext(player_model)),
+            patch.object(module, "checkout_pitch_model", return_value=nullcontext(pitch_model)),
+            patch.object(module, "get_video_frames", return_value=iter([frame])),
+            patch.object(module.sv.Detections, "from_ultralytics", return_value=EMPTY),
+            patch.object(module, "ViewTransformer") as mock_transformer,
+        ):
+            list(module.run_radar_video_frames("in.mp4"))
+
+        src_pts, tgt_pts = mock_transformer.call_args.args
+        np.testing.assert_array_equal(src_pts, xy[0, [0, 2, 3, 4]])
+        np.testing.assert_array_equal(tgt_pts, np.asarray(module.CONFIG.vertices)[[0, 2, 3, 4]])
+
+    def test_keypoints_without_confidence_are_all_used(self) -> None:
+        """Verify keypoints without a confidence column count as confident."""
+        from forgesyte_yolo_tracker.video import radar_video as module
+
+        xy = np.arange(12, dtype=np.float32).reshape(1, 6, 2)
+        pitch_result = MagicMock()
+        pitch_result.keypoints.data.cpu.return_value.numpy.return_value = xy
+
+        with patch.object(module, "ViewTransformer") as mock_transformer:
+            module._pitch_transformer(pitch_result, confidence=0.5)
+
+        src_pts, _ = mock_transformer.call_args.args
+        np.testing.assert_array_equal(src_pts, xy[0, :4])
+
+    def test_no_pitch_detected(self) -> None:
+        """Verify a result without keypoint instances gives no homography."""
+        from forgesyte_yolo_tracker.video import radar_video as module
+
+        pitch_result = MagicMock()
+        pitch_result.keypoints.data.cpu.return_value.numpy.return_value = np.zeros((0, 6, 3))
+
+        assert module._pitch_transformer(pitch_result, confidence=0.5) is None
+
+
+class TestRadarPitchInterval:
+    """Tests for running the pitch model on a subset of frames."""
+
+    def test_pitch_model_runs_every_interval(self) -> None:
+        """Verify only every pitch_interval-th frame reaches the pitch model."""
+        from forgesyte_yolo_tracker.video import radar_video as module
+
+        frames = [np.full((400, 700, 3), i, dtype=np.uint8) for i in range(7)]
+        player_model = MagicMock(side_effect=lambda batch, **kwargs: [MagicMock()] * len(batch))
+        pitch_model = MagicMock(
+            side_effect=lambda batch, **kwargs: [MagicMock(keypoints=None)] * len(batch)
+        )
+
+        with (
+            patch.object(module, "checkout_player_model", return_value=nullcontext(player_model)),
+            patch.object(module, "checkout_pitch_model", return_value=nullcontext(pitch_model)),
+            patch.object(module, "get_video_frames", return_value=iter(frames)),
+            patch.object(module.sv.Detections, "from_ultralytics", return_value=EMPTY),
+        ):
+            out = list(module.run_radar_video_frames("in.mp4", batch_size=2, pitch_interval=3))
+
+        pitch_frames = [
+            int(frame[0, 0, 0]) for call in pitch_model.call_args_list for frame in call.args[0]
+        ]
+        assert len(out) == 7
+        assert pitch_frames == [0, 3, 6]
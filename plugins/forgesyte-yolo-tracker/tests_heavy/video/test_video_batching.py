@@ -0,0 +1,69 @@
+"""Tests for batched inference in the player and radar video modules."""
+
+from contextlib import nullcontext
+from typing import Any, List
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+import supervision as sv
+
+# The modules under test import ultralytics at load time
+pytest.importorskip("ultralytics")
+
+EMPTY = sv.Detections.empty()
+
+
+def _fake_model() -> MagicMock:
+    """Model stub returning one keypoint-less result per input frame."""
+
+    def infer(batch: List[np.ndarray], **kwargs: Any) -> List[MagicMock]:
+        return [MagicMock(keypoints=None) for _ in batch]
+
+    return MagicMock(side_effect=infer)
+
+
+def _frames(count: int) -> List[np.ndarray]:
+    return [np.full((400, 700, 3), i, dtype=np.uint8) for i in range(count)]
+
+
+class TestPlayerDetectionVideoBatching:
+    """Tests for run_player_detection_video_frames batching."""
+
+    def test_one_model_call_per_batch(self) -> None:
+        """Verify frames are inferred batch_size at a time and yielded in order."""
+        from forgesyte_yolo_tracker.video import player_detection_video as module
+
+        model = _fake_model()
+        with (
+            patch.object(module, "checkout_model", return_value=nullcontext(model)),
+            patch.object(module, "get_video_frames", return_value=iter(_frames(5))),
+            patch.object(module.sv.Detections, "from_ultralytics", return_value=EMPTY),
+        ):
+            out = list(module.run_player_detection_video_frames("in.mp4", batch_size=2))
+
+        assert [len(call.args[0]) for call in model.call_args_list] == [2, 2, 1]
+        assert [int(frame[0, 0, 0]) for frame in out] == [0, 1, 2, 3, 4]
+
+
+class TestRadarVideoBatching:
+    """Tests for run_radar_video_frames batching."""
+
+    def test_both_models_share_each_batch(self) -> None:
+        """Verify player and pitch models each run once per batch on the same frames."""
+        from forgesyte_yolo_tracker.video import radar_video as module
+
+        player_model = _fake_model()
+        pitch_model = _fake_model()
+        with (
+            patch.object(module, "checkout_player_model", return_value=nullcontext(player_model)),
+            patch.object(module, "checkout_pitch_model", return_value=nullcontext(pitch_model)),
+            patch.object(module, "get_video_frames", return_value=iter(_frames(3))),
+            patch.object(module.sv.Detections, "from_ultralytics", return_value=EMPTY),
+        ):
+            out = list(module.run_radar_video_frames("in.mp4", batch_size=2))
+
+        assert len(out) == 3
+        assert player_model.call_count == pitch_model.call_count == 2
+        for player_call, pitch_call in zip(player_model.call_args_list, pitch_model.call_args_list):
+            assert player_call.args[0] is pitch_call.args[0]
@@ -0,0 +1,40 @@
+"""Tests for the video modules' frame reader."""
+
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+# The modules under test import ultralytics at load time
+pytest.importorskip("ultralytics")
+
+
+def _write_video(path: Path, frames: int) -> None:
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10, (32, 24))
+    for i in range(frames):
+        writer.write(np.full((24, 32, 3), i * 20, dtype=np.uint8))
+    writer.release()
+
+
+class TestGetVideoFrames:
+    """Tests for get_video_frames."""
+
+    def test_yields_every_frame(self, tmp_path: Path) -> None:
+        """Verify all frames are decoded as BGR arrays of the video size."""
+        from forgesyte_yolo_tracker.video._capture import get_video_frames
+
+        path = tmp_path / "clip.avi"
+        _write_video(path, 4)
+
+        frames = list(get_video_frames(str(path)))
+
+        assert len(frames) == 4
+        assert all(frame.shape == (24, 32, 3) for frame in frames)
+
+    def test_missing_video_raises(self, tmp_path: Path) -> None:
+        """Verify an unreadable path raises instead of yielding nothing."""
+        from forgesyte_yolo_tracker.video._capture import get_video_frames
+
+        with pytest.raises(ValueError):
+            next(get_video_frames(str(tmp_path / "missing.mp4")))
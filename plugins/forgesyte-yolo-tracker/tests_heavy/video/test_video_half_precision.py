@@ -0,0 +1,37 @@
+"""Tests for FP16 inference in the batched video modules."""
+
+from contextlib import nullcontext
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+# The modules under test import ultralytics at load time
+pytest.importorskip("ultralytics")
+
+
+@pytest.mark.parametrize(
+    "module_name",
+    [
+        "ball_detection_video",
+        "pitch_detection_video",
+        "player_detection_video",
+        "player_tracking_video",
+    ],
+)
+@pytest.mark.parametrize("device,half", [("cpu", False), ("cuda", True)])
+def test_model_called_in_half_precision_on_cuda(module_name: str, device: str, half: bool) -> None:
+    """Verify FP16 is requested on CUDA and FP32 is kept on CPU."""
+    import importlib
+
+    module = importlib.import_module(f"forgesyte_yolo_tracker.video.{module_name}")
+    model = MagicMock(return_value=[])
+    frames = [np.zeros((8, 8, 3), dtype=np.uint8)]
+
+    with (
+        patch.object(module, "checkout_model", return_value=nullcontext(model)),
+        patch.object(module, "get_video_frames", return_value=iter(frames)),
+    ):
+        list(getattr(module, f"run_{module_name}_frames")("in.mp4", device=device))
+
+    assert model.call_args.kwargs["half"] is half
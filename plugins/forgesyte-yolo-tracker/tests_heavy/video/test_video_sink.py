@@ -0,0 +1,61 @@
+"""Tests for the video modules' hardware-preferring frame writer."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+import pytest
+import supervision as sv
+
+# The modules under test import ultralytics at load time
+pytest.importorskip("ultralytics")
+
+VIDEO_INFO = sv.VideoInfo(width=32, height=24, fps=10)
+
+
+class TestHWVideoSink:
+    """Tests for HWVideoSink."""
+
+    def test_writes_readable_video(self, tmp_path: Path) -> None:
+        """Verify frames written through the sink can be read back."""
+        from forgesyte_yolo_tracker.video._sink import HWVideoSink
+
+        path = tmp_path / "out.mp4"
+        with HWVideoSink(str(path), VIDEO_INFO) as sink:
+            for _ in range(3):
+                sink.write_frame(np.zeros((24, 32, 3), dtype=np.uint8))
+
+        capture = cv2.VideoCapture(str(path))
+        assert capture.isOpened()
+        assert capture.read()[0]
+        capture.release()
+
+    def test_falls_back_to_software_writer(self, tmp_path: Path) -> None:
+        """Verify a failed hardware writer is released and replaced by mp4v."""
+        from forgesyte_yolo_tracker.video import _sink
+
+        hw_writer = MagicMock()
+        hw_writer.isOpened.return_value = False
+        sw_writer = MagicMock()
+        sw_writer.isOpened.return_value = True
+        with patch.object(
+            _sink.cv2, "VideoWriter", side_effect=[hw_writer, sw_writer]
+        ) as mock_writer:
+            with _sink.HWVideoSink(str(tmp_path / "out.mp4"), VIDEO_INFO) as sink:
+                sink.write_frame(np.zeros((24, 32, 3), dtype=np.uint8))
+
+        hw_args = mock_writer.call_args_list[0].args
+        assert hw_args[-1] == [cv2.VIDEOWRITER_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+        hw_writer.release.assert_called_once()
+        sw_writer.write.assert_called_once()
+        sw_writer.release.assert_called_once()
+
+    def test_write_outside_context_raises(self, tmp_path: Path) -> None:
+        """Verify frames are never silently dropped before the writer opens."""
+        from forgesyte_yolo_tracker.video._sink import HWVideoSink
+
+        sink = HWVideoSink(str(tmp_path / "out.mp4"), VIDEO_INFO)
+
+        with pytest.raises(RuntimeError):
+            sink.write_frame(np.zeros((24, 32, 3), dtype=np.uint8))